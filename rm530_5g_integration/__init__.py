@@ -9,6 +9,7 @@ __author__ = "Anand"
 __email__ = "anand@example.com"
 __description__ = "Integration tools and scripts for Quectel RM530 5G modem with Raspberry Pi"
 
+from rm530_5g_integration.core.async_modem import AsyncModem
 from rm530_5g_integration.core.health import HealthMonitor, HealthStatus
 
 # Import main classes for easy access
@@ -24,6 +25,7 @@ __all__ = [
     "__description__",
     "RM530Manager",
     "Modem",
+    "AsyncModem",
     "NetworkManager",
     "HealthMonitor",
     "HealthStatus",
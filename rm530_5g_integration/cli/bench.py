@@ -0,0 +1,196 @@
+"""Throughput benchmark command."""
+
+import argparse
+import json
+import sys
+from typing import List, Optional, Tuple
+
+try:
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.monitoring.bench import (
+    DEFAULT_BENCH_PORT,
+    DEFAULT_DURATION,
+    DEFAULT_STREAMS,
+    DIRECTIONS,
+    BenchClient,
+    BenchResult,
+    BenchServer,
+    record_bench,
+)
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.store import MetricStore
+from rm530_5g_integration.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+console = Console() if RICH_AVAILABLE else None
+
+RATE_UNITS = {"k": 1e3, "m": 1e6, "g": 1e9}
+
+
+def parse_rate(text: str) -> float:
+    """Parse a bit rate such as "20M" or "500k" into bits per second."""
+    scale = RATE_UNITS.get(text[-1:].lower())
+    try:
+        return float(text[:-1]) * scale if scale else float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {text}")
+
+
+def _signal_snapshot() -> Optional[SignalQuality]:
+    """Read signal quality to store with the results (None without a modem)."""
+    try:
+        return RM530Manager().signal_quality()
+    except Exception as e:
+        logger.debug(f"No signal snapshot: {e}")
+        return None
+
+
+def print_result(result: BenchResult) -> None:
+    """Print one run with its streams and time series."""
+    series = " ".join(f"{value / 1e6:.1f}" for value in result.series)
+    if RICH_AVAILABLE and console is not None:
+        table = Table(title=str(result), box=box.ROUNDED)
+        table.add_column("Stream", style="cyan")
+        table.add_column("Goodput", style="green")
+        table.add_column("Retransmits")
+        table.add_column("Loss")
+        table.add_column("Jitter")
+        for stream in result.streams:
+            table.add_row(
+                str(stream.stream),
+                f"{stream.goodput / 1e6:.2f} Mbit/s",
+                "-" if stream.retransmits is None else str(stream.retransmits),
+                "-" if stream.loss is None else f"{stream.loss * 100:.2f}%",
+                "-" if stream.jitter is None else f"{stream.jitter:.2f} ms",
+            )
+        console.print(table)
+        console.print(f"[dim]Mbit/s per {result.interval:g} s:[/dim] {series}\n")
+    else:
+        print(result)
+        for stream in result.streams:
+            print(f"  stream {stream.stream}: {stream.goodput / 1e6:.2f} Mbit/s")
+        print(f"  Mbit/s per {result.interval:g} s: {series}\n")
+
+
+def main():
+    """CLI entry point for the benchmark command."""
+    parser = argparse.ArgumentParser(description="Measure RM530 uplink and downlink throughput")
+    parser.add_argument("host", nargs="?", help="Benchmark server to test against")
+    parser.add_argument(
+        "--server", action="store_true", help="Run the benchmark server instead of a test"
+    )
+    parser.add_argument(
+        "--bind",
+        default="127.0.0.1",
+        help="Server listen address (default: 127.0.0.1; the server has no authentication)",
+    )
+    parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=DEFAULT_BENCH_PORT,
+        help=f"Server port (default: {DEFAULT_BENCH_PORT})",
+    )
+    parser.add_argument(
+        "--interface", "-i", default="usb0", help="Network interface to test (default: usb0)"
+    )
+    parser.add_argument("--udp", action="store_true", help="Test with UDP instead of TCP")
+    parser.add_argument(
+        "--direction",
+        choices=DIRECTIONS + ("both",),
+        default="both",
+        help="Direction to test (default: both)",
+    )
+    parser.add_argument(
+        "--streams",
+        "-P",
+        type=int,
+        default=DEFAULT_STREAMS,
+        help=f"Parallel streams (default: {DEFAULT_STREAMS})",
+    )
+    parser.add_argument(
+        "--duration",
+        "-t",
+        type=float,
+        default=DEFAULT_DURATION,
+        help=f"Seconds per direction (default: {DEFAULT_DURATION:g})",
+    )
+    parser.add_argument(
+        "--rate", type=parse_rate, default="10M", help="UDP rate in bit/s (default: 10M)"
+    )
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--record", action="store_true", help="Store results with a signal snapshot per direction"
+    )
+    parser.add_argument("--store", help="Metric store directory (default: ~/.rm530/metrics)")
+
+    args = parser.parse_args()
+
+    if args.server:
+        try:
+            server = BenchServer(args.bind, args.port)
+        except OSError as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        print(f"Benchmark server listening on {args.bind}:{server.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if not args.host:
+        parser.error("a server host is required (or --server)")
+
+    client = BenchClient(
+        args.host,
+        port=args.port,
+        interface=args.interface,
+        streams=args.streams,
+        duration=args.duration,
+        udp_rate=args.rate,
+    )
+    directions = DIRECTIONS if args.direction == "both" else (args.direction,)
+    protocol = "udp" if args.udp else "tcp"
+
+    # Each direction keeps the signal read just before it ran
+    results: List[Tuple[BenchResult, Optional[SignalQuality]]] = []
+    try:
+        for direction in directions:
+            signal = _signal_snapshot()
+            if not args.json:
+                print(f"Testing {protocol.upper()} {direction} for {args.duration:g} s...")
+            results.append((client.run(protocol, direction), signal))
+            if not args.json:
+                print_result(results[-1][0])
+                if signal is not None:
+                    print(f"Signal before test: {signal}\n")
+    except OSError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    if args.record:
+        with MetricStore(args.store) as store:
+            for result, signal in results:
+                record_bench(store, result, signal)
+
+    if args.json:
+        output = {
+            "results": [
+                {**result.as_dict(), "signal": signal.to_dict() if signal is not None else None}
+                for result, signal in results
+            ]
+        }
+        print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""AT broker daemon command."""
+
+import argparse
+import signal
+import sys
+import threading
+
+from rm530_5g_integration.config import ConfigLoader
+from rm530_5g_integration.core.broker import DEFAULT_BROKER_SOCKET, ATBroker
+from rm530_5g_integration.core.modem import Modem, watch_hotplug
+from rm530_5g_integration.utils.exceptions import RM530Error
+from rm530_5g_integration.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def main():
+    """CLI entry point for the AT broker daemon."""
+    parser = argparse.ArgumentParser(
+        description="Share the RM530 AT port between processes over a UNIX socket"
+    )
+    parser.add_argument("--port", "-p", help="Modem AT port (default: auto-detect)")
+    parser.add_argument("--baudrate", type=int, help="Serial baudrate (default: from config)")
+    parser.add_argument(
+        "--socket",
+        "-s",
+        help=f"UNIX socket path (default: from config, {DEFAULT_BROKER_SOCKET})",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel("DEBUG")
+
+    settings = ConfigLoader().get_modem_settings()
+    socket_path = args.socket or settings.get("broker_socket", DEFAULT_BROKER_SOCKET)
+    modem = Modem(port=args.port, baudrate=args.baudrate or settings["at_baudrate"])
+    broker = ATBroker(modem, socket_path=socket_path)
+
+    def signal_handler(sig, frame):
+        """Stop serving on SIGINT/SIGTERM."""
+        # shutdown() blocks until serve_forever() returns, so call it off the main thread
+        threading.Thread(target=broker.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    try:
+        print(f"AT broker listening on {socket_path}")
+        print("Press Ctrl+C to stop")
+        watch_hotplug()
+        broker.serve_forever()
+    except (RM530Error, OSError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
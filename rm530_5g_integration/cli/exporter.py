@@ -0,0 +1,106 @@
+"""Prometheus exporter command."""
+
+import argparse
+import signal
+import sys
+import threading
+
+from rm530_5g_integration.core.health import HealthMonitor
+from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.core.modem import watch_hotplug
+from rm530_5g_integration.monitoring.exporter import (
+    DEFAULT_EXPORTER_PORT,
+    DEFAULT_HEALTH_INTERVAL,
+    DEFAULT_REFRESH_INTERVAL,
+    MetricsExporter,
+)
+from rm530_5g_integration.utils.exceptions import RM530Error
+from rm530_5g_integration.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def main():
+    """CLI entry point for the metrics exporter."""
+    parser = argparse.ArgumentParser(description="Serve RM530 metrics for Prometheus")
+    parser.add_argument(
+        "--interface", "-i", default="usb0", help="Network interface name (default: usb0)"
+    )
+    parser.add_argument(
+        "--host", default="0.0.0.0", help="Address to listen on (default: all addresses)"
+    )
+    parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=DEFAULT_EXPORTER_PORT,
+        help=f"Port to listen on (default: {DEFAULT_EXPORTER_PORT})",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_REFRESH_INTERVAL,
+        help=f"Seconds between metric refreshes (default: {DEFAULT_REFRESH_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--health-interval",
+        type=float,
+        default=DEFAULT_HEALTH_INTERVAL,
+        help=f"Seconds between health checks (default: {DEFAULT_HEALTH_INTERVAL:g})",
+    )
+    parser.add_argument("--no-health", action="store_true", help="Do not run health checks")
+    parser.add_argument(
+        "--latency",
+        action="store_true",
+        help="Probe latency, jitter and loss continuously (reported with health checks)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel("DEBUG")
+
+    stopped = threading.Event()
+
+    def signal_handler(sig, frame):
+        """Stop on SIGINT/SIGTERM."""
+        stopped.set()
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    try:
+        watch_hotplug()
+        manager = RM530Manager()
+        monitor = None
+        if not args.no_health:
+            monitor = HealthMonitor(
+                manager, interface=args.interface, latency_window=args.health_interval
+            )
+            if args.latency:
+                prober = manager.latency_prober(args.interface)
+                monitor.attach_latency(prober)
+                prober.start()
+        exporter = MetricsExporter(
+            manager,
+            interface=args.interface,
+            host=args.host,
+            port=args.port,
+            interval=args.interval,
+            monitor=monitor,
+            health_interval=args.health_interval,
+        )
+        exporter.start()
+    except (RM530Error, OSError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    print(f"Serving metrics on http://{args.host}:{exporter.port}/metrics")
+    print("Press Ctrl+C to stop")
+    stopped.wait()
+    exporter.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,8 @@ import argparse
 import signal
 import sys
 import time
-from typing import Union
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple, Union
 
 try:
     from rich import box
@@ -18,15 +19,42 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+from rm530_5g_integration.cli.trends import collect_trends, dbm, percent, print_trends
 from rm530_5g_integration.core.health import HealthMonitor, HealthStatus
 from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.core.modem import watch_hotplug
+from rm530_5g_integration.monitoring.store import HEALTH_SERIES, MetricStore
 from rm530_5g_integration.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 console = Console() if RICH_AVAILABLE else None
 
+# Seconds of latency probes taken before a --once check
+ONCE_LATENCY_SECONDS = 10
 
-def create_status_table(status: HealthStatus) -> Union[Table, None]:  # type: ignore[return-value]
+TREND_METRICS = (
+    (HEALTH_SERIES, "healthy", "Availability", percent),
+    (HEALTH_SERIES, "rssi", "RSSI (median)", dbm),
+    (HEALTH_SERIES, "consecutive_failures", "Consecutive Failures", lambda v: f"{v:.0f}"),
+)
+
+
+def latency_rows(latency: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Format HealthStatus.latency as (property, value) rows."""
+    if not latency.get("received"):
+        return [("Latency", f"no replies from {latency['target']} ({latency['sent']} probes)")]
+    return [
+        (
+            "Latency (p50/p95/p99)",
+            f"{latency['rtt_p50']:.1f} / {latency['rtt_p95']:.1f} / {latency['rtt_p99']:.1f} ms",
+        ),
+        ("Jitter", f"{latency['jitter'] or 0.0:.1f} ms"),
+        ("Packet Loss", f"{latency['loss'] * 100:.1f}% of {latency['sent']}"),
+        ("Reordered", str(latency["reordered"])),
+    ]
+
+
+def create_status_table(status: HealthStatus) -> Union["Table", None]:  # type: ignore[return-value]
     """Create a table showing health status."""
     if not RICH_AVAILABLE:
         return None  # type: ignore[return-value]
@@ -57,13 +85,28 @@ def create_status_table(status: HealthStatus) -> Union[Table, None]:  # type: ig
                     table.add_row("Bytes Sent", f"{bytes_val:.2f} {unit}")
                     break
                 bytes_val /= 1024.0
+        if stats.get("rx_rate") is not None:
+            table.add_row(
+                "Throughput",
+                f"↓ {stats['rx_rate'] * 8 / 1e6:.2f} / ↑ {stats['tx_rate'] * 8 / 1e6:.2f} Mbit/s",
+            )
+        if stats.get("uptime") is not None:
+            table.add_row("Uptime", str(timedelta(seconds=int(stats["uptime"]))))
 
     if status.signal_quality:
         sig = status.signal_quality
         if sig.get("network_type"):
             table.add_row("Network Type", sig["network_type"])
         if sig.get("rssi") is not None:
-            table.add_row("RSSI", f"{sig['rssi']} dBm")
+            table.add_row("RSSI (median)", f"{sig['rssi']:.0f} dBm")
+        if sig.get("rssi_p5") is not None:
+            table.add_row("RSSI (p5)", f"{sig['rssi_p5']:.0f} dBm")
+        if sig.get("rssi_slope") is not None:
+            table.add_row("RSSI Trend", f"{sig['rssi_slope'] * 60:+.1f} dB/min")
+
+    if status.latency:
+        for name, value in latency_rows(status.latency):
+            table.add_row(name, value)
 
     if status.issues:
         issues_text = "\n".join(f"• {issue}" for issue in status.issues)
@@ -72,6 +115,14 @@ def create_status_table(status: HealthStatus) -> Union[Table, None]:  # type: ig
     return table
 
 
+def _watch_modem_events(manager: RM530Manager, monitor: HealthMonitor) -> None:
+    """Let modem URCs trigger immediate health checks when the modem is reachable."""
+    try:
+        monitor.watch_urcs(manager.events())
+    except Exception as e:
+        logger.debug(f"Modem events unavailable, relying on interval checks: {e}")
+
+
 def main():
     """CLI entry point for health monitoring."""
     parser = argparse.ArgumentParser(description="Monitor RM530 5G connection health")
@@ -79,7 +130,10 @@ def main():
         "--interface", "-i", default="usb0", help="Network interface name (default: usb0)"
     )
     parser.add_argument(
-        "--interval", type=int, default=60, help="Health check interval in seconds (default: 60)"
+        "--interval",
+        type=int,
+        default=60,
+        help="Longest interval between checks, and how often results are recorded (default: 60)",
     )
     parser.add_argument(
         "--threshold", type=int, default=3, help="Failure threshold before alerting (default: 3)"
@@ -88,20 +142,59 @@ def main():
     parser.add_argument(
         "--live", action="store_true", help="Show live updating dashboard (requires rich)"
     )
+    parser.add_argument(
+        "--record", action="store_true", help="Record check results and counters for trends"
+    )
+    parser.add_argument(
+        "--trends", action="store_true", help="Show 24 h and 7 d trends from recorded history"
+    )
+    parser.add_argument("--store", help="Metric store directory (default: ~/.rm530/metrics)")
+    parser.add_argument(
+        "--latency",
+        action="store_true",
+        help="Probe latency, jitter and loss continuously over the interface",
+    )
+    parser.add_argument("--latency-target", help="Latency probe target (default: 8.8.8.8)")
+    parser.add_argument(
+        "--latency-rate", type=float, default=5.0, help="Latency probes per second (default: 5)"
+    )
+    parser.add_argument(
+        "--max-loss",
+        type=float,
+        default=5.0,
+        help="Probe loss in percent above which the link is unhealthy (default: 5)",
+    )
 
     args = parser.parse_args()
 
+    if args.trends:
+        print_trends("Connection Health Trends", collect_trends(TREND_METRICS, args.store), console)
+        return
+
     try:
+        if not args.once:
+            watch_hotplug()
         manager = RM530Manager()
         monitor = HealthMonitor(
             manager=manager,
             interface=args.interface,
             check_interval=args.interval,
             failure_threshold=args.threshold,
+            store=MetricStore(args.store) if args.record else None,
+            max_loss=args.max_loss / 100,
+            latency_window=ONCE_LATENCY_SECONDS if args.once else max(args.interval, 10),
         )
+        if args.latency:
+            prober = manager.latency_prober(
+                args.interface, args.latency_target, rate_hz=args.latency_rate
+            )
+            monitor.attach_latency(prober)
+            prober.start()
 
         if args.once:
             # Single check
+            if args.latency:
+                time.sleep(ONCE_LATENCY_SECONDS)
             status = monitor.check_health()
 
             if RICH_AVAILABLE and console is not None:
@@ -117,6 +210,9 @@ def main():
                 print(f"Status: {'✓ Healthy' if status.is_healthy else '✗ Unhealthy'}")
                 print(f"Last Check: {status.last_check}")
                 print(f"Consecutive Failures: {status.consecutive_failures}")
+                if status.latency:
+                    for name, value in latency_rows(status.latency):
+                        print(f"{name}: {value}")
                 if status.issues:
                     print(f"Issues: {', '.join(status.issues)}")
                 print()
@@ -133,6 +229,7 @@ def main():
                     )
 
             monitor.add_callback(on_status_change)
+            _watch_modem_events(manager, monitor)
             monitor.start()
 
             def signal_handler(sig, frame):
@@ -213,6 +310,7 @@ def main():
                         print("=" * 60)
 
             monitor.add_callback(on_status_change)
+            _watch_modem_events(manager, monitor)
             monitor.start()
 
             def signal_handler(sig, frame):
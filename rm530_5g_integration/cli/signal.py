@@ -64,6 +64,8 @@ def main():
                 "rsrq": signal.rsrq,
                 "sinr": signal.sinr,
                 "network_type": signal.network_type,
+                "lte": signal.lte.to_dict() if signal.lte else None,
+                "nr": signal.nr.to_dict() if signal.nr else None,
             }
             print(json.dumps(output, indent=2))
         else:
@@ -91,6 +93,9 @@ def main():
                 if signal.sinr is not None:
                     table.add_row("SINR", f"{signal.sinr} dB", "")
 
+                for cell in signal.cells:
+                    table.add_row("Serving Cell", str(cell), "")
+
                 if not any([signal.rssi, signal.rsrp, signal.rsrq, signal.sinr]):
                     table.add_row("Status", "[dim]No signal data available[/dim]", "")
 
@@ -119,6 +124,9 @@ def main():
                 if signal.sinr is not None:
                     print(f"SINR: {signal.sinr} dB")
 
+                for cell in signal.cells:
+                    print(f"Serving Cell: {cell}")
+
                 if not any([signal.rssi, signal.rsrp, signal.rsrq, signal.sinr]):
                     print("No signal data available")
 
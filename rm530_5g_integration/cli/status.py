@@ -2,6 +2,7 @@
 
 import argparse
 import sys
+import time
 
 try:
     from rich import box
@@ -13,12 +14,21 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+from rm530_5g_integration.cli.trends import collect_trends, dbm, mbps, print_trends
 from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.monitoring.store import INTERFACE_SERIES, SIGNAL_SERIES
 from rm530_5g_integration.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 console = Console() if RICH_AVAILABLE else None
 
+TREND_METRICS = (
+    (INTERFACE_SERIES, "rx_rate", "Download", mbps),
+    (INTERFACE_SERIES, "tx_rate", "Upload", mbps),
+    (SIGNAL_SERIES, "rsrp", "RSRP", dbm),
+    (SIGNAL_SERIES, "rssi", "RSSI", dbm),
+)
+
 
 def main():
     """CLI entry point for status command."""
@@ -27,13 +37,35 @@ def main():
         "--interface", "-i", default="usb0", help="Network interface name (default: usb0)"
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--trends", action="store_true", help="Show 24 h and 7 d trends from recorded history"
+    )
+    parser.add_argument("--store", help="Metric store directory (default: ~/.rm530/metrics)")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        metavar="SECONDS",
+        help="Measure latency, jitter and loss over the interface for SECONDS",
+    )
 
     args = parser.parse_args()
 
+    if args.trends:
+        print_trends("RM530 5G Trends", collect_trends(TREND_METRICS, args.store), console)
+        return
+
     try:
         manager = RM530Manager()
         stats = manager.status(args.interface)
 
+        latency = None
+        if args.latency and stats.is_connected:
+            prober = manager.latency_prober(args.interface)
+            prober.start()
+            time.sleep(args.latency)
+            prober.stop()
+            latency = prober.summary(window=args.latency + prober.timeout)
+
         if args.json:
             import json
 
@@ -41,11 +73,14 @@ def main():
                 "interface": stats.interface,
                 "connected": stats.is_connected,
                 "ip_address": stats.ip_address,
+                "ipv6_address": stats.ipv6_address,
                 "bytes_sent": stats.bytes_sent,
                 "bytes_received": stats.bytes_received,
                 "packets_sent": stats.packets_sent,
                 "packets_received": stats.packets_received,
             }
+            if latency is not None:
+                output["latency"] = latency.as_dict()
             print(json.dumps(output, indent=2))
         else:
             if RICH_AVAILABLE:
@@ -66,6 +101,8 @@ def main():
                     table.add_row("IP Address", stats.ip_address)
                 else:
                     table.add_row("IP Address", "[dim]N/A[/dim]")
+                if stats.ipv6_address:
+                    table.add_row("IPv6 Address", stats.ipv6_address)
 
                 # Connection statistics
                 if stats.is_connected:
@@ -85,10 +122,12 @@ def main():
                 if stats.is_connected:
                     internet_status = (
                         "[bold green]✓ OK[/bold green]"
-                        if manager.verify()
+                        if manager.verify(args.interface)
                         else "[bold yellow]⚠ Failed[/bold yellow]"
                     )
                     console.print(f"Internet Connectivity: {internet_status}")
+                    if latency is not None:
+                        console.print(f"Latency: {latency}")
                     console.print()
             else:
                 # Fallback to plain text
@@ -100,6 +139,8 @@ def main():
                 print(f"Status: {'✓ Connected' if stats.is_connected else '✗ Disconnected'}")
                 if stats.ip_address:
                     print(f"IP Address: {stats.ip_address}")
+                if stats.ipv6_address:
+                    print(f"IPv6 Address: {stats.ipv6_address}")
                 if stats.bytes_sent is not None:
                     print(f"Bytes Sent: {stats._format_bytes(stats.bytes_sent)}")
                 if stats.bytes_received is not None:
@@ -111,10 +152,12 @@ def main():
 
                 # Verify connectivity
                 if stats.is_connected:
-                    if manager.verify():
+                    if manager.verify(args.interface):
                         print("\n✓ Internet connectivity: OK")
                     else:
                         print("\n⚠ Internet connectivity: Failed")
+                    if latency is not None:
+                        print(f"Latency: {latency}")
 
                 print()
 
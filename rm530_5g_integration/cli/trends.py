@@ -0,0 +1,107 @@
+"""Trend tables shared by the status and health commands."""
+
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+try:
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+from rm530_5g_integration.monitoring.rollup import RollupPoint
+from rm530_5g_integration.monitoring.store import MetricStore
+
+# Trend windows shown: (label, seconds)
+TREND_WINDOWS = (("24 h", 86400.0), ("7 d", 7 * 86400.0))
+
+# (series, field, label, value formatter)
+TrendSpec = Tuple[str, str, str, Callable[[float], str]]
+
+
+def mbps(bytes_per_second: float) -> str:
+    """Format a byte rate in Mbit/s."""
+    return f"{bytes_per_second * 8 / 1e6:.2f} Mbit/s"
+
+
+def dbm(value: float) -> str:
+    """Format a power level."""
+    return f"{value:.0f} dBm"
+
+
+def percent(fraction: float) -> str:
+    """Format a 0-1 fraction as a percentage."""
+    return f"{fraction * 100:.1f}%"
+
+
+def collect_trends(
+    specs: Sequence[TrendSpec], store_dir: Optional[str] = None, now: Optional[float] = None
+) -> List[Tuple[str, str, RollupPoint, Callable[[float], str]]]:
+    """
+    Summarize recorded metrics over the trend windows.
+
+    Args:
+        specs: Metrics to show
+        store_dir: MetricStore directory (default: ~/.rm530/metrics)
+        now: End of the windows (default: now)
+
+    Returns:
+        (metric label, window label, summary, formatter) for metrics with data
+    """
+    now = time.time() if now is None else now
+    rows = []
+    store = MetricStore(store_dir, readonly=True)
+    try:
+        for series, field, label, fmt in specs:
+            if store.open_series(series) is None:
+                continue
+            for window, seconds in TREND_WINDOWS:
+                summary = store.summary(series, field, start=now - seconds, end=now)
+                if summary.count:
+                    rows.append((label, window, summary, fmt))
+    finally:
+        store.close()
+    return rows
+
+
+def print_trends(
+    title: str,
+    rows: List[Tuple[str, str, RollupPoint, Callable[[float], str]]],
+    console: Optional["Console"] = None,
+) -> None:
+    """Print trend rows as a table (rich) or plain text."""
+    if not rows:
+        message = "No recorded history (run rm530-health with --record)"
+        if console is not None:
+            console.print(f"[dim]{message}[/dim]")
+        else:
+            print(message)
+        return
+
+    if RICH_AVAILABLE and console is not None:
+        table = Table(title=title, box=box.ROUNDED)
+        table.add_column("Metric", style="cyan", no_wrap=True)
+        table.add_column("Window")
+        table.add_column("Mean", style="green")
+        table.add_column("Min")
+        table.add_column("Max")
+        for label, window, summary, fmt in rows:
+            mean, low, high = _format_summary(summary, fmt)
+            table.add_row(label, window, mean, low, high)
+        console.print(table)
+    else:
+        print(title)
+        for label, window, summary, fmt in rows:
+            mean, low, high = _format_summary(summary, fmt)
+            print(f"  {label} ({window}): mean {mean}, min {low}, max {high}")
+
+
+def _format_summary(summary: RollupPoint, fmt: Callable[[float], str]) -> Tuple[str, str, str]:
+    """Format the mean, min and max of a summary ("-" where unset)."""
+    mean, low, high = (
+        "-" if value is None else fmt(value) for value in (summary.mean, summary.min, summary.max)
+    )
+    return mean, low, high
@@ -32,6 +32,8 @@ DEFAULT_NETWORK_SETTINGS = {
     "autoconnect": True,
     "ipv4_method": "auto",
     "connection_name": "RM530-5G-ECM",
+    "probe_targets": ["8.8.8.8", "1.1.1.1"],
+    "probe_timeout": 2,
 }
 
 # Default modem settings
@@ -39,4 +41,6 @@ DEFAULT_MODEM_SETTINGS = {
     "at_baudrate": 115200,
     "timeout": 2,
     "command_timeout": 5,
+    "broker_socket": "/run/rm530/at.sock",
+    "ready_timeout": 60,
 }
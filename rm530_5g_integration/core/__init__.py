@@ -1,12 +1,22 @@
 """Core modules for RM530 5G Integration."""
 
+from rm530_5g_integration.core.async_modem import AsyncModem
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.core.broker import ATBroker, BrokerClient
 from rm530_5g_integration.core.manager import RM530Manager
 from rm530_5g_integration.core.modem import Modem, find_modem
 from rm530_5g_integration.core.network import NetworkManager
+from rm530_5g_integration.core.urc import URC, URCDispatcher
 
 __all__ = [
+    "ATResponse",
+    "ATBroker",
+    "BrokerClient",
     "Modem",
+    "AsyncModem",
     "find_modem",
     "NetworkManager",
     "RM530Manager",
+    "URC",
+    "URCDispatcher",
 ]
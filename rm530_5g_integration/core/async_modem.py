@@ -0,0 +1,296 @@
+"""asyncio-native modem communication."""
+
+import asyncio
+from typing import List, Optional, Sequence, Tuple
+
+import serial
+
+from rm530_5g_integration.core.at import (
+    ATResponse,
+    LineReader,
+    ResponseCollector,
+    chain_commands,
+    is_final_result,
+    split_chained_response,
+)
+from rm530_5g_integration.core.modem import (
+    ECM_STATE_COMMANDS,
+    HANDSHAKE_ATTEMPTS,
+    HANDSHAKE_TIMEOUT,
+    ecm_config_commands,
+    find_modem,
+)
+from rm530_5g_integration.core.urc import URCDispatcher, is_urc
+from rm530_5g_integration.utils.exceptions import ModemNotFoundError, SerialCommunicationError
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncModem:
+    """
+    Handle communication with RM530 modem from an asyncio event loop.
+
+    The port is opened non-blocking and registered with the event loop, so
+    reads cost no thread and no polling: the loop wakes when bytes arrive.
+    Many modems and monitoring tasks can share one loop.
+
+    Examples:
+        >>> async with AsyncModem(port="/dev/ttyUSB2") as modem:
+        ...     response = await modem.execute("AT+CSQ")
+    """
+
+    def __init__(self, port: Optional[str] = None, baudrate: int = 115200, timeout: int = 2):
+        """
+        Initialize modem connection.
+
+        Args:
+            port: Serial port path (auto-detect if None)
+            baudrate: Serial baudrate
+            timeout: Serial timeout in seconds (used for port discovery)
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.serial: Optional[serial.Serial] = None
+        self.urcs = URCDispatcher()
+        self.reset_issued = False  # Set by switch_to_ecm_mode()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader = LineReader()
+        self._command_lock: Optional[asyncio.Lock] = None
+        self._pending: Optional[Tuple[ResponseCollector, "asyncio.Future[ATResponse]"]] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the modem port is open."""
+        return bool(self.serial and self.serial.is_open)
+
+    async def connect(self) -> bool:
+        """
+        Connect to modem.
+
+        Returns:
+            True if connected successfully
+        """
+        self._loop = asyncio.get_running_loop()
+        self._command_lock = asyncio.Lock()
+
+        if self.port is None:
+            # Discovery probes ports with blocking I/O; keep it off the loop
+            self.port = await self._loop.run_in_executor(None, find_modem)
+            if self.port is None:
+                raise ModemNotFoundError("Modem not found")
+
+        try:
+            logger.info(f"Connecting to modem at {self.port}")
+            # timeout=0: reads return immediately with whatever is buffered
+            self.serial = serial.Serial(self.port, self.baudrate, timeout=0)
+        except serial.SerialException as e:
+            raise SerialCommunicationError(f"Failed to connect: {e}")
+
+        self._reader.reset()
+        self._loop.add_reader(self.serial.fileno(), self._on_readable)
+
+        for _ in range(HANDSHAKE_ATTEMPTS):
+            if await self.send_command("AT", timeout=HANDSHAKE_TIMEOUT):
+                return True
+
+        await self.disconnect()
+        raise SerialCommunicationError("No response from modem")
+
+    async def disconnect(self) -> None:
+        """Close modem connection."""
+        if self.serial is None:
+            return
+        if self._loop is not None and self.serial.is_open:
+            self._loop.remove_reader(self.serial.fileno())
+        self._fail_pending(SerialCommunicationError("Modem disconnected"))
+        if self.serial.is_open:
+            self.serial.close()
+            logger.info("Disconnected from modem")
+
+    def _on_readable(self) -> None:
+        """Event loop callback: read available bytes and route complete lines."""
+        assert self.serial is not None
+        try:
+            chunk = self.serial.read(self.serial.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            # Device went away (e.g. modem reset); stop watching the fd
+            logger.warning(f"Modem read failed: {e}")
+            if self._loop is not None:
+                self._loop.remove_reader(self.serial.fileno())
+            self._fail_pending(SerialCommunicationError(f"Read failed: {e}"))
+            return
+        if not chunk:
+            return
+        if self._pending is not None:
+            self._pending[0].add_raw(chunk)
+        for line in self._reader.feed(chunk):
+            self._route_line(line)
+
+    def _route_line(self, line: str) -> None:
+        """Hand a line to the pending command or to URC subscribers."""
+        if self._pending is not None:
+            collector, future = self._pending
+            if not is_urc(line, collector.response.command):
+                if collector.add_line(line) and not future.done():
+                    future.set_result(collector.response)
+                return
+        if not is_final_result(line):
+            self.urcs.dispatch_line(line)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail the command awaiting a response, if any."""
+        if self._pending is not None and not self._pending[1].done():
+            self._pending[1].set_exception(error)
+
+    async def execute(self, command: str, timeout: float = 5) -> ATResponse:
+        """
+        Send AT command and collect its response.
+
+        Args:
+            command: AT command to send
+            timeout: Command timeout in seconds
+
+        Returns:
+            ATResponse with information lines and final result code
+        """
+        if not self.serial or not self.serial.is_open or self._command_lock is None:
+            raise SerialCommunicationError("Modem not connected")
+        assert self._loop is not None
+
+        async with self._command_lock:
+            collector = ResponseCollector(command)
+            future: "asyncio.Future[ATResponse]" = self._loop.create_future()
+            self._pending = (collector, future)
+            try:
+                try:
+                    self.serial.write(f"{command}\r\n".encode())
+                except (serial.SerialException, OSError) as e:
+                    raise SerialCommunicationError(f"Command failed: {e}")
+                try:
+                    response = await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out waiting for response to: {command}")
+                    response = collector.response
+            finally:
+                self._pending = None
+
+        logger.debug(f"AT Command: {command} -> Response: {response.raw.strip()}")
+        return response
+
+    async def execute_batch(
+        self, commands: Sequence[str], timeout: float = 5, chain: bool = True
+    ) -> List[ATResponse]:
+        """
+        Execute several AT commands with as few round trips as possible.
+
+        See Modem.execute_batch().
+
+        Args:
+            commands: AT commands to execute
+            timeout: Timeout in seconds for the chained line or each command
+            chain: Allow ';'-chaining
+
+        Returns:
+            One ATResponse per command, in order
+        """
+        line = chain_commands(commands) if chain else None
+        if line is not None:
+            response = await self.execute(line, timeout=timeout)
+            if response.ok or response.timed_out:
+                return split_chained_response(response, commands)
+            logger.debug(f"Chained command failed ({response.final}), retrying separately")
+
+        return [await self.execute(command, timeout=timeout) for command in commands]
+
+    async def send_command(self, command: str, expected: str = "OK", timeout: float = 5) -> bool:
+        """
+        Send AT command to modem.
+
+        Args:
+            command: AT command to send
+            expected: Expected response string (default: "OK"); an empty string
+                sends the command without waiting for a response (e.g. reset)
+            timeout: Command timeout in seconds
+
+        Returns:
+            True if command succeeded
+        """
+        if not self.serial or not self.serial.is_open:
+            raise SerialCommunicationError("Modem not connected")
+
+        if expected == "":
+            try:
+                self.serial.write(f"{command}\r\n".encode())
+            except (serial.SerialException, OSError) as e:
+                raise SerialCommunicationError(f"Command failed: {e}")
+            return True
+
+        response = await self.execute(command, timeout=timeout)
+        if response.error:
+            logger.error(f"Modem returned {response.error} for command: {command}")
+            return False
+        return expected in response.raw
+
+    async def get_response(self, command: str, timeout: float = 5) -> str:
+        """
+        Send AT command and return response.
+
+        Args:
+            command: AT command to send
+            timeout: Command timeout in seconds
+
+        Returns:
+            Response string
+        """
+        return (await self.execute(command, timeout=timeout)).raw
+
+    async def switch_to_ecm_mode(self, apn: Optional[str] = None) -> bool:
+        """
+        Switch modem to ECM mode.
+
+        Args:
+            apn: APN to configure (optional)
+
+        Returns:
+            True if successful
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        logger.info("Switching modem to ECM mode")
+        self.reset_issued = False
+
+        try:
+            state = await self.execute_batch(ECM_STATE_COMMANDS, timeout=3)
+            commands = ecm_config_commands(state, apn)
+            if not commands:
+                logger.info("Modem already in ECM mode with the requested settings")
+                return True
+
+            for command in commands:
+                logger.info(f"Applying: {command}")
+                if not await self.send_command(command):
+                    logger.error(f"Failed to apply: {command}")
+                    return False
+
+            logger.info("Applying settings and resetting modem")
+            await self.send_command("AT+CFUN=1,1", expected="", timeout=10)
+            self.reset_issued = True
+
+            logger.info("ECM mode configuration complete")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error switching to ECM mode: {e}")
+            return False
+
+    async def __aenter__(self) -> "AsyncModem":
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.disconnect()
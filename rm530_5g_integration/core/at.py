@@ -0,0 +1,212 @@
+"""AT command response framing."""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+# Final result codes that terminate a command response (3GPP TS 27.007 / V.250)
+FINAL_OK = "OK"
+FINAL_ERROR_CODES = ("ERROR", "NO CARRIER", "NO DIALTONE", "BUSY", "NO ANSWER")
+FINAL_ERROR_PREFIXES = ("+CME ERROR:", "+CMS ERROR:")
+
+# Commands that reset or power the module must run on their own
+UNCHAINABLE_PREFIXES = frozenset({"+CFUN", "+QPOWD", "+CRESET", "+QPRTPARA"})
+
+# Conservative command line length for ';'-chained commands
+MAX_CHAINED_LENGTH = 256
+
+_EXTENDED_COMMAND = re.compile(r"^AT(\+[A-Z0-9]+)", re.IGNORECASE)
+
+
+def is_final_result(line: str) -> bool:
+    """
+    Check whether a response line is a final result code.
+
+    Args:
+        line: Response line without line terminator
+
+    Returns:
+        True if the line terminates a command response
+    """
+    return line == FINAL_OK or line in FINAL_ERROR_CODES or line.startswith(FINAL_ERROR_PREFIXES)
+
+
+@dataclass
+class ATResponse:
+    """Response to a single AT command."""
+
+    command: str
+    lines: List[str] = field(default_factory=list)  # Information lines (echo stripped)
+    final: Optional[str] = None  # Final result code, None on timeout
+    raw: str = ""  # Everything read from the port for this command
+
+    @property
+    def ok(self) -> bool:
+        """Check if the command completed with OK."""
+        return self.final == FINAL_OK
+
+    @property
+    def timed_out(self) -> bool:
+        """Check if no final result code was received."""
+        return self.final is None
+
+    @property
+    def error(self) -> Optional[str]:
+        """Error result code, if the command failed."""
+        if self.final is None or self.final == FINAL_OK:
+            return None
+        return self.final
+
+    def __str__(self) -> str:
+        """String representation."""
+        return self.raw
+
+
+class LineReader:
+    """
+    Split a serial byte stream into complete response lines.
+
+    Partial lines are kept until their terminator arrives, so the reader can be
+    fed whatever chunk size the port returns.
+    """
+
+    def __init__(self) -> None:
+        """Initialize line reader."""
+        self._pending = b""
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Add received bytes and return the lines they complete.
+
+        Args:
+            data: Bytes read from the port
+
+        Returns:
+            List of non-empty lines without terminators
+        """
+        self._pending += data
+        # Modems terminate lines with <CR><LF>, echo with a bare <CR>
+        chunks = self._pending.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+        self._pending = chunks.pop()
+        lines = []
+        for chunk in chunks:
+            line = chunk.decode("utf-8", errors="ignore").strip()
+            if line:
+                lines.append(line)
+        return lines
+
+    def reset(self) -> None:
+        """Discard any partial line."""
+        self._pending = b""
+
+
+class ResponseCollector:
+    """Accumulate response lines for one command until its final result code."""
+
+    def __init__(self, command: str) -> None:
+        """
+        Initialize collector.
+
+        Args:
+            command: AT command the response belongs to
+        """
+        self.response = ATResponse(command=command)
+        self._raw = bytearray()
+
+    @property
+    def done(self) -> bool:
+        """Check if the final result code has been received."""
+        return self.response.final is not None
+
+    def add_raw(self, data: bytes) -> None:
+        """Record raw bytes read for this command."""
+        self._raw += data
+        self.response.raw = self._raw.decode("utf-8", errors="ignore")
+
+    def add_line(self, line: str) -> bool:
+        """
+        Add a response line.
+
+        Args:
+            line: Response line without terminator
+
+        Returns:
+            True if the line was a final result code
+        """
+        if is_final_result(line):
+            self.response.final = line
+            return True
+        # Drop the command echo (ATE1 is the module default)
+        if not self.response.lines and line == self.response.command:
+            return False
+        self.response.lines.append(line)
+        return False
+
+
+def extended_prefix(command: str) -> Optional[str]:
+    """
+    Get the response prefix of an extended AT command.
+
+    Args:
+        command: AT command (e.g. 'AT+QENG="servingcell"')
+
+    Returns:
+        Prefix such as "+QENG", or None for basic commands (AT, ATE0, ATI)
+    """
+    match = _EXTENDED_COMMAND.match(command.strip())
+    return match.group(1).upper() if match else None
+
+
+def chain_commands(commands: Sequence[str]) -> Optional[str]:
+    """
+    Join commands into one ';'-chained command line if they are compatible.
+
+    Commands are compatible when all are extended commands with distinct
+    response prefixes (so the response can be split again), none resets the
+    module, and the line stays within MAX_CHAINED_LENGTH.
+
+    Args:
+        commands: AT commands, each starting with "AT"
+
+    Returns:
+        Chained command line, or None if the commands must run separately
+    """
+    if len(commands) < 2:
+        return None
+    prefixes = [extended_prefix(command) for command in commands]
+    if any(prefix is None or prefix in UNCHAINABLE_PREFIXES for prefix in prefixes):
+        return None
+    if len(set(prefixes)) != len(prefixes):
+        return None
+    line = "AT" + ";".join(command.strip()[2:] for command in commands)
+    return line if len(line) <= MAX_CHAINED_LENGTH else None
+
+
+def split_chained_response(response: ATResponse, commands: Sequence[str]) -> List[ATResponse]:
+    """
+    Split the response to a chained command line into per-command responses.
+
+    Information lines are assigned by their "+PREFIX:"; lines without a known
+    prefix belong to the command whose lines precede them.
+
+    Args:
+        response: Response to the line built by chain_commands()
+        commands: The commands that were chained, in order
+
+    Returns:
+        One ATResponse per command, each carrying the shared final result code
+    """
+    prefixes = [extended_prefix(command) for command in commands]
+    split = [ATResponse(command=command, final=response.final) for command in commands]
+    current = 0
+    for line in response.lines:
+        if line.startswith("+"):
+            name = line.split(":", 1)[0]
+            if name in prefixes:
+                current = prefixes.index(name)
+        split[current].lines.append(line)
+    for part in split:
+        part.raw = "".join(f"{line}\r\n" for line in part.lines)
+        if part.final is not None:
+            part.raw += f"{part.final}\r\n"
+    return split
@@ -0,0 +1,467 @@
+"""AT session broker shared across processes.
+
+The broker owns the modem's AT port and serializes commands received from
+any number of clients over a UNIX socket. Clients keep their socket open, so
+repeated commands cost neither a port open nor an ``AT`` handshake, and
+bytes from different processes never interleave on the tty.
+
+Protocol: one JSON object per line in each direction.
+
+Request::
+
+    {"command": "AT+CSQ", "timeout": 5, "wait": true}
+
+Response::
+
+    {"command": "AT+CSQ", "lines": ["+CSQ: 20,99"], "final": "OK", "raw": "..."}
+    {"error": "Modem not connected"}
+
+A connection that sends ``{"subscribe": true}`` instead receives every URC the
+broker reads from the modem::
+
+    {"urc": "+CEREG: 2", "timestamp": 1700000000.0}
+
+A subscriber that falls SUBSCRIBER_QUEUE_SIZE URCs behind is disconnected.
+"""
+
+import json
+import math
+import os
+import queue
+import select
+import socket
+import socketserver
+import stat
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.core.urc import URC
+from rm530_5g_integration.utils.exceptions import SerialCommunicationError
+from rm530_5g_integration.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from rm530_5g_integration.core.modem import Modem
+
+logger = get_logger(__name__)
+
+DEFAULT_BROKER_SOCKET = "/run/rm530/at.sock"
+
+# Extra time the client allows on top of the command timeout for queueing
+CLIENT_TIMEOUT_MARGIN = 5.0
+
+# URCs queued per subscriber before a subscriber that stopped reading is dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+# Seconds between checks of an idle subscriber connection for a disconnect
+SUBSCRIBER_POLL_INTERVAL = 1.0
+
+
+class _BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded UNIX stream server carrying a reference to the broker."""
+
+    daemon_threads = True
+    broker: "ATBroker"
+
+
+class _Subscriber:
+    """URC queue of one subscribed connection, drained by its handler thread."""
+
+    def __init__(self, connection: socket.socket):
+        self.connection = connection
+        self.queue: "queue.Queue[bytes]" = queue.Queue(SUBSCRIBER_QUEUE_SIZE)
+
+    def close(self) -> None:
+        """Shut the connection down, failing a write blocked on it."""
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def peer_closed(self) -> bool:
+        """Check without blocking if the client closed the connection."""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            return bool(readable) and not self.connection.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+
+class _BrokerHandler(socketserver.StreamRequestHandler):
+    """Handle one client connection (many requests per connection)."""
+
+    server: _BrokerServer
+
+    def handle(self) -> None:
+        """Process newline-delimited JSON requests until the client disconnects."""
+        broker = self.server.broker
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("expected a JSON object")
+                if request.get("subscribe"):
+                    # The connection only receives URCs from now on
+                    self._stream_urcs(broker)
+                    return
+                reply = broker.handle_request(request)
+            except ValueError as e:
+                reply = {"error": f"Invalid request: {e}"}
+            try:
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+                self.wfile.flush()
+            except OSError:
+                break
+
+    def _stream_urcs(self, broker: "ATBroker") -> None:
+        """Write URCs queued by the modem reader thread until the client goes away."""
+        subscriber = broker.add_subscriber(self.connection)
+        try:
+            while True:
+                try:
+                    message = subscriber.queue.get(timeout=SUBSCRIBER_POLL_INTERVAL)
+                except queue.Empty:
+                    if subscriber.peer_closed():
+                        return
+                    continue
+                self.wfile.write(message)
+                self.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            broker.remove_subscriber(subscriber)
+
+
+class ATBroker:
+    """
+    Long-running owner of the modem AT port.
+
+    Examples:
+        >>> broker = ATBroker(Modem(port="/dev/ttyUSB2"))
+        >>> broker.serve_forever()
+    """
+
+    def __init__(self, modem: "Modem", socket_path: str = DEFAULT_BROKER_SOCKET):
+        """
+        Initialize broker.
+
+        Args:
+            modem: Modem instance in serial mode (connected lazily)
+            socket_path: UNIX socket path to listen on
+        """
+        self.modem = modem
+        self.socket_path = socket_path
+        self._lock = threading.Lock()
+        self._server: Optional[_BrokerServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._subscribers: List[_Subscriber] = []
+        self._subscribers_lock = threading.Lock()
+        self.modem.urcs.subscribe(self._forward_urc)
+
+    def _ensure_connected(self) -> None:
+        """Open the modem port and its URC reader if needed (caller holds _lock)."""
+        if not self.modem.is_connected:
+            self.modem.connect()
+            self.modem.start_reader()
+
+    def add_subscriber(self, connection: socket.socket) -> _Subscriber:
+        """
+        Start queueing URCs for a client connection.
+
+        Args:
+            connection: Client connection
+
+        Returns:
+            Subscriber whose queue the connection's handler thread drains
+        """
+        subscriber = _Subscriber(connection)
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        with self._lock:
+            try:
+                self._ensure_connected()
+            except Exception as e:
+                logger.warning(f"Could not open modem for URC subscriber: {e}")
+        return subscriber
+
+    def remove_subscriber(self, subscriber: _Subscriber) -> None:
+        """Stop queueing URCs for a client connection."""
+        with self._subscribers_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def _forward_urc(self, urc: URC) -> None:
+        """
+        Queue a URC for all subscribed clients.
+
+        Runs on the modem reader thread, so it never blocks: a subscriber
+        whose queue is full has stopped reading and is disconnected.
+        """
+        message = json.dumps({"urc": urc.line, "timestamp": urc.timestamp}).encode() + b"\n"
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait(message)
+            except queue.Full:
+                logger.warning("Dropping URC subscriber that stopped reading")
+                self.remove_subscriber(subscriber)
+                subscriber.close()
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one client request on the modem.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Reply object
+        """
+        command = request.get("command")
+        if not isinstance(command, str) or not command:
+            return {"error": "Missing command"}
+        timeout = request.get("timeout", 5)
+        if (
+            isinstance(timeout, bool)
+            or not isinstance(timeout, (int, float))
+            or not math.isfinite(timeout)
+            or timeout <= 0
+        ):
+            return {"error": f"Invalid timeout: {timeout!r}"}
+        wait = bool(request.get("wait", True))
+
+        with self._lock:
+            try:
+                self._ensure_connected()
+                if not wait:
+                    self.modem.send_command(command, expected="")
+                    return {"command": command, "lines": [], "final": None, "raw": ""}
+                response = self.modem.execute(command, timeout=timeout)
+            except Exception as e:
+                # Port likely went away (e.g. modem reset); reopen on next request
+                logger.warning(f"Broker command {command!r} failed: {e}")
+                self.modem.disconnect()
+                return {"error": str(e)}
+
+        return {
+            "command": response.command,
+            "lines": response.lines,
+            "final": response.final,
+            "raw": response.raw,
+        }
+
+    def _bind(self) -> _BrokerServer:
+        """Create the listening socket, replacing a stale socket file."""
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, mode=0o755, exist_ok=True)
+
+        if os.path.exists(self.socket_path):
+            if not stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                raise SerialCommunicationError(f"{self.socket_path} exists and is not a socket")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise SerialCommunicationError(f"Broker already running on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+
+        server = _BrokerServer(self.socket_path, _BrokerHandler)
+        server.broker = self
+        os.chmod(self.socket_path, 0o660)
+        return server
+
+    def serve_forever(self) -> None:
+        """Serve clients until shutdown() is called."""
+        self._server = self._bind()
+        logger.info(f"AT broker listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._cleanup()
+
+    def start(self) -> None:
+        """Serve clients in a background thread."""
+        self._server = self._bind()
+        self._thread = threading.Thread(target=self._serve_background, daemon=True)
+        self._thread.start()
+        logger.info(f"AT broker listening on {self.socket_path}")
+
+    def _serve_background(self) -> None:
+        """Background thread body."""
+        assert self._server is not None
+        try:
+            self._server.serve_forever()
+        finally:
+            self._cleanup()
+
+    def shutdown(self) -> None:
+        """Stop serving and release the modem."""
+        if self._server:
+            self._server.shutdown()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _cleanup(self) -> None:
+        """Close socket and modem."""
+        if self._server:
+            self._server.server_close()
+            self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.modem.disconnect()
+        logger.info("AT broker stopped")
+
+
+class BrokerClient:
+    """Client side of the AT broker protocol."""
+
+    def __init__(self, socket_path: str = DEFAULT_BROKER_SOCKET):
+        """
+        Initialize broker client.
+
+        Args:
+            socket_path: Broker UNIX socket path
+        """
+        self.socket_path = socket_path
+        self._sock: Optional[socket.socket] = None
+        self._rfile: Any = None
+        self._urc_sock: Optional[socket.socket] = None
+        self._urc_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the client holds an open broker connection."""
+        return self._sock is not None
+
+    def _open(self) -> socket.socket:
+        """Open a socket to the broker."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise SerialCommunicationError(f"AT broker not reachable at {self.socket_path}: {e}")
+        return sock
+
+    def connect(self) -> None:
+        """Open the broker connection."""
+        self._sock = self._open()
+        self._rfile = self._sock.makefile("rb")
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """
+        Receive URC lines read by the broker on a dedicated connection.
+
+        Args:
+            callback: Called with each URC line (from a background thread)
+        """
+        if self._urc_sock is not None:
+            return
+        sock = self._open()
+        sock.sendall(json.dumps({"subscribe": True}).encode() + b"\n")
+        self._urc_sock = sock
+        self._urc_thread = threading.Thread(
+            target=self._urc_loop, args=(sock, callback), name="rm530-urc-client", daemon=True
+        )
+        self._urc_thread.start()
+
+    def unsubscribe(self) -> None:
+        """Close the URC connection."""
+        sock = self._urc_sock
+        if sock is None:
+            return
+        self._urc_sock = None
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+        if self._urc_thread is not None:
+            self._urc_thread.join(timeout=5)
+            self._urc_thread = None
+
+    @staticmethod
+    def _urc_loop(sock: socket.socket, callback: Callable[[str], None]) -> None:
+        """Read pushed URCs until the connection closes."""
+        try:
+            with sock.makefile("rb") as stream:
+                for line in stream:
+                    message = json.loads(line)
+                    if "urc" in message:
+                        callback(message["urc"])
+        except (OSError, ValueError) as e:
+            logger.debug(f"URC stream closed: {e}")
+
+    def close(self) -> None:
+        """Close the broker connection."""
+        self.unsubscribe()
+        if self._rfile:
+            self._rfile.close()
+            self._rfile = None
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def request(self, command: str, timeout: float = 5, wait: bool = True) -> ATResponse:
+        """
+        Execute a command through the broker.
+
+        Args:
+            command: AT command to send
+            timeout: Command timeout in seconds
+            wait: Wait for the command's response
+
+        Returns:
+            ATResponse
+        """
+        if not self._sock:
+            raise SerialCommunicationError("Not connected to AT broker")
+
+        payload = {"command": command, "timeout": timeout, "wait": wait}
+        try:
+            # Other clients' commands may be queued ahead of ours
+            self._sock.settimeout(timeout + CLIENT_TIMEOUT_MARGIN)
+            self._sock.sendall(json.dumps(payload).encode() + b"\n")
+            line = self._rfile.readline()
+        except OSError as e:
+            self.close()
+            raise SerialCommunicationError(f"AT broker request failed: {e}")
+
+        if not line:
+            self.close()
+            raise SerialCommunicationError("AT broker closed the connection")
+
+        reply = json.loads(line)
+        if "error" in reply:
+            raise SerialCommunicationError(f"Command failed: {reply['error']}")
+        return ATResponse(
+            command=reply["command"],
+            lines=reply["lines"],
+            final=reply["final"],
+            raw=reply["raw"],
+        )
+
+
+def broker_available(socket_path: str = DEFAULT_BROKER_SOCKET) -> bool:
+    """
+    Check if a broker socket exists at the given path.
+
+    Args:
+        socket_path: Broker UNIX socket path
+
+    Returns:
+        True if the path is a UNIX socket
+    """
+    try:
+        return stat.S_ISSOCK(os.stat(socket_path).st_mode)
+    except OSError:
+        return False
@@ -0,0 +1,392 @@
+"""USB serial port discovery via sysfs."""
+
+import json
+import os
+import socket
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SYSFS_ROOT = "/sys"
+
+# Quectel Wireless Solutions USB vendor ID
+QUECTEL_VENDOR_ID = "2c7c"
+
+# USB interfaces carrying the AT command port on RM5xx modules, in preference
+# order (if00 = DM, if01 = NMEA, if02 = AT, if03 = AT/modem)
+AT_INTERFACES = (2, 3)
+
+
+@dataclass(frozen=True)
+class UsbSerialPort:
+    """USB serial port as described by sysfs."""
+
+    device: str  # e.g. /dev/ttyUSB2
+    vendor_id: str  # e.g. 2c7c
+    product_id: str  # e.g. 0800
+    interface: Optional[int]  # bInterfaceNumber
+    usb_path: str  # Bus topology, e.g. 1-1.3
+    serial_number: Optional[str] = None
+
+    @property
+    def is_quectel(self) -> bool:
+        """Check if the port belongs to a Quectel module."""
+        return self.vendor_id == QUECTEL_VENDOR_ID
+
+
+def _read_attr(directory: str, name: str) -> Optional[str]:
+    """Read a sysfs attribute, None if missing."""
+    try:
+        with open(os.path.join(directory, name)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def list_usb_serial_ports(sysfs_root: str = SYSFS_ROOT) -> List[UsbSerialPort]:
+    """
+    List USB serial ports with their USB identity from sysfs.
+
+    Args:
+        sysfs_root: sysfs mount point
+
+    Returns:
+        Ports sorted by device name (empty if sysfs is unavailable)
+    """
+    devices_dir = os.path.join(sysfs_root, "bus", "usb-serial", "devices")
+    try:
+        names = sorted(os.listdir(devices_dir))
+    except OSError:
+        return []
+
+    ports = []
+    for name in names:
+        port = describe_port(name, sysfs_root)
+        if port is not None:
+            ports.append(port)
+    return ports
+
+
+def describe_port(name: str, sysfs_root: str = SYSFS_ROOT) -> Optional[UsbSerialPort]:
+    """
+    Read the USB identity of a single USB serial port.
+
+    Args:
+        name: tty name (e.g. "ttyUSB2")
+        sysfs_root: sysfs mount point
+
+    Returns:
+        UsbSerialPort, or None if the port does not exist
+    """
+    link = os.path.join(sysfs_root, "bus", "usb-serial", "devices", name)
+    if not os.path.exists(link):
+        return None
+    # devices/ttyUSB2 -> .../usb1/1-1/1-1.3/1-1.3:1.2/ttyUSB2
+    interface_dir = os.path.dirname(os.path.realpath(link))
+    usb_dir = os.path.dirname(interface_dir)
+    vendor_id = _read_attr(usb_dir, "idVendor")
+    product_id = _read_attr(usb_dir, "idProduct")
+    if vendor_id is None or product_id is None:
+        return None
+    interface = _read_attr(interface_dir, "bInterfaceNumber")
+    return UsbSerialPort(
+        device=f"/dev/{name}",
+        vendor_id=vendor_id.lower(),
+        product_id=product_id.lower(),
+        interface=int(interface, 16) if interface else None,
+        usb_path=os.path.basename(usb_dir),
+        serial_number=_read_attr(usb_dir, "serial"),
+    )
+
+
+def at_port_candidates(ports: List[UsbSerialPort]) -> List[str]:
+    """
+    Get Quectel AT command ports in probing order.
+
+    Args:
+        ports: Ports from list_usb_serial_ports()
+
+    Returns:
+        Device paths of Quectel AT interfaces, preferred interface first
+    """
+    candidates = [p for p in ports if p.is_quectel and p.interface in AT_INTERFACES]
+    # interface is set for every candidate (it is in AT_INTERFACES)
+    candidates.sort(key=lambda p: (AT_INTERFACES.index(cast(int, p.interface)), p.usb_path))
+    return [p.device for p in candidates]
+
+
+def topology_key(
+    ports: List[UsbSerialPort],
+) -> Tuple[Tuple[str, str, str, Optional[int], str], ...]:
+    """
+    Build a hashable key describing the current USB serial topology.
+
+    Args:
+        ports: Ports from list_usb_serial_ports()
+
+    Returns:
+        Key that changes whenever a port is added, removed or renumbered
+    """
+    return tuple((p.device, p.vendor_id, p.product_id, p.interface, p.usb_path) for p in ports)
+
+
+def _default_cache_path() -> str:
+    """Get default port cache file path."""
+    return str(Path.home() / ".rm530" / "ports.json")
+
+
+class PortCache:
+    """
+    Persistent map of USB modem identity to its AT port.
+
+    Entries are keyed by the USB serial number (or bus path when the device
+    has none) and re-validated against sysfs on lookup, which reads a handful
+    of attributes for the cached port instead of scanning every tty.
+    """
+
+    def __init__(self, path: Optional[str] = None, sysfs_root: str = SYSFS_ROOT):
+        """
+        Initialize port cache.
+
+        Args:
+            path: Cache file path (default: ~/.rm530/ports.json)
+            sysfs_root: sysfs mount point
+        """
+        self.path = path or _default_cache_path()
+        self.sysfs_root = sysfs_root
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load cache entries from disk."""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries = entries
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _save(self) -> None:
+        """Write cache entries to disk (best effort)."""
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o755, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write port cache {self.path}: {e}")
+
+    @staticmethod
+    def _key(port: UsbSerialPort) -> str:
+        """Cache key for a port's USB device."""
+        return port.serial_number or f"path:{port.usb_path}"
+
+    def lookup(self) -> Optional[str]:
+        """
+        Get a cached AT port that still belongs to the same USB device.
+
+        Returns:
+            Port path, or None if nothing valid is cached
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, entry in entries:
+            device = str(entry.get("device", ""))
+            current = describe_port(os.path.basename(device), self.sysfs_root)
+            if current is not None and asdict(current) == entry:
+                return device
+            logger.debug(f"Port cache entry {key} is stale")
+            self.invalidate(key)
+        return None
+
+    def store(self, port: UsbSerialPort) -> None:
+        """
+        Remember the AT port of a USB device.
+
+        Args:
+            port: Port that answered AT commands
+        """
+        with self._lock:
+            self._entries[self._key(port)] = asdict(port)
+            self._save()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cache entries.
+
+        Args:
+            key: Entry to drop (None drops everything)
+        """
+        with self._lock:
+            if key is None:
+                if not self._entries:
+                    return
+                self._entries.clear()
+            elif self._entries.pop(key, None) is None:
+                return
+            self._save()
+
+    def handle_uevent(self, event: "UEvent") -> None:
+        """
+        Drop entries affected by a hotplug event.
+
+        Args:
+            event: Kernel uevent
+        """
+        if event.action not in ("add", "remove") or event.subsystem not in HOTPLUG_SUBSYSTEMS:
+            return
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, entry in entries:
+            tty = os.path.basename(str(entry.get("device", "")))
+            usb_path = str(entry.get("usb_path", ""))
+            parts = event.devpath.split("/")
+            if tty in parts or usb_path in parts:
+                logger.info(f"Port cache entry {key} invalidated by {event.action} event")
+                self.invalidate(key)
+
+
+# Subsystems whose add/remove events can change the AT port mapping
+HOTPLUG_SUBSYSTEMS = frozenset({"usb", "usb-serial", "tty"})
+
+# linux/netlink.h
+NETLINK_KOBJECT_UEVENT = 15
+_UEVENT_KERNEL_GROUP = 1
+
+
+@dataclass
+class UEvent:
+    """Kernel hotplug event."""
+
+    action: str  # add, remove, change, bind, unbind, ...
+    devpath: str  # e.g. /devices/platform/.../1-1.3
+    subsystem: str
+    properties: Dict[str, str] = field(default_factory=dict)
+
+
+def parse_uevent(data: bytes) -> Optional[UEvent]:
+    """
+    Parse a kernel uevent netlink message.
+
+    Args:
+        data: Message as received ("ACTION@DEVPATH\0KEY=VALUE\0...")
+
+    Returns:
+        UEvent, or None for messages that are not kernel uevents
+    """
+    parts = data.split(b"\0")
+    header = parts[0].decode("utf-8", errors="ignore")
+    if "@" not in header:
+        return None
+    properties = {}
+    for part in parts[1:]:
+        key, sep, value = part.decode("utf-8", errors="ignore").partition("=")
+        if sep:
+            properties[key] = value
+    action, devpath = header.split("@", 1)
+    return UEvent(
+        action=properties.get("ACTION", action),
+        devpath=properties.get("DEVPATH", devpath),
+        subsystem=properties.get("SUBSYSTEM", ""),
+        properties=properties,
+    )
+
+
+class HotplugWatcher:
+    """
+    Deliver kernel uevents (device add/remove) to callbacks.
+
+    Examples:
+        >>> watcher = HotplugWatcher()
+        >>> watcher.add_callback(lambda event: print(event.action, event.devpath))
+        >>> watcher.start()
+    """
+
+    def __init__(self) -> None:
+        """Initialize hotplug watcher."""
+        self._callbacks: List[Callable[[UEvent], None]] = []
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def add_callback(self, callback: Callable[[UEvent], None]) -> None:
+        """Add callback called (from the watcher thread) for each uevent."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[UEvent], None]) -> None:
+        """Remove a callback."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def start(self) -> bool:
+        """
+        Start listening for uevents.
+
+        Returns:
+            True if the uevent socket could be opened
+        """
+        if self._running:
+            return True
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK,  # type: ignore[attr-defined]
+                socket.SOCK_DGRAM,
+                NETLINK_KOBJECT_UEVENT,
+            )
+            sock.bind((0, _UEVENT_KERNEL_GROUP))
+        except (OSError, AttributeError) as e:
+            logger.debug(f"Hotplug events unavailable: {e}")
+            return False
+        # Bounded wait so stop() is noticed without another wakeup mechanism
+        sock.settimeout(1.0)
+        self._sock = sock
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="rm530-hotplug", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop listening."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _run(self) -> None:
+        """Watcher thread body."""
+        assert self._sock is not None
+        while self._running:
+            try:
+                data = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                logger.debug(f"Hotplug watcher stopped: {e}")
+                break
+            event = parse_uevent(data)
+            if event is not None:
+                self.dispatch(event)
+
+    def dispatch(self, event: UEvent) -> None:
+        """Deliver an event to all callbacks."""
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Hotplug callback error: {e}")
@@ -1,17 +1,77 @@
 """Connection health monitoring."""
 
+import asyncio
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.core.parsers import Registration
+from rm530_5g_integration.core.scheduler import CheckScheduler
+from rm530_5g_integration.core.urc import (
+    REGISTERED_STATES,
+    REGISTRATION_URCS,
+    URC,
+    URCDispatcher,
+)
+from rm530_5g_integration.monitoring.latency import DEFAULT_LATENCY_WINDOW, LatencyProber
+from rm530_5g_integration.monitoring.sampler import SignalSampler
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.statistics import SignalStatistics
+from rm530_5g_integration.monitoring.stats import ConnectionStats
+from rm530_5g_integration.monitoring.store import MetricStore
 from rm530_5g_integration.utils.logging import get_logger
 from rm530_5g_integration.utils.retry import retry
 
 logger = get_logger(__name__)
 
+# Independent checks making up one health check, in the order issues are reported
+HEALTH_CHECKS = ("link", "ip", "connectivity", "signal", "registration")
+
+# Seconds each check may take before its result is given up on
+DEFAULT_CHECK_TIMEOUTS = {
+    "link": 2.0,
+    "ip": 2.0,
+    "connectivity": 5.0,
+    "signal": 8.0,
+    "registration": 5.0,
+}
+
+# Hard upper bound on a whole health check
+DEFAULT_CHECK_DEADLINE = 10.0
+
+# Seconds between runs of each check while monitoring: cheap link state often,
+# modem queries rarely (capped by check_interval)
+DEFAULT_CHECK_INTERVALS = {
+    "link": 1.0,
+    "ip": 5.0,
+    "connectivity": 10.0,
+    "signal": 30.0,
+    "registration": 30.0,
+}
+
+# Largest random delay of a scheduled check, as a fraction of its interval
+DEFAULT_CHECK_JITTER = 0.1
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check within a health check."""
+
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    duration: float = 0.0  # Seconds
+
+    @property
+    def ok(self) -> bool:
+        """Whether the check completed and produced a value."""
+        return self.error is None
+
 
 @dataclass
 class HealthStatus:
@@ -23,6 +83,8 @@ class HealthStatus:
     issues: list[str] = field(default_factory=list)
     connection_stats: Optional[Dict[str, Any]] = None
     signal_quality: Optional[Dict[str, Any]] = None
+    latency: Optional[Dict[str, Any]] = None
+    checks: Dict[str, CheckResult] = field(default_factory=dict)
 
     def __str__(self) -> str:
         """String representation."""
@@ -31,7 +93,21 @@ class HealthStatus:
 
 
 class HealthMonitor:
-    """Monitor connection health and trigger callbacks."""
+    """
+    Monitor connection health and trigger callbacks.
+
+    A health check runs link state, IP address, connectivity probes, signal
+    and registration as independent tasks that run concurrently, each with
+    its own timeout (`check_timeouts`) and all within `check_deadline`. A
+    check therefore takes as long as its slowest probe, and a probe that
+    times out is reported as such while the other results still count.
+
+    While monitoring (start()), each check runs on its own drift-free
+    schedule (`check_intervals`, see CheckScheduler) and the status is
+    re-evaluated from the latest result of every check whenever one
+    completes, so link loss is noticed within about a second while the
+    modem is queried only every 30 s.
+    """
 
     def __init__(
         self,
@@ -39,6 +115,17 @@ class HealthMonitor:
         interface: str = "usb0",
         check_interval: int = 60,
         failure_threshold: int = 3,
+        signal_window: int = 5,
+        min_rssi: float = -110,
+        store: Optional[MetricStore] = None,
+        max_loss: float = 0.05,
+        max_latency: Optional[float] = None,
+        latency_window: float = DEFAULT_LATENCY_WINDOW,
+        check_timeouts: Optional[Dict[str, float]] = None,
+        check_deadline: float = DEFAULT_CHECK_DEADLINE,
+        check_intervals: Optional[Dict[str, float]] = None,
+        check_jitter: float = DEFAULT_CHECK_JITTER,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize health monitor.
@@ -46,19 +133,68 @@ class HealthMonitor:
         Args:
             manager: RM530Manager instance
             interface: Network interface to monitor
-            check_interval: Seconds between health checks
-            failure_threshold: Number of consecutive failures before alerting
+            check_interval: Longest interval between runs of any check while monitoring;
+                also how often results are recorded and failure alerts repeat
+            failure_threshold: Number of consecutive failed checks before alerting
+                (while monitoring, failed check_interval rounds)
+            signal_window: Number of signal samples the signal decision is based on
+            min_rssi: Median RSSI (dBm) below which the signal counts as poor
+            store: MetricStore to record check results and interface counters in
+            max_loss: Probe loss fraction above which the link counts as unhealthy
+            max_latency: p95 RTT (ms) above which the link counts as unhealthy (None: no limit)
+            latency_window: Seconds of latency probes each check is judged on
+            check_timeouts: Per-check timeouts in seconds, overriding DEFAULT_CHECK_TIMEOUTS
+            check_deadline: Seconds after which a health check returns regardless
+            check_intervals: Per-check intervals in seconds, overriding DEFAULT_CHECK_INTERVALS
+            check_jitter: Largest random delay of a scheduled check, as a fraction
+                of its interval
+            clock: Monotonic time source of the monitoring schedule
         """
         self.manager = manager
         self.interface = interface
         self.check_interval = check_interval
         self.failure_threshold = failure_threshold
+        self.min_rssi = min_rssi
+        self.signal_stats = SignalStatistics(window=signal_window)
+        self.store = store
+        self.max_loss = max_loss
+        self.max_latency = max_latency
+        self.latency_window = latency_window
+        self._sampler: Optional[SignalSampler] = None
+        self._latency: Optional[LatencyProber] = None
+        self.check_timeouts = {**DEFAULT_CHECK_TIMEOUTS, **(check_timeouts or {})}
+        self.check_deadline = check_deadline
+        self.check_intervals = {
+            name: min(interval, check_interval)
+            for name, interval in {**DEFAULT_CHECK_INTERVALS, **(check_intervals or {})}.items()
+        }
+        self.check_jitter = check_jitter
+        self.clock = clock
+        self._check_functions: Dict[str, Callable[[], Any]] = {
+            "link": self._check_link,
+            "ip": self._check_ip,
+            "connectivity": self._check_connectivity,
+            "signal": self._check_signal,
+            "registration": self._check_registration,
+        }
+        # Checks run on worker threads; one still running from an earlier health
+        # check is awaited again instead of being started a second time
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._results: Dict[str, CheckResult] = {}  # Latest result per check
+        # Reading of the signal check not yet written to the store's signal series
+        self._signal_reading: Optional[SignalQuality] = None
+        self._next_record = 0.0  # Monotonic times for the monitoring loop
+        self._next_alert = 0.0
 
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._last_status: Optional[HealthStatus] = None
         self._callbacks: list[Callable[[HealthStatus], None]] = []
         self._lock = threading.Lock()
+        # Set on the monitoring loop (see _wake_up()) to run every check now
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
 
     def start(self) -> None:
         """Start health monitoring in background thread."""
@@ -77,8 +213,13 @@ class HealthMonitor:
             return
 
         self._running = False
+        self._wake_up()
         if self._thread:
             self._thread.join(timeout=5)
+        if self._executor is not None:
+            # A check stuck on the modem finishes in the background
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("Health monitor stopped")
 
     def add_callback(self, callback: Callable[[HealthStatus], None]) -> None:
@@ -97,10 +238,136 @@ class HealthMonitor:
             if callback in self._callbacks:
                 self._callbacks.remove(callback)
 
+    def watch_urcs(self, urcs: URCDispatcher) -> None:
+        """
+        Check health immediately when the modem reports registration loss or a reboot.
+
+        Args:
+            urcs: URC dispatcher of a modem whose reader is running
+                (see RM530Manager.events())
+        """
+        urcs.subscribe(self._on_urc, REGISTRATION_URCS | {"RDY"})
+
+    def attach_sampler(self, sampler: SignalSampler) -> None:
+        """
+        Base signal decisions on a running sampler instead of one reading per check.
+
+        Args:
+            sampler: SignalSampler feeding signal_stats
+        """
+        self._sampler = sampler
+        sampler.add_listener(self.signal_stats.add)
+
+    def attach_latency(self, prober: LatencyProber) -> None:
+        """
+        Report and judge latency, jitter and loss from a running latency prober.
+
+        Args:
+            prober: LatencyProber probing over the monitored interface
+        """
+        self._latency = prober
+
+    def _on_urc(self, urc: URC) -> None:
+        """Wake the monitoring loop on relevant modem events."""
+        state = urc.registration_state
+        if urc.name == "RDY" or (state is not None and state not in REGISTERED_STATES):
+            logger.info(f"Modem event {urc.line!r}, checking health now")
+            self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Make the monitoring loop run every check now (callable from any thread)."""
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
     def check_health(self) -> HealthStatus:
         """
         Perform a health check.
 
+        Runs the checks concurrently (see check_health_async()) and blocks
+        until all finished or timed out. Called from a thread that already
+        runs an event loop, the checks get their own loop on a worker thread.
+
+        Returns:
+            HealthStatus object
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_health_async())
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rm530-health") as pool:
+            return pool.submit(lambda: asyncio.run(self.check_health_async())).result()
+
+    async def check_health_async(self) -> HealthStatus:
+        """
+        Perform a health check from an asyncio event loop.
+
+        Returns:
+            HealthStatus object
+        """
+        results = await self.run_checks(HEALTH_CHECKS)
+        with self._lock:
+            self._results.update(results)
+        return self._evaluate(results)
+
+    async def run_checks(self, names: Iterable[str]) -> Dict[str, CheckResult]:
+        """
+        Run checks concurrently, each bounded by its timeout and check_deadline.
+
+        Args:
+            names: Checks to run (see HEALTH_CHECKS)
+
+        Returns:
+            CheckResult per check name; timed out checks have timed_out set
+        """
+        deadline = time.monotonic() + self.check_deadline
+        names = list(names)
+        results = await asyncio.gather(*(self._run_check(name, deadline) for name in names))
+        return dict(zip(names, results))
+
+    async def _run_check(self, name: str, deadline: float) -> CheckResult:
+        """Run one check on a worker thread and wait for it until its timeout."""
+        start = time.monotonic()
+        timeout = max(0.0, min(self.check_timeouts[name], deadline - start))
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(HEALTH_CHECKS), thread_name_prefix="rm530-health"
+                )
+            future = self._inflight.get(name)
+            if future is None or future.done():
+                future = self._executor.submit(self._check_functions[name])
+                self._inflight[name] = future
+
+        try:
+            value = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Health check '{name}' timed out after {timeout:.1f}s")
+            return CheckResult(
+                name,
+                error=f"timed out after {timeout:.1f}s",
+                timed_out=True,
+                duration=time.monotonic() - start,
+            )
+        except Exception as e:
+            return CheckResult(name, error=str(e), duration=time.monotonic() - start)
+        return CheckResult(name, value=value, duration=time.monotonic() - start)
+
+    def _evaluate(
+        self, results: Dict[str, CheckResult], record: bool = True, new_round: bool = True
+    ) -> HealthStatus:
+        """
+        Judge check results and update the last status.
+
+        Args:
+            results: CheckResult per check name (checks not run are skipped)
+            record: Append the status to the store (if any)
+            new_round: Count a failure towards consecutive_failures; while
+                monitoring, only once per check_interval
+
         Returns:
             HealthStatus object
         """
@@ -108,65 +375,98 @@ class HealthMonitor:
         is_healthy = True
         connection_stats = None
         signal_quality = None
-
-        try:
-            # Check connection status
-            stats = self.manager.status(self.interface)
-            connection_stats = {
-                "is_connected": stats.is_connected,
-                "ip_address": stats.ip_address,
-                "bytes_sent": stats.bytes_sent,
-                "bytes_received": stats.bytes_received,
-            }
-
-            if not stats.is_connected:
+        latency = None
+        stats: Optional[ConnectionStats] = None
+
+        link = results.get("link")
+        if link is not None:
+            if link.ok:
+                link_stats: ConnectionStats = link.value
+                stats = link_stats
+                connection_stats = {
+                    "is_connected": link_stats.is_connected,
+                    "ip_address": link_stats.ip_address,
+                    "bytes_sent": link_stats.bytes_sent,
+                    "bytes_received": link_stats.bytes_received,
+                    "rx_rate": link_stats.rates.rx_bytes if link_stats.rates else None,
+                    "tx_rate": link_stats.rates.tx_bytes if link_stats.rates else None,
+                    "uptime": link_stats.uptime.total_seconds() if link_stats.uptime else None,
+                }
+                if not link_stats.is_connected:
+                    is_healthy = False
+                    issues.append("Connection not active")
+            else:
+                logger.error(f"Link check failed: {link.error}")
                 is_healthy = False
-                issues.append("Connection not active")
-
-            if stats.is_connected and not stats.ip_address:
+                issues.append(f"Health check error: {link.error}")
+
+        connected = stats is not None and stats.is_connected
+        ip = results.get("ip")
+        if ip is not None and connected:
+            if ip.ok and connection_stats is not None:
+                connection_stats["ip_address"] = ip.value
+            if not ip.ok:
+                is_healthy = False
+                issues.append(f"IP address check failed: {ip.error}")
+            elif not ip.value:
                 is_healthy = False
                 issues.append("No IP address assigned")
 
-            # Check internet connectivity
-            if stats.is_connected:
-                try:
-                    if not self.manager.verify():
-                        is_healthy = False
-                        issues.append("Internet connectivity failed")
-                except Exception as e:
-                    logger.warning(f"Failed to verify internet connectivity: {e}")
+        # Probes cannot pass without a link; that is already reported above
+        connectivity = results.get("connectivity")
+        if connectivity is not None and connected:
+            if not connectivity.ok:
+                logger.warning(f"Failed to verify internet connectivity: {connectivity.error}")
+                is_healthy = False
+                issues.append(f"Connectivity check failed: {connectivity.error}")
+            elif not connectivity.value:
+                is_healthy = False
+                issues.append("Internet connectivity failed")
+
+        # Signal and registration need the modem (and may require root);
+        # not critical if they cannot be read
+        signal = results.get("signal")
+        if signal is not None:
+            if signal.ok:
+                signal_quality = signal.value
+                rssi = self.signal_stats.summary("rssi")
+
+                # Judge the signal on the window median, not one noisy reading
+                if rssi.p50 is not None and rssi.p50 < self.min_rssi:
                     is_healthy = False
-                    issues.append(f"Connectivity check failed: {e}")
-
-            # Try to get signal quality (may require root)
-            try:
-                signal = self.manager.signal_quality()
-                signal_quality = {
-                    "rssi": signal.rssi,
-                    "rsrp": signal.rsrp,
-                    "network_type": signal.network_type,
-                }
+                    issues.append(f"Poor signal strength: {rssi.p50:.0f} dBm (median)")
+            else:
+                logger.debug(f"Could not check signal quality: {signal.error}")
 
-                # Check signal strength
-                if signal.rssi is not None and signal.rssi < -110:
+        registration = results.get("registration")
+        if registration is not None:
+            if registration.ok and registration.value is not None:
+                if not registration.value.registered:
                     is_healthy = False
-                    issues.append(f"Poor signal strength: {signal.rssi} dBm")
-            except Exception as e:
-                logger.debug(f"Could not check signal quality: {e}")
-                # Not critical if we can't check signal
-
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            is_healthy = False
-            issues.append(f"Health check error: {e}")
+                    issues.append(
+                        f"Not registered on the network (state {registration.value.state})"
+                    )
+            elif not registration.ok:
+                logger.debug(f"Could not check registration: {registration.error}")
+
+        if self._latency is not None:
+            summary = self._latency.summary(self.latency_window)
+            latency = {"target": str(self._latency.target), **summary.as_dict()}
+            if summary.loss is not None and summary.loss > self.max_loss:
+                is_healthy = False
+                issues.append(f"Packet loss: {summary.loss * 100:.1f}%")
+            if (
+                self.max_latency is not None
+                and summary.rtt_p95 is not None
+                and summary.rtt_p95 > self.max_latency
+            ):
+                is_healthy = False
+                issues.append(f"High latency: {summary.rtt_p95:.0f} ms (p95)")
 
         # Determine consecutive failures
         consecutive_failures = 0
-        if self._last_status:
-            if is_healthy:
-                consecutive_failures = 0
-            else:
-                consecutive_failures = self._last_status.consecutive_failures + 1
+        if self._last_status and not is_healthy:
+            consecutive_failures = self._last_status.consecutive_failures + int(new_round)
 
         status = HealthStatus(
             is_healthy=is_healthy,
@@ -175,50 +475,177 @@ class HealthMonitor:
             issues=issues,
             connection_stats=connection_stats,
             signal_quality=signal_quality,
+            latency=latency,
+            checks=results,
         )
 
         with self._lock:
             self._last_status = status
 
-        return status
+        if record:
+            self._record(status, stats)
 
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
-        logger.info("Health monitoring loop started")
-
-        while self._running:
-            try:
-                status = self.check_health()
+        return status
 
-                # Call callbacks if status changed or threshold reached
-                previous_healthy = (
-                    self._last_status.is_healthy
-                    if self._last_status and hasattr(self._last_status, "is_healthy")
-                    else True
-                )
+    def _check_link(self) -> ConnectionStats:
+        """Read link state, counters and rates of the interface."""
+        return self.manager.status(self.interface)
+
+    def _check_ip(self) -> Optional[str]:
+        """Read the interface's IPv4 address."""
+        return self.manager.network.get_interface_ip(self.interface)
+
+    def _check_connectivity(self) -> bool:
+        """Probe the configured targets over the interface; True if any answered."""
+        results = self.manager.probe(self.interface)
+        for result in results:
+            logger.debug(f"Connectivity probe: {result}")
+        return any(result.ok for result in results)
+
+    def _check_registration(self) -> Optional[Registration]:
+        """Read network registration from the modem."""
+        return self.manager.registration()
+
+    def _record(self, status: HealthStatus, stats: Optional[ConnectionStats]) -> None:
+        """Append a check result (and the interface counters and signal) to the store."""
+        store = self.store
+        if store is None:
+            return
+        signal, self._signal_reading = self._signal_reading, None
+        try:
+            if stats is not None:
+                store.record_stats(stats)
+            if signal is not None:
+                store.record_signal(signal)
+            store.record_health(
+                status.is_healthy,
+                status.consecutive_failures,
+                len(status.issues),
+                status.signal_quality,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record health status: {e}")
 
-                status_changed = status.is_healthy != previous_healthy
-                threshold_reached = (
-                    not status.is_healthy and status.consecutive_failures >= self.failure_threshold
-                )
+    def _check_signal(self) -> Dict[str, Any]:
+        """
+        Record the current signal (unless a sampler does) and summarize the window.
 
-                if status_changed or threshold_reached:
-                    with self._lock:
-                        callbacks = self._callbacks.copy()
+        Returns:
+            Signal quality dictionary for HealthStatus
+        """
+        network_type = None
+        if self._sampler is None:
+            signal = self.manager.signal_quality()
+            network_type = signal.network_type
+            self._signal_reading = signal
+            self.signal_stats.add(
+                time.time(),
+                {
+                    "rssi": signal.rssi,
+                    "rsrp": signal.rsrp,
+                    "rsrq": signal.rsrq,
+                    "sinr": signal.sinr,
+                },
+            )
+
+        rssi = self.signal_stats.summary("rssi")
+        rsrp = self.signal_stats.summary("rsrp")
+        return {
+            "rssi": rssi.p50,
+            "rsrp": rsrp.p50,
+            "network_type": network_type,
+            "rssi_p5": rssi.p5,
+            "rssi_slope": rssi.slope,
+            "rsrp_p5": rsrp.p5,
+            "samples": rssi.count,
+        }
 
-                    for callback in callbacks:
-                        try:
-                            callback(status)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
+    def _monitor_loop(self) -> None:
+        """Background monitoring thread."""
+        logger.info("Health monitoring loop started")
+        try:
+            asyncio.run(self._schedule_checks())
+        except Exception as e:
+            logger.error(f"Error in monitoring loop: {e}")
 
-                logger.debug(f"Health check: {status}")
+    async def _schedule_checks(self) -> None:
+        """Run each check on its own schedule until stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        scheduler = self._make_scheduler()
+        self._next_record = self._next_alert = self.clock()
+        running: Dict[str, "asyncio.Future[None]"] = {}
 
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
+        try:
+            while self._running:
+                due = scheduler.pop_due()
+                if self._wake.is_set():
+                    # Modem events (see watch_urcs()) run every check now
+                    self._wake.clear()
+                    due = list(HEALTH_CHECKS)
+                for name in due:
+                    # A check still running when it is due again is not queued twice
+                    task = running.get(name)
+                    if task is None or task.done():
+                        running[name] = asyncio.ensure_future(self._run_scheduled(name))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), scheduler.delay())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in running.values():
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+            self._loop = self._wake = None
+
+    def _make_scheduler(self) -> CheckScheduler:
+        """Scheduler running every check on its interval."""
+        scheduler = CheckScheduler(clock=self.clock)
+        for name in HEALTH_CHECKS:
+            scheduler.add(name, self.check_intervals[name], jitter=self.check_jitter)
+        return scheduler
+
+    async def _run_scheduled(self, name: str) -> None:
+        """Run one scheduled check and re-evaluate health with the latest results."""
+        try:
+            result = await self._run_check(name, time.monotonic() + self.check_deadline)
+            with self._lock:
+                self._results[name] = result
+                results = dict(self._results)
+                previous = self._last_status
+
+            # A round ends at most every check_interval, once every check has
+            # reported; it is recorded and counts one failure if unhealthy
+            now = self.clock()
+            new_round = len(results) == len(HEALTH_CHECKS) and now >= self._next_record
+            if new_round:
+                self._next_record = now + self.check_interval
+            status = self._evaluate(results, record=new_round, new_round=new_round)
+
+            # Call callbacks if status changed, and while failing every check_interval
+            status_changed = status.is_healthy != (previous.is_healthy if previous else True)
+            alert = (
+                not status.is_healthy
+                and status.consecutive_failures >= self.failure_threshold
+                and now >= self._next_alert
+            )
+            if alert:
+                self._next_alert = now + self.check_interval
+
+            if status_changed or alert:
+                with self._lock:
+                    callbacks = self._callbacks.copy()
+
+                for callback in callbacks:
+                    try:
+                        callback(status)
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
+
+            logger.debug(f"Health check ({name}): {status}")
 
-            # Wait for next check
-            time.sleep(self.check_interval)
+        except Exception as e:
+            logger.error(f"Error in monitoring loop: {e}")
 
     def get_last_status(self) -> Optional[HealthStatus]:
         """Get last health status."""
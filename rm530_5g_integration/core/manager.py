@@ -1,15 +1,28 @@
 """Main manager class for RM530 5G operations."""
 
 import subprocess
-import time
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, List, Optional, Sequence
 
 from rm530_5g_integration.config import ConfigLoader
+from rm530_5g_integration.core.broker import DEFAULT_BROKER_SOCKET, broker_available
 from rm530_5g_integration.core.modem import Modem, find_modem
 from rm530_5g_integration.core.network import NetworkManager as NMManager
+from rm530_5g_integration.core.parsers import Registration, parse_registration
+from rm530_5g_integration.core.probe import (
+    DEFAULT_PROBE_TARGETS,
+    DEFAULT_PROBE_TIMEOUT,
+    Prober,
+    ProbeResult,
+)
+from rm530_5g_integration.core.readiness import DEFAULT_READY_TIMEOUT, ReadinessWaiter
+from rm530_5g_integration.core.urc import URCDispatcher
 from rm530_5g_integration.monitoring import (
     ConnectionStats,
+    LatencyProber,
+    RateTracker,
     SignalQuality,
+    SignalSampler,
     get_connection_stats,
     get_signal_quality,
 )
@@ -18,6 +31,9 @@ from rm530_5g_integration.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 5G SA registration first; EN-DC and LTE register through EPS
+REGISTRATION_COMMANDS = ("AT+C5GREG?", "AT+CEREG?")
+
 
 class RM530Manager:
     """
@@ -46,6 +62,8 @@ class RM530Manager:
         self.network = NMManager()
         self._defaults = self.config.get_defaults()
         self._modem_settings = self.config.get_modem_settings()
+        self._rate_trackers: Dict[str, RateTracker] = {}
+        self._modem_lock = threading.Lock()
 
     def setup(
         self,
@@ -87,18 +105,24 @@ class RM530Manager:
         try:
             # Step 1: Switch to ECM mode
             logger.info(f"Switching modem to ECM mode with APN: {apn}")
-            self.modem = Modem(baudrate=self._modem_settings["at_baudrate"])
-            self.modem.connect()
+            self.modem = self._open_modem()
 
-            if not self.modem.switch_to_ecm_mode(apn=apn):
-                logger.error("Failed to switch to ECM mode")
-                return False
+            with self._readiness_waiter(interface) as waiter:
+                if not self.modem.switch_to_ecm_mode(apn=apn):
+                    logger.error("Failed to switch to ECM mode")
+                    return False
 
-            self.modem.disconnect()
+                self.modem.disconnect()
 
-            if wait_restart:
-                logger.info("Waiting for modem to restart (15 seconds)...")
-                time.sleep(15)
+                if wait_restart and self.modem.reset_issued:
+                    timeout = self._modem_settings.get("ready_timeout", DEFAULT_READY_TIMEOUT)
+                    logger.info(f"Waiting for modem to restart (up to {timeout} seconds)...")
+                    result = waiter.wait(timeout=timeout)
+                    if not result.ready:
+                        # NetworkManager cannot bind a connection to a missing interface
+                        logger.error(f"Modem {result}")
+                        return False
+                    logger.info(f"Modem {result}")
 
             # Step 2: Configure NetworkManager
             carrier_config = self.config.get_carrier_config(carrier) if carrier else {}
@@ -126,6 +150,69 @@ class RM530Manager:
             logger.error(f"Setup failed: {e}")
             raise RM530Error(f"Setup failed: {e}")
 
+    def _open_modem(self) -> Modem:
+        """
+        Open a modem session, through the AT broker when one is running.
+
+        Returns:
+            Connected Modem instance
+        """
+        socket_path = self._modem_settings.get("broker_socket", DEFAULT_BROKER_SOCKET)
+        if socket_path and broker_available(socket_path):
+            logger.debug(f"Using AT broker at {socket_path}")
+            modem = Modem(broker=socket_path)
+        else:
+            modem = Modem(baudrate=self._modem_settings["at_baudrate"])
+        modem.connect()
+        return modem
+
+    def _connected_modem(self) -> Modem:
+        """
+        Get the manager's modem session, opening it on first use.
+
+        Safe to call from several threads (e.g. concurrent health checks).
+
+        Returns:
+            Connected Modem instance
+        """
+        with self._modem_lock:
+            if not self.modem or not self.modem.is_connected:
+                self.modem = self._open_modem()
+            return self.modem
+
+    def _readiness_waiter(self, interface: str) -> ReadinessWaiter:
+        """
+        Create a waiter for the modem restart that follows the ECM switch.
+
+        Args:
+            interface: Network interface expected after the restart
+
+        Returns:
+            ReadinessWaiter (arm it before the reset is issued)
+        """
+        assert self.modem is not None
+        if self.modem.broker:
+            socket_path = self.modem.broker
+
+            # The broker owns the port; check readiness through it
+            def at_check(port: str) -> bool:
+                modem = Modem(broker=socket_path)
+                try:
+                    modem.connect()
+                    return modem.send_command("AT", timeout=2)
+                except RM530Error:
+                    return False
+                finally:
+                    modem.disconnect()
+
+            return ReadinessWaiter(interface=interface, at_check=at_check)
+
+        return ReadinessWaiter(
+            port=self.modem.port,
+            interface=interface,
+            baudrate=self._modem_settings["at_baudrate"],
+        )
+
     def status(self, interface: str = "usb0") -> ConnectionStats:
         """
         Get current connection status.
@@ -133,10 +220,14 @@ class RM530Manager:
         Args:
             interface: Network interface name
 
+        Repeated calls on the same manager also fill in throughput rates
+        (since the previous call) and uptime.
+
         Returns:
             ConnectionStats object
         """
-        return get_connection_stats(interface)
+        tracker = self._rate_trackers.setdefault(interface, RateTracker())
+        return tracker.update(get_connection_stats(interface))
 
     def signal_quality(self) -> SignalQuality:
         """
@@ -145,15 +236,46 @@ class RM530Manager:
         Returns:
             SignalQuality object
         """
-        if not self.modem:
-            self.modem = Modem(baudrate=self._modem_settings["at_baudrate"])
-            self.modem.connect()
+        return get_signal_quality(self._connected_modem())
 
-        try:
-            return get_signal_quality(self.modem)
-        finally:
-            # Don't disconnect if we didn't create the connection
-            pass
+    def registration(self) -> Optional[Registration]:
+        """
+        Get network registration.
+
+        Returns:
+            Registration (5G if registered there, else EPS), or None if not reported
+        """
+        responses = self._connected_modem().execute_batch(REGISTRATION_COMMANDS, timeout=3)
+        parsed = [parse_registration(response) for response in responses]
+        reports: List[Registration] = [report for report in parsed if report is not None]
+        for report in reports:
+            if report.registered:
+                return report
+        return reports[0] if reports else None
+
+    def sampler(self, rate_hz: float = 1.0, capacity: int = 86400) -> SignalSampler:
+        """
+        Create a signal sampler on the manager's modem connection.
+
+        Args:
+            rate_hz: Samples per second
+            capacity: Number of samples kept in the ring buffer
+
+        Returns:
+            SignalSampler (call start() to begin sampling)
+        """
+        return SignalSampler(self._connected_modem(), rate_hz=rate_hz, capacity=capacity)
+
+    def events(self) -> URCDispatcher:
+        """
+        Get the modem's URC dispatcher, starting its background reader.
+
+        Returns:
+            URCDispatcher delivering unsolicited modem events
+        """
+        modem = self._connected_modem()
+        modem.start_reader()
+        return modem.urcs
 
     def disconnect(self) -> bool:
         """
@@ -183,24 +305,73 @@ class RM530Manager:
         connection_name = self._defaults.get("connection_name", "RM530-5G-ECM")
         return self.network.activate_connection(connection_name)
 
-    def verify(self) -> bool:
+    def probe(
+        self,
+        interface: str = "usb0",
+        targets: Optional[Sequence[str]] = None,
+        count: int = 1,
+    ) -> List[ProbeResult]:
+        """
+        Probe connectivity through an interface.
+
+        Args:
+            interface: Network interface to send probes on
+            targets: Probe targets (default: `probe_targets` setting, see ProbeTarget.parse)
+            count: Probes per target
+
+        Returns:
+            One ProbeResult per target
+        """
+        if targets is None:
+            targets = self._defaults.get("probe_targets", DEFAULT_PROBE_TARGETS)
+        prober = Prober(
+            interface=interface,
+            timeout=self._defaults.get("probe_timeout", DEFAULT_PROBE_TIMEOUT),
+            count=count,
+        )
+        return prober.probe(targets)
+
+    def latency_prober(
+        self, interface: str = "usb0", target: Optional[str] = None, rate_hz: float = 5.0
+    ) -> LatencyProber:
+        """
+        Create a continuous latency prober on an interface.
+
+        Args:
+            interface: Network interface to send probes on
+            target: Probe target (default: first `probe_targets` setting)
+            rate_hz: Probes per second
+
+        Returns:
+            LatencyProber (call start() to begin probing)
+        """
+        if target is None:
+            target = self._defaults.get("probe_targets", DEFAULT_PROBE_TARGETS)[0]
+        return LatencyProber(
+            target,
+            interface=interface,
+            rate_hz=rate_hz,
+            timeout=self._defaults.get("probe_timeout", DEFAULT_PROBE_TIMEOUT),
+        )
+
+    def verify(self, interface: str = "usb0") -> bool:
         """
         Verify connection is working.
 
+        Probes the configured targets over the interface itself, so the
+        check covers the cellular link and not the default route.
+
+        Args:
+            interface: Network interface name
+
         Returns:
-            True if connection is active
+            True if connection is active and any target answered
         """
-        stats = self.status()
+        stats = self.status(interface)
         if not stats.is_connected or not stats.ip_address:
             return False
 
-        # Try to ping a reliable server
-        import subprocess
-
-        try:
-            result = subprocess.run(
-                ["ping", "-c", "1", "-W", "2", "8.8.8.8"], capture_output=True, check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        results = self.probe(interface)
+        for result in results:
+            logger.debug(f"Connectivity probe: {result}")
+        return any(result.ok for result in results)
@@ -2,11 +2,33 @@
 
 import glob
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import serial
 
+from rm530_5g_integration.core.at import (
+    ATResponse,
+    LineReader,
+    ResponseCollector,
+    chain_commands,
+    is_final_result,
+    split_chained_response,
+)
+from rm530_5g_integration.core.broker import BrokerClient
+from rm530_5g_integration.core.discovery import (
+    HOTPLUG_SUBSYSTEMS,
+    HotplugWatcher,
+    PortCache,
+    UEvent,
+    at_port_candidates,
+    list_usb_serial_ports,
+    topology_key,
+)
+from rm530_5g_integration.core.parsers import parse_cgdcont, parse_qcfg
+from rm530_5g_integration.core.urc import URCDispatcher, is_urc
 from rm530_5g_integration.utils.exceptions import (
     ModemNotFoundError,
     SerialCommunicationError,
@@ -15,11 +37,43 @@ from rm530_5g_integration.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Connection handshake: retry a short AT instead of sleeping after open
+HANDSHAKE_ATTEMPTS = 3
+HANDSHAKE_TIMEOUT = 1.0
+
+# Longest single read while waiting for a response; the port is configured
+# with it once per command and the deadline is enforced between reads
+READ_POLL_TIMEOUT = 0.05
+
+# Port discovery: per-port probe timeout and maximum concurrent probes
+PROBE_TIMEOUT = 1.0
+MAX_PROBE_WORKERS = 8
+
+# ECM configuration: queries reading the current state, and the target values
+ECM_STATE_COMMANDS = ('AT+QCFG="usbnet"', 'AT+QCFG="data_interface"', "AT+CGDCONT?")
+ECM_USBNET = ["1"]
+ECM_DATA_INTERFACE = ["0", "0"]
+ECM_PDP_CID = 1
+ECM_PDP_TYPE = "IP"
+
+# find_modem() results keyed by USB serial topology
+_port_cache: Dict[Tuple[Any, ...], str] = {}
+
+# Persistent port cache and the hotplug watcher that invalidates it
+_persistent_cache: Optional[PortCache] = None
+_hotplug_watcher: Optional[HotplugWatcher] = None
+
 
 class Modem:
     """Handle communication with RM530 modem via AT commands."""
 
-    def __init__(self, port: Optional[str] = None, baudrate: int = 115200, timeout: int = 2):
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        baudrate: int = 115200,
+        timeout: int = 2,
+        broker: Optional[str] = None,
+    ):
         """
         Initialize modem connection.
 
@@ -27,11 +81,32 @@ class Modem:
             port: Serial port path (auto-detect if None)
             baudrate: Serial baudrate
             timeout: Serial timeout in seconds
+            broker: AT broker socket path; when set, commands go through the
+                broker instead of opening the serial port (client mode)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.broker = broker
         self.serial: Optional[serial.Serial] = None
+        self.urcs = URCDispatcher()
+        self.reset_issued = False  # Set by switch_to_ecm_mode()
+        self._client: Optional[BrokerClient] = None
+        self._command_lock = threading.Lock()  # One command on the port at a time
+
+        # Background reader state (see start_reader())
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_running = False
+        self._pending_lock = threading.Lock()
+        self._pending: Optional[ResponseCollector] = None
+        self._response_ready = threading.Event()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the modem (or broker) connection is open."""
+        if self._client is not None:
+            return self._client.is_connected
+        return bool(self.serial and self.serial.is_open)
 
     def connect(self) -> bool:
         """
@@ -40,6 +115,12 @@ class Modem:
         Returns:
             True if connected successfully
         """
+        if self.broker:
+            logger.debug(f"Connecting to AT broker at {self.broker}")
+            self._client = BrokerClient(self.broker)
+            self._client.connect()
+            return True
+
         if self.port is None:
             self.port = find_modem()
             if self.port is None:
@@ -48,77 +129,135 @@ class Modem:
         try:
             logger.info(f"Connecting to modem at {self.port}")
             self.serial = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
-            time.sleep(0.5)
 
-            # Test communication
-            if not self.send_command("AT"):
-                raise SerialCommunicationError("No response from modem")
+            # Test communication; the first command after open may be eaten while
+            # the port settles, so retry the handshake instead of sleeping up front
+            for _ in range(HANDSHAKE_ATTEMPTS):
+                if self.send_command("AT", timeout=HANDSHAKE_TIMEOUT):
+                    return True
 
-            return True
+            raise SerialCommunicationError("No response from modem")
         except serial.SerialException as e:
             raise SerialCommunicationError(f"Failed to connect: {e}")
 
     def disconnect(self) -> None:
         """Close modem connection."""
+        self.stop_reader()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            return
         if self.serial and self.serial.is_open:
             self.serial.close()
             logger.info("Disconnected from modem")
 
-    def send_command(self, command: str, expected: str = "OK", timeout: int = 5) -> bool:
+    def execute(self, command: str, timeout: float = 5) -> ATResponse:
         """
-        Send AT command to modem.
+        Send AT command and collect its response.
+
+        Returns as soon as a final result code (OK, ERROR, +CME ERROR, ...)
+        is received, or when the timeout expires.
 
         Args:
             command: AT command to send
-            expected: Expected response string (default: "OK")
             timeout: Command timeout in seconds
 
         Returns:
-            True if command succeeded
+            ATResponse with information lines and final result code
         """
+        if self._client is not None:
+            with self._command_lock:
+                return self._client.request(command, timeout=timeout)
         if not self.serial or not self.serial.is_open:
             raise SerialCommunicationError("Modem not connected")
 
         try:
-            # Send command
-            self.serial.write(f"{command}\r\n".encode())
-            self.serial.flush()
-            time.sleep(0.3)
-
-            # Read response
-            start_time = time.time()
-            response = b""
-            while time.time() - start_time < timeout:
-                if self.serial.in_waiting:
-                    response += self.serial.read(self.serial.in_waiting)
-                    time.sleep(0.1)
-                else:
-                    time.sleep(0.1)
-
-                # Check for complete response
-                response_str = response.decode("utf-8", errors="ignore")
-                if expected == "" or expected in response_str or "ERROR" in response_str:
-                    break
-
-            response_str = response.decode("utf-8", errors="ignore")
-            logger.debug(f"AT Command: {command} -> Response: {response_str.strip()}")
-
-            # Check response
-            if expected == "":
-                return True
-            if expected in response_str:
-                return True
-            if "ERROR" in response_str:
-                logger.error(f"Modem returned ERROR for command: {command}")
-                return False
-
-            return False
-
+            if self._reader_thread is not None:
+                response = self._execute_via_reader(command, timeout)
+            else:
+                with self._command_lock:
+                    discard_input(self.serial, self.urcs.dispatch_line)
+                    self._write(command)
+                    response = read_response(
+                        self.serial, command, time.monotonic() + timeout, self.urcs.dispatch_line
+                    )
         except Exception as e:
             logger.error(f"Error sending AT command: {e}")
             raise SerialCommunicationError(f"Command failed: {e}")
 
-    def get_response(self, command: str, timeout: int = 5) -> str:
+        logger.debug(f"AT Command: {command} -> Response: {response.raw.strip()}")
+        if response.timed_out:
+            logger.warning(f"Timed out waiting for response to: {command}")
+        return response
+
+    def execute_batch(
+        self, commands: Sequence[str], timeout: float = 5, chain: bool = True
+    ) -> List[ATResponse]:
+        """
+        Execute several AT commands with as few round trips as possible.
+
+        Compatible commands are joined into one ';'-chained line and the
+        response is split per command. If the chained line fails (ERROR aborts
+        the rest of a chain), or the commands cannot be chained, they are sent
+        back to back on the open port instead.
+
+        Args:
+            commands: AT commands to execute
+            timeout: Timeout in seconds for the chained line or each command
+            chain: Allow ';'-chaining (False always sends commands separately)
+
+        Returns:
+            One ATResponse per command, in order
+
+        Examples:
+            >>> csq, nwinfo = modem.execute_batch(["AT+CSQ", "AT+QNWINFO"])
+        """
+        line = chain_commands(commands) if chain else None
+        if line is not None:
+            response = self.execute(line, timeout=timeout)
+            if response.ok or response.timed_out:
+                return split_chained_response(response, commands)
+            logger.debug(f"Chained command failed ({response.final}), retrying separately")
+
+        return [self.execute(command, timeout=timeout) for command in commands]
+
+    def send_command(self, command: str, expected: str = "OK", timeout: float = 5) -> bool:
+        """
+        Send AT command to modem.
+
+        Args:
+            command: AT command to send
+            expected: Expected response string (default: "OK"); an empty string
+                sends the command without waiting for a response (e.g. reset)
+            timeout: Command timeout in seconds
+
+        Returns:
+            True if command succeeded
+        """
+        if not self.is_connected:
+            raise SerialCommunicationError("Modem not connected")
+
+        if expected == "" and self._client is not None:
+            self._client.request(command, timeout=timeout, wait=False)
+            return True
+
+        if expected == "":
+            try:
+                self._write(command)
+            except Exception as e:
+                logger.error(f"Error sending AT command: {e}")
+                raise SerialCommunicationError(f"Command failed: {e}")
+            logger.debug(f"AT Command: {command} (not waiting for response)")
+            return True
+
+        response = self.execute(command, timeout=timeout)
+
+        if response.error:
+            logger.error(f"Modem returned {response.error} for command: {command}")
+            return False
+        return expected in response.raw
+
+    def get_response(self, command: str, timeout: float = 5) -> str:
         """
         Send AT command and return response.
 
@@ -129,81 +268,145 @@ class Modem:
         Returns:
             Response string
         """
-        if not self.serial or not self.serial.is_open:
-            raise SerialCommunicationError("Modem not connected")
+        return self.execute(command, timeout=timeout).raw
 
-        try:
-            # Clear buffer
-            if self.serial.in_waiting:
-                self.serial.read(self.serial.in_waiting)
-
-            # Send command
-            self.serial.write(f"{command}\r\n".encode())
-            self.serial.flush()
-            time.sleep(0.5)
-
-            # Read response
-            start_time = time.time()
-            response = b""
-            while time.time() - start_time < timeout:
-                if self.serial.in_waiting:
-                    response += self.serial.read(self.serial.in_waiting)
-                    time.sleep(0.1)
-                else:
-                    time.sleep(0.1)
-
-                if b"\r\n" in response[-10:]:  # Check for end of response
-                    time.sleep(0.2)  # Wait a bit more
-
-            return response.decode("utf-8", errors="ignore")
+    def start_reader(self) -> None:
+        """
+        Start a background reader that routes URCs to ``self.urcs`` as they arrive.
 
-        except Exception as e:
-            logger.error(f"Error getting response: {e}")
-            raise SerialCommunicationError(f"Failed to get response: {e}")
+        While the reader runs, command responses are collected by the reader
+        thread and URCs interleaved with them are split out. Without it, URCs
+        are only delivered when the next command drains the input buffer.
+        """
+        if self._reader_thread is not None:
+            return
+        if not self.is_connected:
+            raise SerialCommunicationError("Modem not connected")
+
+        if self._client is not None:
+            self._client.subscribe(self.urcs.dispatch_line)
+            return
+
+        self._reader_running = True
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop, name="rm530-at-reader", daemon=True
+        )
+        self._reader_thread.start()
+        logger.debug("AT reader started")
+
+    def stop_reader(self) -> None:
+        """Stop the background reader."""
+        if self._client is not None:
+            self._client.unsubscribe()
+        thread = self._reader_thread
+        if thread is None:
+            return
+        self._reader_running = False
+        if self.serial is not None and hasattr(self.serial, "cancel_read"):
+            self.serial.cancel_read()
+        if thread is not threading.current_thread():
+            thread.join(timeout=self.timeout + 1)
+        self._reader_thread = None
+        logger.debug("AT reader stopped")
+
+    def _write(self, command: str) -> None:
+        """Write a command line to the port."""
+        assert self.serial is not None
+        self.serial.write(f"{command}\r\n".encode())
+        self.serial.flush()
+
+    def _execute_via_reader(self, command: str, timeout: float) -> ATResponse:
+        """Send a command and wait for the reader thread to collect its response."""
+        collector = ResponseCollector(command)
+        with self._command_lock:
+            if not self._reader_running:
+                raise SerialCommunicationError("AT reader stopped")
+            self._response_ready.clear()
+            with self._pending_lock:
+                self._pending = collector
+            try:
+                self._write(command)
+                self._response_ready.wait(timeout)
+            finally:
+                with self._pending_lock:
+                    self._pending = None
+        if collector.response.final is None and not self._reader_running:
+            raise SerialCommunicationError("AT reader stopped")
+        return collector.response
+
+    def _reader_loop(self) -> None:
+        """Background reader thread body."""
+        reader = LineReader()
+        while self._reader_running and self.serial is not None and self.serial.is_open:
+            try:
+                chunk = self.serial.read(self.serial.in_waiting or 1)
+            except (serial.SerialException, OSError) as e:
+                logger.warning(f"AT reader stopped: {e}")
+                break
+            if not chunk:
+                continue
+            with self._pending_lock:
+                if self._pending is not None:
+                    self._pending.add_raw(chunk)
+            for line in reader.feed(chunk):
+                self._route_line(line)
+
+        self._reader_running = False
+        self._response_ready.set()
+        # Later commands read the port directly (and fail there if it is gone)
+        if self._reader_thread is threading.current_thread():
+            self._reader_thread = None
+
+    def _route_line(self, line: str) -> None:
+        """Hand a line to the pending command or to URC subscribers."""
+        with self._pending_lock:
+            collector = self._pending
+            if collector is not None and not is_urc(line, collector.response.command):
+                if collector.add_line(line):
+                    self._pending = None
+                    self._response_ready.set()
+                return
+        if not is_final_result(line):
+            self.urcs.dispatch_line(line)
 
     def switch_to_ecm_mode(self, apn: Optional[str] = None) -> bool:
         """
         Switch modem to ECM mode.
 
+        The current usbnet, data_interface and PDP context settings are read
+        first; only settings that differ are written, and the modem is reset
+        only if something was written (see reset_issued).
+
         Args:
             apn: APN to configure (optional)
 
         Returns:
             True if successful
         """
-        if not self.serial or not self.serial.is_open:
+        if not self.is_connected:
             self.connect()
 
         logger.info("Switching modem to ECM mode")
+        self.reset_issued = False
 
         try:
-            # Check current mode
-            logger.debug("Checking current USB mode")
-            if not self.serial:
-                raise SerialCommunicationError("Modem not connected")
-            if self.serial.in_waiting:
-                self.serial.read(self.serial.in_waiting)
-            self.serial.write(b'AT+QCFG="usbnet"\r\n')
-            time.sleep(1)
-            response = self.serial.read(100).decode("utf-8", errors="ignore")
-            logger.debug(f"Current mode: {response.strip()}")
-
-            # Switch to ECM mode
-            if not self.send_command('AT+QCFG="usbnet",1'):
-                logger.error("Failed to set ECM mode")
-                return False
-
-            # Configure data interface
-            self.send_command('AT+QCFG="data_interface",0,0')
-
-            # Set APN if provided
-            if apn:
-                logger.info(f"Setting APN to: {apn}")
-                self.send_command(f'AT+CGDCONT=1,"IP","{apn}"')
+            # Read the current configuration; only write (and reset) what differs
+            state = self.execute_batch(ECM_STATE_COMMANDS, timeout=3)
+            commands = ecm_config_commands(state, apn)
+            if not commands:
+                logger.info("Modem already in ECM mode with the requested settings")
+                return True
+
+            for command in commands:
+                logger.info(f"Applying: {command}")
+                if not self.send_command(command):
+                    logger.error(f"Failed to apply: {command}")
+                    return False
 
             # Apply settings (reset)
             logger.info("Applying settings and resetting modem")
             self.send_command("AT+CFUN=1,1", expected="", timeout=10)
+            self.reset_issued = True
 
             logger.info("ECM mode configuration complete")
             return True
@@ -222,53 +425,265 @@ class Modem:
         self.disconnect()
 
 
-def find_modem() -> Optional[str]:
+def ecm_config_commands(state: Sequence[ATResponse], apn: Optional[str] = None) -> List[str]:
     """
-    Find the Qualcomm modem's AT command port.
+    Get the commands needed to bring the modem into ECM mode.
+
+    Settings that could not be read are treated as different.
+
+    Args:
+        state: Responses to ECM_STATE_COMMANDS, in order
+        apn: APN to configure (optional)
 
     Returns:
-        Port path if found, None otherwise
+        Write commands for the settings that differ (empty if none do)
     """
-    ports = glob.glob("/dev/ttyUSB*")
+    usbnet_response, data_interface_response, cgdcont_response = state
+    commands = []
+
+    usbnet = parse_qcfg(usbnet_response, "usbnet")
+    if usbnet is None or usbnet.values != ECM_USBNET:
+        commands.append(f'AT+QCFG="usbnet",{",".join(ECM_USBNET)}')
+
+    data_interface = parse_qcfg(data_interface_response, "data_interface")
+    if data_interface is None or data_interface.values != ECM_DATA_INTERFACE:
+        commands.append(f'AT+QCFG="data_interface",{",".join(ECM_DATA_INTERFACE)}')
+
+    if apn:
+        context = next((c for c in parse_cgdcont(cgdcont_response) if c.cid == ECM_PDP_CID), None)
+        if (
+            context is None
+            or context.pdp_type != ECM_PDP_TYPE
+            or context.apn.lower() != apn.lower()
+        ):
+            commands.append(f'AT+CGDCONT={ECM_PDP_CID},"{ECM_PDP_TYPE}","{apn}"')
+
+    return commands
+
+
+def read_response(
+    port: serial.Serial,
+    command: str,
+    deadline: float,
+    on_urc: Optional[Callable[[str], None]] = None,
+) -> ATResponse:
+    """
+    Read response lines from a port until a final result code or the deadline.
+
+    Args:
+        port: Open serial port the command was written to
+        command: AT command the response belongs to
+        deadline: time.monotonic() value to give up at
+        on_urc: Called with URC lines interleaved with the response (optional)
 
+    Returns:
+        ATResponse (final is None on timeout)
+    """
+    reader = LineReader()
+    collector = ResponseCollector(command)
+    port_timeout = port.timeout
+    # Setting the timeout reconfigures the port (tcsetattr), so do it once
+    if port_timeout is None or port_timeout > READ_POLL_TIMEOUT:
+        port.timeout = READ_POLL_TIMEOUT
+
+    try:
+        while time.monotonic() < deadline:
+            # read() returns as soon as bytes arrive, so the loop wakes on data
+            # and otherwise checks the deadline every READ_POLL_TIMEOUT
+            chunk = port.read(port.in_waiting or 1)
+            if not chunk:
+                continue
+            collector.add_raw(chunk)
+            for line in reader.feed(chunk):
+                if on_urc is not None and is_urc(line, command):
+                    on_urc(line)
+                elif collector.add_line(line):
+                    return collector.response
+    finally:
+        if port.timeout != port_timeout:
+            port.timeout = port_timeout
+
+    return collector.response
+
+
+def discard_input(port: serial.Serial, on_urc: Optional[Callable[[str], None]] = None) -> None:
+    """
+    Drain bytes received since the last command.
+
+    Complete lines are handed to on_urc; leftover result codes are dropped.
+    """
+    waiting = port.in_waiting
+    if not waiting:
+        return
+    stale = port.read(waiting)
+    logger.debug(f"Drained input: {stale!r}")
+    if on_urc is None:
+        return
+    for line in LineReader().feed(stale + b"\n"):
+        if not is_final_result(line):
+            on_urc(line)
+
+
+def probe_port(port: str, baudrate: int = 115200, timeout: float = PROBE_TIMEOUT) -> bool:
+    """
+    Check whether a port answers AT commands.
+
+    Args:
+        port: Serial port path
+        baudrate: Serial baudrate
+        timeout: Seconds to wait for the response
+
+    Returns:
+        True if the port answered OK
+    """
+    try:
+        logger.debug(f"Testing {port}...")
+        ser = serial.Serial(port, baudrate, timeout=timeout)
+    except (serial.SerialException, OSError) as e:
+        logger.debug(f"Port {port} error: {e}")
+        return False
+
+    try:
+        discard_input(ser)
+        ser.write(b"AT\r\n")
+        ser.flush()
+        return read_response(ser, "AT", time.monotonic() + timeout).ok
+    except (serial.SerialException, OSError) as e:
+        logger.debug(f"Port {port} error: {e}")
+        return False
+    finally:
+        ser.close()
+
+
+def _probe_ports(ports: List[str]) -> Optional[str]:
+    """
+    Probe ports concurrently and return the most preferred one that answers.
+
+    Results are taken in list order, so a later port never wins over an
+    earlier one, but the search stops as soon as the best remaining candidate
+    has answered instead of waiting for every probe.
+    """
     if not ports:
-        logger.warning("No /dev/ttyUSB* devices found")
         return None
+    pool = ThreadPoolExecutor(max_workers=min(len(ports), MAX_PROBE_WORKERS))
+    try:
+        futures = [pool.submit(probe_port, port) for port in ports]
+        for port, future in zip(ports, futures):
+            if future.result():
+                return port
+        return None
+    finally:
+        # Don't wait for slower probes of ports we no longer need
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    logger.debug(f"Found {len(ports)} serial ports: {', '.join(sorted(ports))}")
 
-    # Try likely AT command ports first (usually ttyUSB2)
-    preferred_ports = ["/dev/ttyUSB2", "/dev/ttyUSB3", "/dev/ttyUSB1", "/dev/ttyUSB0"]
-    all_ports = [p for p in preferred_ports if p in ports] + [
-        p for p in ports if p not in preferred_ports
-    ]
+def clear_port_cache() -> None:
+    """Forget ports found by find_modem()."""
+    _port_cache.clear()
+    if _persistent_cache is not None:
+        _persistent_cache.invalidate()
 
-    for port in all_ports:
-        try:
-            logger.debug(f"Testing {port}...")
-            ser = serial.Serial(port, 115200, timeout=2)
-            time.sleep(0.3)
 
-            # Clear buffer
-            if ser.in_waiting:
-                ser.read(ser.in_waiting)
+def _on_hotplug(event: UEvent) -> None:
+    """Drop cached ports when USB serial devices come or go."""
+    if event.action in ("add", "remove") and event.subsystem in HOTPLUG_SUBSYSTEMS:
+        _port_cache.clear()
+        if _persistent_cache is not None:
+            _persistent_cache.handle_uevent(event)
 
-            # Send AT command
-            ser.write(b"AT\r\n")
-            ser.flush()
-            time.sleep(0.8)
 
-            # Read response
-            response = ser.read(100).decode("utf-8", errors="ignore")
-            ser.close()
+def get_port_cache() -> PortCache:
+    """
+    Get the persistent port cache used by find_modem().
 
-            if "OK" in response:
-                logger.info(f"Found modem at: {port}")
-                return port
+    Returns:
+        PortCache instance
+    """
+    global _persistent_cache
+    if _persistent_cache is None:
+        _persistent_cache = PortCache()
+    return _persistent_cache
+
+
+def watch_hotplug() -> None:
+    """
+    Drop cached ports as soon as USB devices are added or removed.
+
+    Starts a netlink watcher thread, so only long-running processes call
+    this; elsewhere cached ports are still re-validated against sysfs on
+    lookup.
+    """
+    global _hotplug_watcher
+    if _hotplug_watcher is None:
+        _hotplug_watcher = HotplugWatcher()
+        _hotplug_watcher.add_callback(_on_hotplug)
+        _hotplug_watcher.start()
+
+
+def find_modem(use_cache: bool = True) -> Optional[str]:
+    """
+    Find the Qualcomm modem's AT command port.
+
+    Quectel AT interfaces identified through sysfs (vendor ID and interface
+    number) are probed first; any other ttyUSB ports are probed only if
+    none of them answers. Probes run concurrently.
+
+    The port is remembered in ~/.rm530/ports.json by USB device identity.
+    A cached port is used after checking its sysfs identity and answering
+    one AT command, without scanning other ttys.
 
-        except (serial.SerialException, PermissionError) as e:
-            logger.debug(f"Port {port} error: {e}")
-            continue
+    Args:
+        use_cache: Reuse a previously found port
+
+    Returns:
+        Port path if found, None otherwise
+    """
+    cache = get_port_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.lookup()
+        if cached is not None:
+            if probe_port(cached):
+                logger.debug(f"Using cached modem port: {cached}")
+                return cached
+            logger.debug(f"Cached modem port {cached} did not answer")
+            cache.invalidate()
+
+    usb_ports = list_usb_serial_ports()
+    key = topology_key(usb_ports) if usb_ports else None
+    if use_cache and key is not None and key in _port_cache:
+        logger.debug(f"Using cached modem port: {_port_cache[key]}")
+        return _port_cache[key]
+
+    ports = glob.glob("/dev/ttyUSB*")
+
+    if not ports:
+        logger.warning("No /dev/ttyUSB* devices found")
+        return None
+
+    logger.debug(f"Found {len(ports)} serial ports: {', '.join(sorted(ports))}")
+
+    # sysfs-identified AT interfaces first
+    candidates = [p for p in at_port_candidates(usb_ports) if p in ports]
+    port = _probe_ports(candidates)
+
+    if port is None:
+        # Fall back to the remaining ports, skipping devices sysfs says are not Quectel
+        foreign = {p.device for p in usb_ports if not p.is_quectel}
+        preferred_ports = ["/dev/ttyUSB2", "/dev/ttyUSB3", "/dev/ttyUSB1", "/dev/ttyUSB0"]
+        all_ports = [p for p in preferred_ports if p in ports] + sorted(
+            p for p in ports if p not in preferred_ports
+        )
+        port = _probe_ports([p for p in all_ports if p not in candidates and p not in foreign])
+
+    if port is None:
+        logger.warning("No modem found responding to AT commands")
+        return None
 
-    logger.warning("No modem found responding to AT commands")
-    return None
+    logger.info(f"Found modem at: {port}")
+    if key is not None:
+        _port_cache[key] = port
+    if cache is not None:
+        for usb_port in usb_ports:
+            if usb_port.device == port:
+                cache.store(usb_port)
+    return port
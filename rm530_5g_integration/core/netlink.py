@@ -0,0 +1,323 @@
+"""Minimal rtnetlink client for interface links and addresses."""
+
+import errno
+import os
+import socket
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# linux/netlink.h
+NETLINK_ROUTE = 0
+NLMSG_NOOP = 1
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_MULTI = 0x2
+NLM_F_DUMP = 0x300
+
+# linux/rtnetlink.h
+RTM_NEWLINK = 16
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+
+# linux/if_link.h
+IFLA_ADDRESS = 1
+IFLA_IFNAME = 3
+IFLA_MTU = 4
+IFLA_OPERSTATE = 16
+IFLA_STATS64 = 23
+
+# linux/if_addr.h
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_LABEL = 3
+
+# linux/if.h
+IFF_UP = 0x1
+IFF_LOOPBACK = 0x8
+
+# IFLA_OPERSTATE values, named as in /sys/class/net/<if>/operstate
+OPERSTATES = ("unknown", "notpresent", "down", "lowerlayerdown", "testing", "dormant", "up")
+
+# Address scopes (RT_SCOPE_*)
+SCOPE_UNIVERSE = 0
+SCOPE_LINK = 253
+SCOPE_HOST = 254
+
+_NLMSGHDR = struct.Struct("=LHHLL")
+_IFINFOMSG = struct.Struct("=BxHiII")
+_IFADDRMSG = struct.Struct("=BBBBI")
+_RTATTR = struct.Struct("=HH")
+_STATS64 = struct.Struct("=8Q")  # First fields of struct rtnl_link_stats64
+
+RECV_BUFSIZE = 65536
+
+
+@dataclass
+class Link:
+    """Network interface from an RTM_NEWLINK message."""
+
+    index: int
+    name: str
+    flags: int = 0
+    mtu: Optional[int] = None
+    operstate: Optional[str] = None
+    mac: Optional[str] = None
+    rx_packets: Optional[int] = None
+    tx_packets: Optional[int] = None
+    rx_bytes: Optional[int] = None
+    tx_bytes: Optional[int] = None
+    rx_errors: Optional[int] = None
+    tx_errors: Optional[int] = None
+    rx_dropped: Optional[int] = None
+    tx_dropped: Optional[int] = None
+
+    @property
+    def is_up(self) -> bool:
+        """Check if the interface is administratively up."""
+        return bool(self.flags & IFF_UP)
+
+    @property
+    def is_loopback(self) -> bool:
+        """Check if this is a loopback interface."""
+        return bool(self.flags & IFF_LOOPBACK)
+
+
+@dataclass
+class Address:
+    """Interface address from an RTM_NEWADDR message."""
+
+    index: int
+    family: int
+    address: str
+    prefixlen: int
+    scope: int = SCOPE_UNIVERSE
+    label: Optional[str] = None
+
+    @property
+    def version(self) -> int:
+        """IP version (4 or 6)."""
+        return 6 if self.family == socket.AF_INET6 else 4
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"{self.address}/{self.prefixlen}"
+
+
+@dataclass
+class InterfaceTable:
+    """
+    Snapshot of all links and addresses.
+
+    One dump answers questions about any number of interfaces.
+
+    Examples:
+        >>> table = dump_interfaces()
+        >>> table.ipv4("usb0")
+        '192.168.225.20'
+    """
+
+    links: Dict[int, Link] = field(default_factory=dict)
+    addresses: List[Address] = field(default_factory=list)
+
+    def link(self, name: str) -> Optional[Link]:
+        """Get an interface by name."""
+        for link in self.links.values():
+            if link.name == name:
+                return link
+        return None
+
+    def addresses_of(self, name: str, family: Optional[int] = None) -> List[Address]:
+        """
+        Get the addresses of an interface.
+
+        Args:
+            name: Interface name
+            family: socket.AF_INET or socket.AF_INET6 (None for both)
+
+        Returns:
+            Addresses in kernel order
+        """
+        link = self.link(name)
+        if link is None:
+            return []
+        return [
+            address
+            for address in self.addresses
+            if address.index == link.index and (family is None or address.family == family)
+        ]
+
+    def ipv4(self, name: str) -> Optional[str]:
+        """Get the first non-loopback IPv4 address of an interface."""
+        for address in self.addresses_of(name, socket.AF_INET):
+            if not address.address.startswith("127."):
+                return address.address
+        return None
+
+    def ipv6(self, name: str) -> Optional[str]:
+        """Get the first global IPv6 address of an interface."""
+        for address in self.addresses_of(name, socket.AF_INET6):
+            if address.scope == SCOPE_UNIVERSE:
+                return address.address
+        return None
+
+
+def _attributes(data: bytes, offset: int) -> Iterator[Tuple[int, bytes]]:
+    """Iterate (type, payload) of the rtattrs from offset to the end of data."""
+    while offset + _RTATTR.size <= len(data):
+        length, kind = _RTATTR.unpack_from(data, offset)
+        if length < _RTATTR.size:
+            break
+        yield kind & 0x3FFF, data[offset + _RTATTR.size : offset + length]
+        offset += (length + 3) & ~3
+
+
+def _cstring(payload: bytes) -> str:
+    """Decode a NUL-terminated attribute."""
+    return payload.split(b"\0", 1)[0].decode(errors="replace")
+
+
+def parse_link(payload: bytes) -> Link:
+    """
+    Parse the payload of an RTM_NEWLINK message.
+
+    Args:
+        payload: Message without the netlink header
+
+    Returns:
+        Link
+    """
+    _family, _type, index, flags, _change = _IFINFOMSG.unpack_from(payload)
+    link = Link(index=index, name="", flags=flags)
+    for kind, value in _attributes(payload, _IFINFOMSG.size):
+        if kind == IFLA_IFNAME:
+            link.name = _cstring(value)
+        elif kind == IFLA_MTU and len(value) >= 4:
+            link.mtu = struct.unpack_from("=I", value)[0]
+        elif kind == IFLA_OPERSTATE and value:
+            link.operstate = OPERSTATES[value[0]] if value[0] < len(OPERSTATES) else "unknown"
+        elif kind == IFLA_ADDRESS and value:
+            link.mac = ":".join(f"{b:02x}" for b in value)
+        elif kind == IFLA_STATS64 and len(value) >= _STATS64.size:
+            (
+                link.rx_packets,
+                link.tx_packets,
+                link.rx_bytes,
+                link.tx_bytes,
+                link.rx_errors,
+                link.tx_errors,
+                link.rx_dropped,
+                link.tx_dropped,
+            ) = _STATS64.unpack_from(value)
+    return link
+
+
+def parse_address(payload: bytes) -> Optional[Address]:
+    """
+    Parse the payload of an RTM_NEWADDR message.
+
+    Args:
+        payload: Message without the netlink header
+
+    Returns:
+        Address, or None for families other than IPv4/IPv6
+    """
+    family, prefixlen, _flags, scope, index = _IFADDRMSG.unpack_from(payload)
+    if family not in (socket.AF_INET, socket.AF_INET6):
+        return None
+    attributes = dict(_attributes(payload, _IFADDRMSG.size))
+    # IFA_LOCAL is the interface's own address; IFA_ADDRESS is the peer on
+    # point-to-point IPv4 links and the only one given for IPv6
+    raw = attributes.get(IFA_LOCAL) or attributes.get(IFA_ADDRESS)
+    if raw is None:
+        return None
+    label = attributes.get(IFA_LABEL)
+    return Address(
+        index=index,
+        family=family,
+        address=socket.inet_ntop(family, raw),
+        prefixlen=prefixlen,
+        scope=scope,
+        label=_cstring(label) if label is not None else None,
+    )
+
+
+def _request(kind: int, seq: int, body: bytes) -> bytes:
+    """Build a dump request message."""
+    header = _NLMSGHDR.pack(_NLMSGHDR.size + len(body), kind, NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+    return header + body
+
+
+def dump_interfaces(timeout: float = 1.0) -> InterfaceTable:
+    """
+    Dump all links and addresses (IPv4 and IPv6) over rtnetlink.
+
+    Both dump requests go out in one send and the replies are read from one
+    socket, so a single call replaces any number of `ip addr show` runs. The
+    kernel runs one dump per socket at a time; if the address dump is
+    refused while the link dump is still streaming, it is sent again after.
+
+    Args:
+        timeout: Receive timeout in seconds
+
+    Returns:
+        InterfaceTable
+
+    Raises:
+        OSError: If netlink is unavailable (non-Linux) or the kernel rejects a dump
+    """
+    requests = {
+        1: _request(RTM_GETLINK, 1, _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)),
+        2: _request(RTM_GETADDR, 2, _IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)),
+    }
+    table = InterfaceTable()
+
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE) as sock:
+        sock.settimeout(timeout)
+        sock.bind((0, 0))
+        sock.send(b"".join(requests.values()))
+        pending = set(requests)
+        deferred: List[int] = []
+
+        while pending:
+            data = sock.recv(RECV_BUFSIZE)
+            offset = 0
+            while offset + _NLMSGHDR.size <= len(data):
+                length, kind, _flags, seq, _pid = _NLMSGHDR.unpack_from(data, offset)
+                if length < _NLMSGHDR.size:
+                    break
+                payload = data[offset + _NLMSGHDR.size : offset + length]
+                offset += (length + 3) & ~3
+
+                if seq not in pending:
+                    continue
+                if kind == NLMSG_DONE:
+                    pending.discard(seq)
+                    if deferred:
+                        sock.send(requests[deferred.pop(0)])
+                elif kind == NLMSG_ERROR:
+                    error = -struct.unpack_from("=i", payload)[0]
+                    if error == errno.EBUSY:
+                        # A dump was still running when this one arrived on the
+                        # socket (large tables); ask again once it has finished
+                        deferred.append(seq)
+                    elif error:
+                        raise OSError(error, os.strerror(error))
+                    else:
+                        pending.discard(seq)
+                elif kind == RTM_NEWLINK:
+                    link = parse_link(payload)
+                    table.links[link.index] = link
+                elif kind == RTM_NEWADDR:
+                    address = parse_address(payload)
+                    if address is not None:
+                        table.addresses.append(address)
+
+    logger.debug(f"Netlink dump: {len(table.links)} links, {len(table.addresses)} addresses")
+    return table
@@ -3,6 +3,7 @@
 import subprocess
 from typing import Any, Dict, List, Optional
 
+from rm530_5g_integration.core.netlink import dump_interfaces
 from rm530_5g_integration.utils.exceptions import NetworkConfigurationError
 from rm530_5g_integration.utils.logging import get_logger
 
@@ -159,6 +160,11 @@ class NetworkManager:
         Returns:
             IP address if found, None otherwise
         """
+        try:
+            return dump_interfaces().ipv4(interface)
+        except OSError as e:
+            logger.debug(f"Netlink unavailable, using ip: {e}")
+
         try:
             result = subprocess.run(
                 ["ip", "addr", "show", interface], capture_output=True, text=True, check=True
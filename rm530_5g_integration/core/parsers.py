@@ -0,0 +1,562 @@
+"""AT command response parsers.
+
+Each parser takes the ATResponse of one command and returns typed records.
+Lines are matched once against a precompiled "+NAME: fields" pattern and
+fields are converted by position from per-response tables, so a value can
+only ever come from the line (and RAT section) it belongs to.
+"""
+
+import csv
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.core.urc import REGISTERED_STATES
+
+# +NAME: field,field,...
+_INFO_LINE = re.compile(r"^(\+[A-Z0-9]+):\s*(.*)$")
+
+# Quectel reports unavailable values as "-"
+_UNAVAILABLE = frozenset({"", "-", "--"})
+
+# LTE <UL/DL_bandwidth> code -> MHz
+LTE_BANDWIDTH_MHZ = (1.4, 3.0, 5.0, 10.0, 15.0, 20.0)
+
+# NR <NR_DL_bandwidth> code -> MHz
+NR_BANDWIDTH_MHZ = (5, 10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100, 200, 400)
+
+# RATs reported by AT+QENG="servingcell"
+RAT_LTE = "LTE"
+RAT_NR_SA = "NR5G-SA"
+RAT_NR_NSA = "NR5G-NSA"
+
+T = TypeVar("T")
+Converter = Callable[[str], Any]
+FieldSpec = Sequence[Tuple[str, Converter]]
+
+
+def split_fields(text: str) -> List[str]:
+    """
+    Split the fields of an information line.
+
+    Args:
+        text: Text after "+NAME:" (e.g. '"usbnet",1')
+
+    Returns:
+        Fields with surrounding whitespace and quotes removed
+    """
+    if not text:
+        return []
+    return [value.strip() for value in next(csv.reader([text], skipinitialspace=True))]
+
+
+def info_lines(response: ATResponse, prefix: str) -> Iterator[List[str]]:
+    """
+    Iterate over the fields of the response lines with a given prefix.
+
+    Args:
+        response: Command response
+        prefix: Line prefix (e.g. "+CSQ")
+
+    Yields:
+        Field lists, one per matching line
+    """
+    for line in response.lines:
+        match = _INFO_LINE.match(line)
+        if match and match.group(1) == prefix:
+            yield split_fields(match.group(2))
+
+
+def _optional(convert: Converter) -> Converter:
+    """Wrap a converter so unavailable or malformed values become None."""
+
+    def wrapper(value: str) -> Any:
+        if value in _UNAVAILABLE:
+            return None
+        try:
+            return convert(value)
+        except (ValueError, IndexError):
+            return None
+
+    return wrapper
+
+
+_str = _optional(str)
+_int = _optional(int)
+_float = _optional(float)
+_hex = _optional(lambda value: int(value, 16))
+_lte_bandwidth = _optional(lambda value: LTE_BANDWIDTH_MHZ[int(value)])
+_nr_bandwidth = _optional(lambda value: float(NR_BANDWIDTH_MHZ[int(value)]))
+# LTE <SINR> is reported in 1/5 dB steps offset by -20 dB (0-250 -> -20..30 dB)
+_lte_sinr = _optional(lambda value: int(value) / 5 - 20)
+
+
+def _build(record_type: Type[T], spec: FieldSpec, fields: List[str], **extra: Any) -> T:
+    """Create a record from positional fields according to a field table."""
+    values = {
+        name: convert(fields[i]) if i < len(fields) else None
+        for i, (name, convert) in enumerate(spec)
+    }
+    values.update(extra)
+    return record_type(**values)
+
+
+@dataclass
+class CSQ:
+    """Signal strength reported by AT+CSQ."""
+
+    rssi: Optional[int] = None  # 0-31, 99 = unknown
+    ber: Optional[int] = None  # 0-7, 99 = unknown
+
+    @property
+    def rssi_dbm(self) -> Optional[int]:
+        """RSSI in dBm (0 = -113 dBm or less, 31 = -51 dBm or better)."""
+        if self.rssi is None or self.rssi == 99:
+            return None
+        return -113 + self.rssi * 2
+
+
+@dataclass
+class NetworkInfo:
+    """Network information reported by AT+QNWINFO."""
+
+    access_technology: Optional[str] = None  # e.g. "FDD LTE", "NR5G-SA"
+    operator: Optional[str] = None  # MCC+MNC, e.g. "40445"
+    band: Optional[str] = None  # e.g. "LTE BAND 3", "NR5G BAND 78"
+    channel: Optional[int] = None
+
+
+class SlottedRecord:
+    """
+    Base for compact records using __slots__ instead of a per-instance dict.
+
+    Subclasses list their fields in __slots__; equality, repr and to_dict()
+    are derived from it.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary (nested records included)."""
+        values = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            values[name] = value.to_dict() if isinstance(value, SlottedRecord) else value
+        return values
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        """Representation listing all fields."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class ServingCell(SlottedRecord):
+    """One serving cell reported by AT+QENG="servingcell"."""
+
+    __slots__ = (
+        "rat",
+        "state",
+        "duplex",
+        "mcc",
+        "mnc",
+        "cell_id",
+        "pci",
+        "tac",
+        "arfcn",
+        "band",
+        "bandwidth",
+        "rsrp",
+        "rsrq",
+        "rssi",
+        "sinr",
+        "cqi",
+        "tx_power",
+        "scs",
+        "srxlev",
+    )
+
+    def __init__(
+        self,
+        rat: str,
+        state: Optional[str] = None,
+        duplex: Optional[str] = None,
+        mcc: Optional[str] = None,
+        mnc: Optional[str] = None,
+        cell_id: Optional[int] = None,
+        pci: Optional[int] = None,
+        tac: Optional[int] = None,
+        arfcn: Optional[int] = None,
+        band: Optional[int] = None,
+        bandwidth: Optional[float] = None,
+        rsrp: Optional[int] = None,
+        rsrq: Optional[int] = None,
+        rssi: Optional[int] = None,
+        sinr: Optional[float] = None,
+        cqi: Optional[int] = None,
+        tx_power: Optional[int] = None,
+        scs: Optional[int] = None,
+        srxlev: Optional[int] = None,
+    ):
+        """
+        Initialize serving cell.
+
+        Args:
+            rat: LTE, NR5G-SA or NR5G-NSA
+            state: SEARCH, LIMSRV, NOCONN or CONNECT
+            duplex: FDD or TDD
+            mcc: Mobile country code
+            mnc: Mobile network code
+            cell_id: Cell identity
+            pci: Physical cell ID
+            tac: Tracking area code
+            arfcn: ARFCN (EARFCN for LTE)
+            band: Band number
+            bandwidth: DL bandwidth in MHz
+            rsrp: Reference Signal Received Power (dBm)
+            rsrq: Reference Signal Received Quality (dB)
+            rssi: Received Signal Strength Indicator (dBm, LTE only)
+            sinr: Signal to Interference plus Noise Ratio (dB)
+            cqi: Channel quality indicator
+            tx_power: Transmit power
+            scs: NR subcarrier spacing code
+            srxlev: Cell selection RX level
+        """
+        self.rat = rat
+        self.state = state
+        self.duplex = duplex
+        self.mcc = mcc
+        self.mnc = mnc
+        self.cell_id = cell_id
+        self.pci = pci
+        self.tac = tac
+        self.arfcn = arfcn
+        self.band = band
+        self.bandwidth = bandwidth
+        self.rsrp = rsrp
+        self.rsrq = rsrq
+        self.rssi = rssi
+        self.sinr = sinr
+        self.cqi = cqi
+        self.tx_power = tx_power
+        self.scs = scs
+        self.srxlev = srxlev
+
+    @property
+    def is_nr(self) -> bool:
+        """Check if this is an NR (SA or NSA) cell."""
+        return self.rat in (RAT_NR_SA, RAT_NR_NSA)
+
+    def __str__(self) -> str:
+        """String representation."""
+        parts = []
+        if self.rsrp is not None:
+            parts.append(f"RSRP: {self.rsrp} dBm")
+        if self.rsrq is not None:
+            parts.append(f"RSRQ: {self.rsrq} dB")
+        if self.sinr is not None:
+            parts.append(f"SINR: {self.sinr} dB")
+        band = f" {'n' if self.is_nr else 'B'}{self.band}" if self.band is not None else ""
+        pci = f" PCI {self.pci}" if self.pci is not None else ""
+        return f"{self.rat}{band}{pci}: {', '.join(parts) if parts else 'no measurements'}"
+
+
+@dataclass
+class ServingCellReport:
+    """Serving cells reported by AT+QENG="servingcell"."""
+
+    state: Optional[str] = None
+    cells: List[ServingCell] = field(default_factory=list)
+
+    def cell(self, *rats: str) -> Optional[ServingCell]:
+        """Get the first cell of one of the given RATs."""
+        return next((cell for cell in self.cells if cell.rat in rats), None)
+
+    @property
+    def lte(self) -> Optional[ServingCell]:
+        """LTE serving cell (the anchor in EN-DC)."""
+        return self.cell(RAT_LTE)
+
+    @property
+    def nr(self) -> Optional[ServingCell]:
+        """NR serving cell (SA or NSA leg)."""
+        return self.cell(RAT_NR_SA, RAT_NR_NSA)
+
+    @property
+    def primary(self) -> Optional[ServingCell]:
+        """Cell carrying control: NR in SA mode, LTE otherwise."""
+        return self.cell(RAT_NR_SA) or self.lte or self.nr
+
+
+@dataclass
+class QCFGSetting:
+    """Extended configuration setting reported by AT+QCFG."""
+
+    name: str  # e.g. "usbnet"
+    values: List[str] = field(default_factory=list)  # e.g. ["1"]
+
+
+@dataclass
+class PDPContext:
+    """PDP context definition reported by AT+CGDCONT?."""
+
+    cid: int
+    pdp_type: str  # IP, IPV6, IPV4V6
+    apn: str
+
+
+@dataclass
+class Operator:
+    """Operator selection reported by AT+COPS?."""
+
+    mode: Optional[int] = None  # 0 = automatic, 1 = manual, ...
+    format: Optional[int] = None  # 0 = long name, 1 = short name, 2 = numeric
+    name: Optional[str] = None
+    access_technology: Optional[int] = None  # 7 = E-UTRAN, 12 = NG-RAN, 13 = EN-DC
+
+
+@dataclass
+class Registration:
+    """Network registration reported by AT+CREG?, AT+CEREG? or AT+C5GREG?."""
+
+    name: str  # +CREG, +CEREG or +C5GREG
+    mode: Optional[int] = None  # <n> URC reporting mode
+    state: Optional[int] = None  # <stat>: 1 = home, 5 = roaming
+    tac: Optional[int] = None
+    cell_id: Optional[int] = None
+    access_technology: Optional[int] = None
+
+    @property
+    def registered(self) -> bool:
+        """Check if registered (home or roaming)."""
+        return self.state in REGISTERED_STATES
+
+
+_CSQ_FIELDS: FieldSpec = (("rssi", _int), ("ber", _int))
+
+_QNWINFO_FIELDS: FieldSpec = (
+    ("access_technology", _str),
+    ("operator", _str),
+    ("band", _str),
+    ("channel", _int),
+)
+
+_COPS_FIELDS: FieldSpec = (
+    ("mode", _int),
+    ("format", _int),
+    ("name", _str),
+    ("access_technology", _int),
+)
+
+_REGISTRATION_FIELDS: FieldSpec = (
+    ("mode", _int),
+    ("state", _int),
+    ("tac", _hex),
+    ("cell_id", _hex),
+    ("access_technology", _int),
+)
+
+# AT+QENG="servingcell" fields following the RAT name
+_LTE_FIELDS: FieldSpec = (
+    ("duplex", _str),
+    ("mcc", _str),
+    ("mnc", _str),
+    ("cell_id", _hex),
+    ("pci", _int),
+    ("arfcn", _int),
+    ("band", _int),
+    ("ul_bandwidth", _lte_bandwidth),
+    ("bandwidth", _lte_bandwidth),
+    ("tac", _hex),
+    ("rsrp", _int),
+    ("rsrq", _int),
+    ("rssi", _int),
+    ("sinr", _lte_sinr),
+    ("cqi", _int),
+    ("tx_power", _int),
+    ("srxlev", _int),
+)
+
+_NR_SA_FIELDS: FieldSpec = (
+    ("duplex", _str),
+    ("mcc", _str),
+    ("mnc", _str),
+    ("cell_id", _hex),
+    ("pci", _int),
+    ("tac", _hex),
+    ("arfcn", _int),
+    ("band", _int),
+    ("bandwidth", _nr_bandwidth),
+    ("rsrp", _int),
+    ("rsrq", _int),
+    ("sinr", _float),
+    ("scs", _int),
+    ("srxlev", _int),
+)
+
+_NR_NSA_FIELDS: FieldSpec = (
+    ("mcc", _str),
+    ("mnc", _str),
+    ("pci", _int),
+    ("rsrp", _int),
+    ("sinr", _float),
+    ("rsrq", _int),
+    ("arfcn", _int),
+    ("band", _int),
+    ("bandwidth", _nr_bandwidth),
+    ("scs", _int),
+)
+
+_SERVINGCELL_FIELDS: Dict[str, FieldSpec] = {
+    RAT_LTE: _LTE_FIELDS,
+    RAT_NR_SA: _NR_SA_FIELDS,
+    RAT_NR_NSA: _NR_NSA_FIELDS,
+}
+
+# Fields parsed but not kept on ServingCell
+_DROPPED_FIELDS = frozenset({"ul_bandwidth"})
+
+
+def _first(response: ATResponse, prefix: str) -> Optional[List[str]]:
+    """Get the fields of the first line with a prefix."""
+    return next(info_lines(response, prefix), None)
+
+
+def parse_csq(response: ATResponse) -> Optional[CSQ]:
+    """
+    Parse the response to AT+CSQ.
+
+    Args:
+        response: Response to AT+CSQ
+
+    Returns:
+        CSQ, or None if the response has no +CSQ line
+    """
+    fields = _first(response, "+CSQ")
+    return _build(CSQ, _CSQ_FIELDS, fields) if fields is not None else None
+
+
+def parse_qnwinfo(response: ATResponse) -> Optional[NetworkInfo]:
+    """
+    Parse the response to AT+QNWINFO.
+
+    Args:
+        response: Response to AT+QNWINFO
+
+    Returns:
+        NetworkInfo, or None if the response has no +QNWINFO line
+    """
+    fields = _first(response, "+QNWINFO")
+    return _build(NetworkInfo, _QNWINFO_FIELDS, fields) if fields is not None else None
+
+
+def _servingcell(rat: str, fields: List[str], state: Optional[str]) -> ServingCell:
+    """Build a ServingCell from the fields following the RAT name."""
+    spec = _SERVINGCELL_FIELDS[rat]
+    values = {
+        name: convert(fields[i]) if i < len(fields) else None
+        for i, (name, convert) in enumerate(spec)
+        if name not in _DROPPED_FIELDS
+    }
+    return ServingCell(rat=rat, state=state, **values)
+
+
+def parse_servingcell(response: ATResponse) -> ServingCellReport:
+    """
+    Parse the response to AT+QENG="servingcell".
+
+    Handles LTE and NR5G-SA (one line) and EN-DC (a state line followed by
+    separate "LTE" and "NR5G-NSA" lines).
+
+    Args:
+        response: Response to AT+QENG="servingcell"
+
+    Returns:
+        ServingCellReport (cells is empty when not camped on LTE or NR)
+    """
+    report = ServingCellReport()
+    for fields in info_lines(response, "+QENG"):
+        if not fields:
+            continue
+        if fields[0] == "servingcell":
+            # +QENG: "servingcell",<state>[,<RAT>,...]
+            report.state = _str(fields[1]) if len(fields) > 1 else None
+            rat_fields = fields[2:]
+        else:
+            # EN-DC: +QENG: "LTE",... / +QENG: "NR5G-NSA",...
+            rat_fields = fields
+        if rat_fields and rat_fields[0] in _SERVINGCELL_FIELDS:
+            report.cells.append(_servingcell(rat_fields[0], rat_fields[1:], report.state))
+    return report
+
+
+def parse_qcfg(response: ATResponse, name: str) -> Optional[QCFGSetting]:
+    """
+    Parse the response to an AT+QCFG query.
+
+    Args:
+        response: Response to e.g. AT+QCFG="usbnet"
+        name: Setting name to look for
+
+    Returns:
+        QCFGSetting, or None if the setting is not in the response
+    """
+    for fields in info_lines(response, "+QCFG"):
+        if fields and fields[0].lower() == name.lower():
+            return QCFGSetting(name=fields[0], values=fields[1:])
+    return None
+
+
+def parse_cgdcont(response: ATResponse) -> List[PDPContext]:
+    """
+    Parse the response to AT+CGDCONT?.
+
+    Args:
+        response: Response to AT+CGDCONT?
+
+    Returns:
+        Defined PDP contexts
+    """
+    contexts = []
+    for fields in info_lines(response, "+CGDCONT"):
+        cid = _int(fields[0]) if fields else None
+        if cid is not None and len(fields) >= 3:
+            contexts.append(PDPContext(cid=cid, pdp_type=fields[1], apn=fields[2]))
+    return contexts
+
+
+def parse_cops(response: ATResponse) -> Optional[Operator]:
+    """
+    Parse the response to AT+COPS?.
+
+    Args:
+        response: Response to AT+COPS?
+
+    Returns:
+        Operator, or None if the response has no +COPS line
+    """
+    fields = _first(response, "+COPS")
+    return _build(Operator, _COPS_FIELDS, fields) if fields is not None else None
+
+
+def parse_registration(response: ATResponse) -> Optional[Registration]:
+    """
+    Parse the response to AT+CREG?, AT+CGREG?, AT+CEREG? or AT+C5GREG?.
+
+    Args:
+        response: Registration query response
+
+    Returns:
+        Registration, or None if the response has no registration line
+    """
+    for prefix in ("+C5GREG", "+CEREG", "+CGREG", "+CREG"):
+        fields = _first(response, prefix)
+        if fields is not None:
+            return _build(Registration, _REGISTRATION_FIELDS, fields, name=prefix)
+    return None
@@ -0,0 +1,573 @@
+"""In-process connectivity probes (ICMP echo, TCP connect, DNS) bound to an interface."""
+
+import errno
+import os
+import random
+import selectors
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROBE_METHODS = ("icmp", "tcp", "dns")
+DEFAULT_PROBE_TARGETS = ("8.8.8.8", "1.1.1.1")
+DEFAULT_PROBE_TIMEOUT = 2.0
+DEFAULT_PORTS = {"tcp": 443, "dns": 53}
+DEFAULT_DNS_NAME = "example.com"
+
+# linux/socket.h; not exposed by every Python build
+SO_BINDTODEVICE = getattr(socket, "SO_BINDTODEVICE", 25)
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+ICMPV6_ECHO_REQUEST = 128
+ICMPV6_ECHO_REPLY = 129
+
+_ICMP_HEADER = struct.Struct("!BBHHH")
+_DNS_HEADER = struct.Struct("!HHHHHH")
+_DNS_QUESTION = struct.Struct("!HH")
+_TIMESTAMP = struct.Struct("!d")
+
+
+@dataclass(frozen=True)
+class ProbeTarget:
+    """Host to probe and how."""
+
+    host: str
+    method: str = "icmp"
+    port: Optional[int] = None
+
+    @classmethod
+    def parse(cls, spec: Union[str, "ProbeTarget"]) -> "ProbeTarget":
+        """
+        Parse a target spec.
+
+        Args:
+            spec: "host" (ICMP), or "tcp:host[:port]" / "dns:host[:port]";
+                IPv6 hosts with a port are written "[addr]:port"
+
+        Returns:
+            ProbeTarget
+
+        Raises:
+            ValueError: Bad port, or a port on an ICMP target
+
+        Examples:
+            >>> ProbeTarget.parse("tcp:1.1.1.1:80")
+            ProbeTarget(host='1.1.1.1', method='tcp', port=80)
+        """
+        if isinstance(spec, ProbeTarget):
+            return spec
+        method, sep, rest = spec.partition(":")
+        if not sep or method not in PROBE_METHODS:
+            method, rest = "icmp", spec
+
+        port: Optional[str] = None
+        if rest.startswith("["):
+            host, _, tail = rest[1:].partition("]")
+            port = tail[1:] if tail.startswith(":") else None
+        elif rest.count(":") == 1:
+            host, port = rest.split(":")
+        else:
+            host = rest
+        if port is not None and method == "icmp":
+            raise ValueError(f"ICMP targets take no port: {spec}")
+        try:
+            number = int(port) if port else DEFAULT_PORTS.get(method)
+        except ValueError:
+            raise ValueError(f"Invalid port in probe target: {spec}")
+        return cls(host=host, method=method, port=number)
+
+    def __str__(self) -> str:
+        """Target spec."""
+        host = f"[{self.host}]" if ":" in self.host and self.port else self.host
+        return f"{self.method}:{host}:{self.port}" if self.port else f"{self.method}:{host}"
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of probing one target."""
+
+    target: ProbeTarget
+    method: str  # Method actually used (after any fallback)
+    sent: int = 0
+    received: int = 0
+    rtts: List[float] = field(default_factory=list)  # Milliseconds
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether any probe was answered."""
+        return self.received > 0
+
+    @property
+    def loss(self) -> float:
+        """Fraction of probes not answered (1.0 if none were sent)."""
+        return 1.0 - self.received / self.sent if self.sent else 1.0
+
+    @property
+    def rtt_min(self) -> Optional[float]:
+        """Lowest round-trip time in ms."""
+        return min(self.rtts) if self.rtts else None
+
+    @property
+    def rtt_avg(self) -> Optional[float]:
+        """Mean round-trip time in ms."""
+        return sum(self.rtts) / len(self.rtts) if self.rtts else None
+
+    @property
+    def rtt_max(self) -> Optional[float]:
+        """Highest round-trip time in ms."""
+        return max(self.rtts) if self.rtts else None
+
+    def __str__(self) -> str:
+        """String representation."""
+        text = f"{self.method} {self.target.host}: {self.received}/{self.sent} answered"
+        if self.rtts:
+            text += f", rtt {self.rtt_min:.1f}/{self.rtt_avg:.1f}/{self.rtt_max:.1f} ms"
+        if self.error:
+            text += f" ({self.error})"
+        return text
+
+
+def _checksum(data: bytes) -> int:
+    """Internet checksum (RFC 1071)."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return int(~total & 0xFFFF)
+
+
+def dns_query(query_id: int, name: str) -> bytes:
+    """Build a recursive DNS query for the A record of a name."""
+    question = b"".join(
+        bytes([len(label)]) + label.encode("ascii") for label in name.strip(".").split(".")
+    )
+    return (
+        _DNS_HEADER.pack(query_id, 0x0100, 1, 0, 0, 0) + question + b"\0" + _DNS_QUESTION.pack(1, 1)
+    )
+
+
+def _resolve(target: ProbeTarget, kind: int) -> Tuple[int, tuple]:
+    """Resolve a target to (family, sockaddr)."""
+    family, _, _, _, sockaddr = socket.getaddrinfo(target.host, target.port or 0, type=kind)[0]
+    return family, sockaddr
+
+
+class _Session:
+    """Probes of one target, driven by Prober's event loop."""
+
+    method = ""
+
+    def __init__(self, prober: "Prober", target: ProbeTarget):
+        self.prober = prober
+        self.target = target
+        self.result = ProbeResult(target=target, method=self.method)
+        self.pending: Dict[int, float] = {}  # Wire sequence -> send time
+        self.limit: Optional[int] = prober.count  # None to probe until stopped
+        self.listener: Optional[Callable[[int, Optional[float]], None]] = None
+        self.next_seq = 0
+        self.next_send = 0.0
+
+    def open(self, selector: selectors.BaseSelector) -> None:
+        """Create sockets (raise OSError if impossible)."""
+        self.selector = selector
+
+    def _socket(self, family: int, kind: int, proto: int = 0) -> socket.socket:
+        """Create a non-blocking socket bound to the prober's interface."""
+        sock = socket.socket(family, kind, proto)
+        try:
+            if self.prober.interface:
+                sock.setsockopt(
+                    socket.SOL_SOCKET, SO_BINDTODEVICE, self.prober.interface.encode() + b"\0"
+                )
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    @property
+    def sending(self) -> bool:
+        """Whether more probes are to be sent."""
+        return self.limit is None or self.next_seq < self.limit
+
+    @property
+    def done(self) -> bool:
+        """Whether every probe has been answered or has timed out."""
+        return not self.sending and not self.pending
+
+    def wakeup(self) -> float:
+        """Next time the session has something to do."""
+        times = [sent + self.prober.timeout for sent in self.pending.values()]
+        if self.sending:
+            times.append(self.next_send)
+        return min(times)
+
+    def tick(self, now: float) -> None:
+        """Send a due probe and expire unanswered ones."""
+        for seq, sent in list(self.pending.items()):
+            if now - sent >= self.prober.timeout:
+                del self.pending[seq]
+                self.expired(seq)
+                self.lost(seq)
+        if self.sending and now >= self.next_send:
+            seq = self.next_seq & 0xFFFF
+            self.next_seq += 1
+            # Keep to the send grid; skip slots missed while falling behind
+            self.next_send = (self.next_send or now) + self.prober.interval
+            if self.next_send < now:
+                self.next_send = now + self.prober.interval
+            try:
+                self.send(seq, now)
+            except OSError as e:
+                self.result.error = str(e)
+                if self.listener is None:
+                    self.limit = self.next_seq  # Further sends would fail the same way
+                else:
+                    self.lost(seq)  # Streaming keeps trying, e.g. while the link is down
+                return
+            self.pending[seq] = now
+            self.result.sent += 1
+
+    def answered(self, seq: int, now: float) -> None:
+        """Record the reply to a probe."""
+        sent = self.pending.pop(seq, None)
+        if sent is None:
+            return
+        rtt = (now - sent) * 1000.0
+        self.result.received += 1
+        if self.listener is None:
+            self.result.rtts.append(rtt)
+        else:
+            self.listener(seq, rtt)
+
+    def lost(self, seq: int) -> None:
+        """Report a probe that got no reply."""
+        if self.listener is not None:
+            self.listener(seq, None)
+
+    def send(self, seq: int, now: float) -> None:
+        """Send probe `seq`."""
+        raise NotImplementedError
+
+    def expired(self, seq: int) -> None:
+        """Clean up after a probe that timed out."""
+
+    def close(self) -> None:
+        """Release sockets."""
+
+
+class _IcmpSession(_Session):
+    """ICMP echo over a ping socket, or a raw socket where ping sockets are not allowed."""
+
+    method = "icmp"
+
+    def open(self, selector: selectors.BaseSelector) -> None:
+        super().open(selector)
+        family, self.address = _resolve(self.target, socket.SOCK_DGRAM)
+        self.v6 = family == socket.AF_INET6
+        proto = socket.IPPROTO_ICMPV6 if self.v6 else socket.IPPROTO_ICMP
+        try:
+            # Unprivileged "ping socket" (net.ipv4.ping_group_range)
+            self.sock = self._socket(family, socket.SOCK_DGRAM, proto)
+            self.raw = False
+        except PermissionError:
+            self.sock = self._socket(family, socket.SOCK_RAW, proto)
+            self.raw = True
+        # Ping sockets replace the identifier with their port and filter replies
+        self.ident = (os.getpid() ^ id(self)) & 0xFFFF
+        self.token = random.getrandbits(64).to_bytes(8, "big")
+        selector.register(self.sock, selectors.EVENT_READ, self.readable)
+
+    def send(self, seq: int, now: float) -> None:
+        kind = ICMPV6_ECHO_REQUEST if self.v6 else ICMP_ECHO_REQUEST
+        payload = self.token + _TIMESTAMP.pack(now)
+        packet = _ICMP_HEADER.pack(kind, 0, 0, self.ident, seq) + payload
+        if not self.v6:  # The kernel fills in ICMPv6 checksums
+            checksum = _checksum(packet)
+            packet = packet[:2] + struct.pack("!H", checksum) + packet[4:]
+        self.sock.sendto(packet, self.address)
+
+    def readable(self, now: float) -> None:
+        while True:
+            try:
+                data = self.sock.recv(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.debug(f"ICMP receive error from {self.target.host}: {e}")
+                return
+            if self.raw and not self.v6:
+                data = data[(data[0] & 0x0F) * 4 :]  # Strip the IPv4 header
+            if len(data) < _ICMP_HEADER.size + len(self.token):
+                continue
+            kind, _, _, ident, seq = _ICMP_HEADER.unpack_from(data)
+            if kind != (ICMPV6_ECHO_REPLY if self.v6 else ICMP_ECHO_REPLY):
+                continue
+            if self.raw and (ident != self.ident or data[8:16] != self.token):
+                continue  # Another process's echo
+            self.answered(seq, now)
+
+    def close(self) -> None:
+        self.selector.unregister(self.sock)
+        self.sock.close()
+
+
+class _TcpSession(_Session):
+    """TCP handshake; a refused connection still proves the round trip."""
+
+    method = "tcp"
+
+    def open(self, selector: selectors.BaseSelector) -> None:
+        super().open(selector)
+        self.family, self.address = _resolve(self.target, socket.SOCK_STREAM)
+        self.sockets: Dict[int, socket.socket] = {}
+
+    def send(self, seq: int, now: float) -> None:
+        sock = self._socket(self.family, socket.SOCK_STREAM)
+        code = sock.connect_ex(self.address)
+        if code not in (0, errno.EINPROGRESS):
+            sock.close()
+            raise OSError(code, os.strerror(code))
+        self.sockets[seq] = sock
+        self.selector.register(sock, selectors.EVENT_WRITE, lambda t: self.connected(seq, t))
+
+    def connected(self, seq: int, now: float) -> None:
+        sock = self._drop(seq)
+        code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        sock.close()
+        if code in (0, errno.ECONNREFUSED):
+            self.answered(seq, now)
+        else:
+            self.pending.pop(seq, None)
+            self.result.error = os.strerror(code)
+            self.lost(seq)
+
+    def _drop(self, seq: int) -> socket.socket:
+        sock = self.sockets.pop(seq)
+        self.selector.unregister(sock)
+        return sock
+
+    def expired(self, seq: int) -> None:
+        self._drop(seq).close()
+
+    def close(self) -> None:
+        for seq in list(self.sockets):
+            self._drop(seq).close()
+
+
+class _DnsSession(_Session):
+    """DNS query; any response from the server counts."""
+
+    method = "dns"
+
+    def open(self, selector: selectors.BaseSelector) -> None:
+        super().open(selector)
+        family, address = _resolve(self.target, socket.SOCK_DGRAM)
+        self.sock = self._socket(family, socket.SOCK_DGRAM)
+        self.sock.connect(address)
+        # Outstanding queries both ways; entries go when answered or expired
+        self.queries: Dict[int, int] = {}  # Query ID -> sequence
+        self.query_ids: Dict[int, int] = {}  # Sequence -> query ID
+        selector.register(self.sock, selectors.EVENT_READ, self.readable)
+
+    def send(self, seq: int, now: float) -> None:
+        query_id = random.getrandbits(16)
+        while query_id in self.queries:  # Never two outstanding queries with one ID
+            query_id = random.getrandbits(16)
+        self.sock.send(dns_query(query_id, self.prober.dns_name))
+        self.queries[query_id] = seq
+        self.query_ids[seq] = query_id
+
+    def readable(self, now: float) -> None:
+        while True:
+            try:
+                data = self.sock.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # e.g. ECONNREFUSED from an ICMP port unreachable: no server there
+                self.result.error = str(e)
+                return
+            if len(data) >= _DNS_HEADER.size:
+                seq = self.queries.pop(_DNS_HEADER.unpack_from(data)[0], None)
+                if seq is not None:
+                    del self.query_ids[seq]
+                    self.answered(seq, now)
+
+    def expired(self, seq: int) -> None:
+        query_id = self.query_ids.pop(seq, None)
+        if query_id is not None:
+            del self.queries[query_id]
+
+    def close(self) -> None:
+        self.selector.unregister(self.sock)
+        self.sock.close()
+
+
+SESSIONS = {"icmp": _IcmpSession, "tcp": _TcpSession, "dns": _DnsSession}
+
+
+class Prober:
+    """
+    Probe reachability and round-trip time of several targets at once.
+
+    Probes are sent from this process (no `ping` subprocess) on sockets
+    bound to `interface` with SO_BINDTODEVICE, so they test that link
+    rather than whatever the default route is. All targets are probed
+    concurrently from one selector loop, so a call takes about
+    `(count - 1) * interval + timeout` at most, regardless of the number
+    of targets.
+
+    ICMP uses an unprivileged ping socket, then a raw socket; if neither
+    is permitted, ICMP targets are probed with the `fallback` method
+    against the same host instead.
+
+    Examples:
+        >>> prober = Prober(interface="usb0", count=3)
+        >>> for result in prober.probe(["8.8.8.8", "tcp:1.1.1.1:443", "dns:9.9.9.9"]):
+        ...     print(result)
+        icmp 8.8.8.8: 3/3 answered, rtt 31.2/33.0/35.8 ms
+    """
+
+    def __init__(
+        self,
+        interface: Optional[str] = None,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        count: int = 1,
+        interval: float = 0.2,
+        fallback: Optional[str] = "tcp",
+        dns_name: str = DEFAULT_DNS_NAME,
+    ):
+        """
+        Initialize prober.
+
+        Args:
+            interface: Interface to send probes on (None for the routing table's choice)
+            timeout: Seconds to wait for each reply
+            count: Probes per target
+            interval: Seconds between probes to one target
+            fallback: Method for ICMP targets when ICMP sockets are not permitted
+                ("tcp", "dns" or None)
+            dns_name: Name looked up by DNS probes
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        if fallback is not None and fallback not in DEFAULT_PORTS:
+            raise ValueError(f"Invalid fallback method: {fallback}")
+        self.interface = interface
+        self.timeout = timeout
+        self.count = count
+        self.interval = interval
+        self.fallback = fallback
+        self.dns_name = dns_name
+
+    def _open(self, target: ProbeTarget, selector: selectors.BaseSelector) -> _Session:
+        """Open a session for a target, falling back from ICMP if not permitted."""
+        session = SESSIONS[target.method](self, target)
+        try:
+            session.open(selector)
+        except PermissionError as e:
+            if target.method != "icmp" or self.fallback is None:
+                raise
+            logger.debug(f"ICMP not permitted ({e}), probing {target.host} with {self.fallback}")
+            fallback = ProbeTarget(target.host, self.fallback, DEFAULT_PORTS[self.fallback])
+            session = SESSIONS[self.fallback](self, fallback)
+            session.open(selector)
+            session.result.target = target
+        return session
+
+    def probe(
+        self, targets: Sequence[Union[str, ProbeTarget]] = DEFAULT_PROBE_TARGETS
+    ) -> List[ProbeResult]:
+        """
+        Probe targets concurrently.
+
+        Args:
+            targets: Target specs (see ProbeTarget.parse) or ProbeTargets
+
+        Returns:
+            One ProbeResult per target, in order
+        """
+        parsed = [ProbeTarget.parse(target) for target in targets]
+        results: List[ProbeResult] = []
+        sessions: List[_Session] = []
+        selector = selectors.DefaultSelector()
+        try:
+            for target in parsed:
+                try:
+                    session = self._open(target, selector)
+                except OSError as e:
+                    logger.debug(f"Cannot probe {target}: {e}")
+                    results.append(ProbeResult(target, target.method, error=str(e)))
+                    continue
+                sessions.append(session)
+                results.append(session.result)
+            self._run(sessions, selector)
+        finally:
+            for session in sessions:
+                session.close()
+            selector.close()
+        return results
+
+    def stream(
+        self,
+        target: Union[str, ProbeTarget],
+        listener: Callable[[int, Optional[float]], None],
+        stop: threading.Event,
+    ) -> None:
+        """
+        Probe one target every `interval` seconds until `stop` is set.
+
+        Blocks; run it on a thread of its own. RTTs are not kept in a
+        ProbeResult, so memory stays constant however long it runs.
+
+        Args:
+            target: Target spec or ProbeTarget
+            listener: Called with (sequence, RTT in ms) as each probe is answered,
+                or (sequence, None) when it times out or cannot be sent
+            stop: Event that ends the stream
+
+        Raises:
+            OSError: The probe socket cannot be opened
+        """
+        selector = selectors.DefaultSelector()
+        try:
+            session = self._open(ProbeTarget.parse(target), selector)
+            try:
+                session.limit = None
+                session.listener = listener
+                self._run([session], selector, stop)
+            finally:
+                session.close()
+        finally:
+            selector.close()
+
+    @staticmethod
+    def _run(
+        sessions: List[_Session],
+        selector: selectors.BaseSelector,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Send, receive and expire probes until every session is done (or stopped)."""
+        active = list(sessions)
+        while stop is None or not stop.is_set():
+            now = time.monotonic()
+            for session in active:
+                session.tick(now)
+            active = [session for session in active if not session.done]
+            if not active:
+                return
+            wait = max(0.0, min(session.wakeup() for session in active) - now)
+            for key, _ in selector.select(wait):
+                callback: Callable[[float], None] = key.data
+                callback(time.monotonic())
@@ -0,0 +1,258 @@
+"""Modem restart detection."""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import serial
+
+from rm530_5g_integration.core.discovery import (
+    SYSFS_ROOT,
+    HotplugWatcher,
+    UEvent,
+    at_port_candidates,
+    describe_port,
+    list_usb_serial_ports,
+)
+from rm530_5g_integration.core.modem import discard_input, read_response
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Overall time allowed for the modem to come back after a reset
+DEFAULT_READY_TIMEOUT = 60.0
+
+# Time allowed for the modem to drop off the USB bus after the reset command
+RESET_TIMEOUT = 10.0
+
+# Re-check interval when no hotplug event arrives (or netlink is unavailable)
+POLL_INTERVAL = 0.5
+
+# Time an AT check waits for RDY or OK
+AT_CHECK_TIMEOUT = 1.0
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for a modem restart."""
+
+    ready: bool = False
+    elapsed: float = 0.0  # Seconds spent waiting
+    reset_seen: bool = False  # The modem left the USB bus
+    port: Optional[str] = None  # AT port after the restart
+    interface_up: bool = False  # Network interface exists
+    at_ready: bool = False  # RDY received or AT answered
+
+    def __str__(self) -> str:
+        """String representation."""
+        missing = [
+            name
+            for name, done in (
+                ("AT port", self.port is not None),
+                ("network interface", self.interface_up),
+                ("RDY", self.at_ready),
+            )
+            if not done
+        ]
+        if self.ready:
+            return f"ready after {self.elapsed:.1f}s"
+        return f"not ready after {self.elapsed:.1f}s (waiting for {', '.join(missing)})"
+
+
+def check_at_ready(port: str, baudrate: int = 115200, timeout: float = AT_CHECK_TIMEOUT) -> bool:
+    """
+    Check whether a restarted modem accepts AT commands.
+
+    A pending RDY URC counts as ready; otherwise the port must answer AT.
+
+    Args:
+        port: Serial port path
+        baudrate: Serial baudrate
+        timeout: Seconds to wait
+
+    Returns:
+        True if RDY was received or AT answered OK
+    """
+    try:
+        ser = serial.Serial(port, baudrate, timeout=timeout)
+    except (serial.SerialException, OSError) as e:
+        logger.debug(f"Port {port} not ready: {e}")
+        return False
+
+    rdy = threading.Event()
+
+    def on_urc(line: str) -> None:
+        if line == "RDY":
+            rdy.set()
+
+    try:
+        discard_input(ser, on_urc)
+        if rdy.is_set():
+            return True
+        ser.write(b"AT\r\n")
+        ser.flush()
+        return read_response(ser, "AT", time.monotonic() + timeout, on_urc).ok or rdy.is_set()
+    except (serial.SerialException, OSError) as e:
+        logger.debug(f"Port {port} not ready: {e}")
+        return False
+    finally:
+        ser.close()
+
+
+class ReadinessWaiter:
+    """
+    Wait for a modem to come back after a reset.
+
+    The modem is ready once it has left and rejoined the USB bus, its AT
+    port answers (or has sent RDY) and the network interface exists. Kernel
+    hotplug events wake the waiter as soon as something changes; without
+    them it re-checks every POLL_INTERVAL seconds.
+
+    Call arm() before issuing the reset so the USB removal is not missed.
+
+    Examples:
+        >>> waiter = ReadinessWaiter(port="/dev/ttyUSB2", interface="usb0")
+        >>> waiter.arm()
+        >>> modem.send_command("AT+CFUN=1,1", expected="")
+        >>> result = waiter.wait(timeout=60)
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        interface: str = "usb0",
+        baudrate: int = 115200,
+        sysfs_root: str = SYSFS_ROOT,
+        at_check: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        Initialize readiness waiter.
+
+        Args:
+            port: AT port before the reset (auto-detect through sysfs if None)
+            interface: Network interface expected after the restart
+            baudrate: Serial baudrate
+            sysfs_root: sysfs mount point
+            at_check: Function called with the AT port that returns True once
+                the modem accepts commands (default: check_at_ready)
+        """
+        self.port = port
+        self.interface = interface
+        self.baudrate = baudrate
+        self.sysfs_root = sysfs_root
+        self.at_check = at_check or (lambda p: check_at_ready(p, self.baudrate))
+        self._usb_path: Optional[str] = None
+        self._changed = threading.Event()
+        self._watcher: Optional[HotplugWatcher] = None
+
+    def arm(self) -> None:
+        """Record the modem's USB identity and start listening for hotplug events."""
+        if self.port is not None:
+            usb_port = describe_port(os.path.basename(self.port), self.sysfs_root)
+        else:
+            usb_port = next(
+                (p for p in list_usb_serial_ports(self.sysfs_root) if p.is_quectel), None
+            )
+        self._usb_path = usb_port.usb_path if usb_port is not None else None
+
+        if self._watcher is None:
+            self._watcher = HotplugWatcher()
+            self._watcher.add_callback(self._on_uevent)
+            self._watcher.start()
+
+    def close(self) -> None:
+        """Stop listening for hotplug events."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _on_uevent(self, event: UEvent) -> None:
+        """Wake the waiter on any device change."""
+        self._changed.set()
+
+    def _device_present(self) -> bool:
+        """Check if the modem is still on the USB bus."""
+        if self._usb_path is not None:
+            return os.path.exists(
+                os.path.join(self.sysfs_root, "bus", "usb", "devices", self._usb_path)
+            )
+        return self.port is not None and os.path.exists(self.port)
+
+    def _find_port(self) -> Optional[str]:
+        """Find the AT port after the restart (it may be renumbered)."""
+        candidates = at_port_candidates(list_usb_serial_ports(self.sysfs_root))
+        if candidates:
+            return candidates[0]
+        if self.port is not None and os.path.exists(self.port):
+            return self.port
+        return None
+
+    def _interface_present(self) -> bool:
+        """Check if the network interface exists."""
+        return os.path.exists(os.path.join(self.sysfs_root, "class", "net", self.interface))
+
+    def wait(
+        self, timeout: float = DEFAULT_READY_TIMEOUT, reset_timeout: float = RESET_TIMEOUT
+    ) -> ReadinessResult:
+        """
+        Block until the modem is ready or the deadline passes.
+
+        Args:
+            timeout: Overall seconds to wait
+            reset_timeout: Seconds to wait for the modem to leave the USB bus;
+                after that it is assumed to have reset before arm() was called
+
+        Returns:
+            ReadinessResult
+        """
+        result = ReadinessResult()
+        start = time.monotonic()
+        deadline = start + timeout
+        reset_deadline = start + min(reset_timeout, timeout)
+        reset_passed = False
+
+        try:
+            while True:
+                now = time.monotonic()
+                if not reset_passed:
+                    if not self._device_present():
+                        logger.info("Modem left the USB bus")
+                        result.reset_seen = True
+                        reset_passed = True
+                    elif now >= reset_deadline:
+                        logger.debug("Modem did not leave the USB bus, checking readiness")
+                        reset_passed = True
+
+                if reset_passed:
+                    result.port = self._find_port()
+                    result.interface_up = self._interface_present()
+                    if result.port is not None and not result.at_ready:
+                        result.at_ready = self.at_check(result.port)
+                    if result.port is not None and result.interface_up and result.at_ready:
+                        result.ready = True
+                        break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(min(POLL_INTERVAL, remaining))
+                self._changed.clear()
+        finally:
+            result.elapsed = time.monotonic() - start
+
+        if result.ready:
+            logger.info(f"Modem {result}")
+        else:
+            logger.warning(f"Modem {result}")
+        return result
+
+    def __enter__(self) -> "ReadinessWaiter":
+        """Context manager entry (arms the waiter)."""
+        self.arm()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
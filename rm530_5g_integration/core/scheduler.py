@@ -0,0 +1,127 @@
+"""Drift-free scheduling of periodic checks."""
+
+import heapq
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Schedule:
+    """Interval and jitter of one scheduled check."""
+
+    interval: float
+    jitter: float
+
+
+class CheckScheduler:
+    """
+    Timer heap of periodic checks, each with its own interval.
+
+    Every check runs on a fixed grid (start, start + interval, ...), so the
+    period does not drift with the time a check takes. Jitter delays each
+    run by a random fraction of the interval to spread checks apart, without
+    moving the grid. Slots missed while the caller was busy are skipped
+    rather than run back to back.
+
+    Examples:
+        >>> scheduler = CheckScheduler()
+        >>> scheduler.add("link", interval=1)
+        >>> scheduler.add("signal", interval=30, jitter=0.1)
+        >>> while True:
+        ...     for name in scheduler.pop_due():
+        ...         run(name)
+        ...     time.sleep(scheduler.delay())
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: Monotonic time source in seconds
+            rng: Random source for jitter (default: a private random.Random)
+        """
+        self.clock = clock
+        self._rng = rng or random.Random()
+        self._schedules: Dict[str, _Schedule] = {}
+        # (run at, insertion order, name, grid slot the run belongs to)
+        self._heap: List[Tuple[float, int, str, float]] = []
+        self._counter = 0
+
+    def __len__(self) -> int:
+        """Number of scheduled checks."""
+        return len(self._schedules)
+
+    def add(
+        self, name: str, interval: float, jitter: float = 0.0, start: Optional[float] = None
+    ) -> None:
+        """
+        Schedule a check.
+
+        Args:
+            name: Check name (unique)
+            interval: Seconds between runs
+            jitter: Largest random delay of a run, as a fraction of the interval
+            start: Time of the first run (default: now, without jitter)
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        if name in self._schedules:
+            raise ValueError(f"Check already scheduled: {name}")
+        self._schedules[name] = _Schedule(interval, jitter)
+        slot = self.clock() if start is None else start
+        self._push(slot, slot, name)
+
+    def next_deadline(self) -> Optional[float]:
+        """Time the next check is due (None if nothing is scheduled)."""
+        return self._heap[0][0] if self._heap else None
+
+    def delay(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next check is due (0 if overdue, None if nothing is scheduled)."""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - (self.clock() if now is None else now))
+
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        """
+        Take the checks that are due and schedule their next runs.
+
+        Args:
+            now: Current time (default: clock())
+
+        Returns:
+            Names of due checks, earliest first
+        """
+        now = self.clock() if now is None else now
+        due: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, name, slot = heapq.heappop(self._heap)
+            schedule = self._schedules[name]
+            slot += schedule.interval
+            if slot <= now:
+                missed = math.floor((now - slot) / schedule.interval) + 1
+                logger.debug(f"Check '{name}' fell behind, skipping {missed} run(s)")
+                slot += missed * schedule.interval
+            delay = self._rng.uniform(0, schedule.jitter * schedule.interval)
+            self._push(slot + delay, slot, name)
+            due.append(name)
+        return due
+
+    def _push(self, at: float, slot: float, name: str) -> None:
+        """Add a run to the heap."""
+        self._counter += 1
+        heapq.heappush(self._heap, (at, self._counter, name, slot))
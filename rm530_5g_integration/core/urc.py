@@ -0,0 +1,291 @@
+"""Unsolicited result code (URC) routing."""
+
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Set
+
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Lines the RM530 can emit without a command being in progress
+URC_NAMES = frozenset(
+    {
+        "RDY",
+        "POWERED DOWN",
+        "+CFUN",
+        "+CPIN",
+        "+QUSIM",
+        "+QIND",
+        "+QIURC",
+        "+QNETDEVSTATUS",
+        "+CREG",
+        "+CGREG",
+        "+CEREG",
+        "+C5GREG",
+        "+CGEV",
+        "+QNWINFO",
+    }
+)
+
+# Registration URCs; the first field is the registration state
+REGISTRATION_URCS = frozenset({"+CREG", "+CGREG", "+CEREG", "+C5GREG"})
+
+# 3GPP TS 27.007 <stat>: 1 = registered (home), 5 = registered (roaming)
+REGISTERED_STATES = frozenset({1, 5})
+
+_COMMAND_PREFIX = re.compile(r"(?:^AT|;)\s*(\+[A-Z0-9]+)", re.IGNORECASE)
+
+
+def urc_name(line: str) -> str:
+    """
+    Get the name of a response line ("+CREG" for "+CREG: 1", "RDY" for "RDY").
+
+    Args:
+        line: Response line
+
+    Returns:
+        Line name
+    """
+    return line.split(":", 1)[0].strip() if line.startswith("+") else line.strip()
+
+
+def command_prefixes(command: str) -> Set[str]:
+    """
+    Get the response prefixes a command line produces.
+
+    Args:
+        command: AT command, possibly ';'-chained (e.g. 'AT+CSQ;+QNWINFO')
+
+    Returns:
+        Set of prefixes such as {"+CSQ", "+QNWINFO"}
+    """
+    return {match.upper() for match in _COMMAND_PREFIX.findall(command)}
+
+
+def is_urc(line: str, command: Optional[str] = None) -> bool:
+    """
+    Check whether a line is unsolicited rather than part of a command response.
+
+    A known URC name is treated as part of the response when the pending command
+    is the one that produces that prefix (e.g. "+CREG: 0,1" for "AT+CREG?").
+
+    Args:
+        line: Response line
+        command: Command currently awaiting a response (None if idle)
+
+    Returns:
+        True if the line should be routed to URC subscribers
+    """
+    if command is None:
+        return True
+    name = urc_name(line)
+    if name not in URC_NAMES:
+        return False
+    return name not in command_prefixes(command)
+
+
+@dataclass
+class URC:
+    """Unsolicited result code received from the modem."""
+
+    name: str  # e.g. "+CREG", "RDY"
+    line: str  # Full line as received
+    timestamp: float  # time.time() when received
+
+    @property
+    def fields(self) -> List[str]:
+        """Comma-separated fields after the colon (quotes stripped)."""
+        if ":" not in self.line:
+            return []
+        return [field.strip().strip('"') for field in self.line.split(":", 1)[1].split(",")]
+
+    @property
+    def registration_state(self) -> Optional[int]:
+        """Registration state for +CREG/+CGREG/+CEREG/+C5GREG URCs."""
+        if self.name not in REGISTRATION_URCS or not self.fields:
+            return None
+        try:
+            return int(self.fields[0])
+        except ValueError:
+            return None
+
+
+class URCListener:
+    """Blocking iterator over URCs delivered to a dispatcher subscription."""
+
+    def __init__(
+        self, dispatcher: "URCDispatcher", names: Optional[Iterable[str]], maxsize: int
+    ) -> None:
+        """
+        Initialize listener (use URCDispatcher.listen()).
+
+        Args:
+            dispatcher: Dispatcher to subscribe to
+            names: URC names to receive (None for all)
+            maxsize: Queue size; the oldest URC is dropped when full
+        """
+        self._queue: "queue.Queue[Optional[URC]]" = queue.Queue(maxsize)
+        self._dispatcher = dispatcher
+        self._closed = False
+        dispatcher.subscribe(self._put, names)
+
+    def _put(self, urc: URC) -> None:
+        """Queue a URC, dropping the oldest one if the consumer falls behind."""
+        while True:
+            try:
+                self._queue.put_nowait(urc)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._queue.get_nowait()
+                    logger.debug(f"URC queue full, dropped {dropped}")
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[URC]:
+        """
+        Wait for the next URC.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            URC, or None on timeout or after close()
+        """
+        if self._closed:
+            return None
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Unsubscribe and wake any blocked get()."""
+        if self._closed:
+            return
+        self._closed = True
+        self._dispatcher.unsubscribe(self._put)
+        self._put(None)  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[URC]:
+        """Iterate over URCs until close() is called."""
+        while True:
+            urc = self.get()
+            if urc is None:
+                return
+            yield urc
+
+    def __enter__(self) -> "URCListener":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+class URCDispatcher:
+    """
+    Deliver URCs to subscribers.
+
+    Examples:
+        >>> modem.urcs.subscribe(lambda urc: print(urc.line), ["+CREG", "+CEREG"])
+        >>> with modem.urcs.listen(["RDY"]) as listener:
+        ...     urc = listener.get(timeout=30)
+    """
+
+    def __init__(self) -> None:
+        """Initialize dispatcher."""
+        self._subscribers: List[tuple[Callable[[URC], None], Optional[frozenset]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self, callback: Callable[[URC], None], names: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Register a callback for URCs.
+
+        Callbacks run on the thread that read the URC and must not block.
+
+        Args:
+            callback: Function that takes a URC
+            names: URC names to receive (None for all)
+        """
+        with self._lock:
+            self._subscribers.append((callback, frozenset(names) if names is not None else None))
+
+    def unsubscribe(self, callback: Callable[[URC], None]) -> None:
+        """Remove a callback registered with subscribe()."""
+        with self._lock:
+            self._subscribers = [sub for sub in self._subscribers if sub[0] != callback]
+
+    def listen(self, names: Optional[Iterable[str]] = None, maxsize: int = 256) -> URCListener:
+        """
+        Subscribe with a blocking iterator instead of a callback.
+
+        Args:
+            names: URC names to receive (None for all)
+            maxsize: Maximum queued URCs before the oldest is dropped
+
+        Returns:
+            URCListener (close it, or use it as a context manager)
+        """
+        return URCListener(self, names, maxsize)
+
+    def wait_for(
+        self,
+        names: Iterable[str],
+        timeout: float,
+        predicate: Optional[Callable[[URC], bool]] = None,
+    ) -> Optional[URC]:
+        """
+        Block until a matching URC arrives.
+
+        Args:
+            names: URC names to wait for
+            timeout: Seconds to wait
+            predicate: Optional extra condition on the URC
+
+        Returns:
+            Matching URC, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self.listen(names) as listener:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                urc = listener.get(timeout=remaining)
+                if urc is not None and (predicate is None or predicate(urc)):
+                    return urc
+
+    def dispatch_line(self, line: str) -> None:
+        """
+        Deliver a raw line as a URC.
+
+        Args:
+            line: Line received outside of (or interleaved with) a command response
+        """
+        self.dispatch(URC(name=urc_name(line), line=line, timestamp=time.time()))
+
+    def dispatch(self, urc: URC) -> None:
+        """
+        Deliver a URC to matching subscribers.
+
+        Args:
+            urc: URC to deliver
+        """
+        logger.debug(f"URC: {urc.line}")
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback, names in subscribers:
+            if names is not None and urc.name not in names:
+                continue
+            try:
+                callback(urc)
+            except Exception as e:
+                logger.error(f"URC callback error: {e}")
@@ -1,11 +1,32 @@
 """Monitoring modules for RM530 5G Integration."""
 
+from rm530_5g_integration.monitoring.bench import BenchClient, BenchResult, BenchServer
+from rm530_5g_integration.monitoring.latency import LatencyProber, LatencyStats
+from rm530_5g_integration.monitoring.sampler import SampleRing, SignalSampler
 from rm530_5g_integration.monitoring.signal import SignalQuality, get_signal_quality
-from rm530_5g_integration.monitoring.stats import ConnectionStats, get_connection_stats
+from rm530_5g_integration.monitoring.stats import (
+    BulkStatsCollector,
+    ConnectionStats,
+    RateTracker,
+    ThroughputRates,
+    get_connection_stats,
+)
+from rm530_5g_integration.monitoring.store import MetricStore
 
 __all__ = [
+    "SampleRing",
+    "SignalSampler",
     "SignalQuality",
     "get_signal_quality",
     "ConnectionStats",
     "get_connection_stats",
+    "BulkStatsCollector",
+    "RateTracker",
+    "ThroughputRates",
+    "MetricStore",
+    "LatencyProber",
+    "LatencyStats",
+    "BenchClient",
+    "BenchResult",
+    "BenchServer",
 ]
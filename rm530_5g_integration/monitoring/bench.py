@@ -0,0 +1,760 @@
+"""Multi-stream TCP/UDP throughput benchmark with a bundled server."""
+
+import json
+import math
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from rm530_5g_integration.core.probe import SO_BINDTODEVICE
+from rm530_5g_integration.monitoring.latency import JITTER_GAIN
+from rm530_5g_integration.monitoring.rollup import TIER_RETENTION
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.store import SIGNAL_FIELDS, MetricStore, signal_values
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BENCH_PORT = 9531
+DEFAULT_DURATION = 10.0
+DEFAULT_STREAMS = 4
+DEFAULT_INTERVAL = 1.0
+DEFAULT_UDP_RATE = 10e6  # Bits per second over all streams
+DEFAULT_UDP_SIZE = 1200  # Datagram payload; fits cellular MTUs
+BLOCK_SIZE = 128 * 1024
+CONNECT_TIMEOUT = 5.0
+UDP_GRACE = 0.5  # Seconds late datagrams are still counted
+
+# Server-side limits on what a client may ask for
+MAX_DURATION = 60.0
+MAX_UDP_RATE = 100e6  # Bits per second per stream
+MAX_UDP_SIZE = 8192
+MIN_INTERVAL = 0.1
+
+PROTOCOLS = ("tcp", "udp")
+DIRECTIONS = ("upload", "download")
+
+# MetricStore series of benchmark results, with the signal during each test
+BENCH_SERIES = "bench"
+BENCH_FIELDS = (
+    "udp",
+    "upload",
+    "streams",
+    "goodput",
+    "fairness",
+    "retransmits",
+    "loss",
+    "jitter",
+) + SIGNAL_FIELDS
+
+# linux/tcp.h; struct tcp_info up to tcpi_total_retrans
+TCP_INFO = getattr(socket, "TCP_INFO", 11)
+_TCP_INFO = struct.Struct("=8B24I")
+
+# UDP datagram header: sequence number, sender's monotonic send time
+_UDP_HEADER = struct.Struct("!Id")
+
+
+def tcp_retransmits(sock: socket.socket) -> Optional[int]:
+    """Segments retransmitted on a TCP connection so far (None if unknown)."""
+    try:
+        data = sock.getsockopt(socket.IPPROTO_TCP, TCP_INFO, _TCP_INFO.size)
+    except OSError:
+        return None
+    if len(data) < _TCP_INFO.size:
+        return None
+    return int(_TCP_INFO.unpack(data)[-1])
+
+
+def jain_fairness(values: List[float]) -> Optional[float]:
+    """
+    Jain's fairness index: 1.0 when all values are equal, 1/n when one takes all.
+
+    Args:
+        values: Per-stream goodputs
+
+    Returns:
+        Index, or None without any traffic
+    """
+    squares = sum(value * value for value in values)
+    if not squares:
+        return None
+    return sum(values) ** 2 / (len(values) * squares)
+
+
+def _bind_device(sock: socket.socket, interface: Optional[str]) -> None:
+    """Bind a socket to an interface (SO_BINDTODEVICE)."""
+    if interface:
+        sock.setsockopt(socket.SOL_SOCKET, SO_BINDTODEVICE, interface.encode() + b"\0")
+
+
+def _send_json(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """Send one JSON line."""
+    sock.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _read_json(stream: BinaryIO) -> Dict[str, Any]:
+    """Read one JSON line (ConnectionError at EOF)."""
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Benchmark peer closed the connection")
+    return dict(json.loads(line))
+
+
+def _bounded(value: Any, low: float, high: float) -> float:
+    """Parse a client-supplied number and clamp it to [low, high]."""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"Not a finite number: {value!r}")
+    return min(max(number, low), high)
+
+
+def _watch_eof(stream: BinaryIO) -> threading.Event:
+    """Event set once the peer sends a line or closes (read on a helper thread)."""
+    event = threading.Event()
+
+    def watch():
+        try:
+            stream.readline()
+        except OSError:
+            pass
+        event.set()
+
+    threading.Thread(target=watch, name="rm530-bench-control", daemon=True).start()
+    return event
+
+
+class _Series:
+    """Bytes per interval since a start time."""
+
+    def __init__(self, interval: float, start: float):
+        self.interval = interval
+        self.start = start
+        self.buckets: List[int] = []
+
+    def add(self, nbytes: int, now: float) -> None:
+        index = int((now - self.start) / self.interval)
+        if index >= len(self.buckets):
+            self.buckets.extend([0] * (index + 1 - len(self.buckets)))
+        self.buckets[index] += nbytes
+
+
+class _UdpReceiver:
+    """Counts datagrams of one stream: bytes, loss and RFC 3550 transit jitter."""
+
+    def __init__(self, interval: float):
+        self.series = _Series(interval, time.monotonic())
+        self.bytes = 0
+        self.packets = 0
+        self.jitter = 0.0
+        self._transit: Optional[float] = None
+
+    def add(self, data: bytes, now: float) -> None:
+        if len(data) < _UDP_HEADER.size:
+            return
+        _, sent = _UDP_HEADER.unpack_from(data)
+        self.bytes += len(data)
+        self.packets += 1
+        self.series.add(len(data), now)
+        # Sender and receiver clocks differ by a constant, which cancels out in D
+        transit = now - sent
+        if self._transit is not None:
+            self.jitter += (abs(transit - self._transit) - self.jitter) * JITTER_GAIN
+        self._transit = transit
+
+    def receive(self, sock: socket.socket, done: threading.Event) -> float:
+        """Receive until `done` is set plus a grace period; returns seconds since start."""
+        sock.settimeout(0.1)
+        last: Optional[float] = None
+        deadline: Optional[float] = None
+        while deadline is None or time.monotonic() < deadline:
+            if deadline is None and done.is_set():
+                deadline = time.monotonic() + UDP_GRACE
+            try:
+                data = sock.recv(65535)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                logger.debug(f"UDP receive error: {e}")
+                continue
+            last = time.monotonic()
+            self.add(data, last)
+        return (last or time.monotonic()) - self.series.start
+
+    def result(self, seconds: float) -> Dict[str, Any]:
+        return {
+            "bytes": self.bytes,
+            "seconds": seconds,
+            "series": self.series.buckets,
+            "packets_received": self.packets,
+            "jitter": self.jitter * 1000.0 if self.packets > 1 else None,
+        }
+
+
+def _udp_send(sock: socket.socket, duration: float, rate: float, size: int) -> int:
+    """Send paced, sequenced datagrams on a connected UDP socket; returns the count."""
+    payload = bytearray(max(size, _UDP_HEADER.size))
+    gap = len(payload) * 8 / rate
+    start = time.monotonic()
+    seq = 0
+    while True:
+        now = time.monotonic()
+        if now - start >= duration:
+            break
+        due = start + seq * gap
+        if due > now:
+            time.sleep(due - now)
+        _UDP_HEADER.pack_into(payload, 0, seq, time.monotonic())
+        try:
+            sock.send(payload)
+        except OSError as e:
+            # ENOBUFS and similar: the datagram is lost, as it would be on the air
+            logger.debug(f"UDP send error: {e}")
+        seq += 1
+    return seq
+
+
+@dataclass
+class StreamResult:
+    """Outcome of one benchmark stream."""
+
+    stream: int
+    bytes: int = 0  # Delivered to the receiving end
+    seconds: float = 0.0
+    series: List[int] = field(default_factory=list)  # Bytes delivered per interval
+    retransmits: Optional[int] = None  # TCP segments retransmitted by the sender
+    packets_sent: Optional[int] = None  # UDP
+    packets_received: Optional[int] = None
+    jitter: Optional[float] = None  # UDP RFC 3550 jitter in ms
+
+    @property
+    def goodput(self) -> float:
+        """Delivered bits per second."""
+        return self.bytes * 8 / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def loss(self) -> Optional[float]:
+        """Fraction of UDP datagrams lost."""
+        if not self.packets_sent:
+            return None
+        return max(0.0, 1.0 - (self.packets_received or 0) / self.packets_sent)
+
+
+@dataclass
+class BenchResult:
+    """Outcome of one benchmark run."""
+
+    protocol: str
+    direction: str
+    host: str
+    interface: Optional[str]
+    duration: float
+    interval: float
+    timestamp: float
+    streams: List[StreamResult] = field(default_factory=list)
+
+    @property
+    def goodput(self) -> float:
+        """Delivered bits per second over all streams."""
+        return sum(stream.goodput for stream in self.streams)
+
+    @property
+    def fairness(self) -> Optional[float]:
+        """Jain's fairness index of the per-stream goodputs."""
+        return jain_fairness([stream.goodput for stream in self.streams])
+
+    @property
+    def retransmits(self) -> Optional[int]:
+        """TCP retransmits over all streams."""
+        counts = [s.retransmits for s in self.streams if s.retransmits is not None]
+        return sum(counts) if counts else None
+
+    @property
+    def loss(self) -> Optional[float]:
+        """Fraction of UDP datagrams lost over all streams."""
+        sent = sum(stream.packets_sent or 0 for stream in self.streams)
+        if not sent:
+            return None
+        received = sum(stream.packets_received or 0 for stream in self.streams)
+        return max(0.0, 1.0 - received / sent)
+
+    @property
+    def jitter(self) -> Optional[float]:
+        """Mean UDP jitter of the streams in ms."""
+        values = [s.jitter for s in self.streams if s.jitter is not None]
+        return sum(values) / len(values) if values else None
+
+    @property
+    def series(self) -> List[float]:
+        """Goodput over all streams per interval, in bits per second."""
+        length = max((len(stream.series) for stream in self.streams), default=0)
+        totals = [0] * length
+        for stream in self.streams:
+            for i, nbytes in enumerate(stream.series):
+                totals[i] += nbytes
+        return [nbytes * 8 / self.interval for nbytes in totals]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Result with per-stream details and the aggregate figures."""
+        data = asdict(self)
+        for stream, values in zip(self.streams, data["streams"]):
+            values["goodput"] = stream.goodput
+            values["loss"] = stream.loss
+        data.update(
+            goodput=self.goodput,
+            fairness=self.fairness,
+            retransmits=self.retransmits,
+            loss=self.loss,
+            jitter=self.jitter,
+            series=self.series,
+        )
+        return data
+
+    def __str__(self) -> str:
+        """String representation."""
+        text = (
+            f"{self.protocol.upper()} {self.direction} x{len(self.streams)}: "
+            f"{self.goodput / 1e6:.2f} Mbit/s"
+        )
+        if self.fairness is not None:
+            text += f", fairness {self.fairness:.2f}"
+        if self.retransmits is not None:
+            text += f", {self.retransmits} retransmits"
+        if self.loss is not None:
+            text += f", loss {self.loss * 100:.2f}%"
+        return text
+
+
+def record_bench(
+    store: MetricStore,
+    result: BenchResult,
+    signal: Optional[SignalQuality] = None,
+    timestamp: Optional[float] = None,
+) -> None:
+    """
+    Append a benchmark result to the bench series of a metric store.
+
+    Args:
+        store: Open MetricStore
+        result: Benchmark result
+        signal: Signal quality during the test, stored in the same record
+            to correlate throughput with radio conditions
+        timestamp: Record time (default: result.timestamp)
+    """
+    # Sparse and kept for a year; small segments avoid preallocating a day of records
+    store.create_series(
+        BENCH_SERIES, BENCH_FIELDS, retention=TIER_RETENTION[3600], segment_records=1024
+    )
+    store.append(
+        BENCH_SERIES,
+        result.timestamp if timestamp is None else timestamp,
+        {
+            "udp": 1.0 if result.protocol == "udp" else 0.0,
+            "upload": 1.0 if result.direction == "upload" else 0.0,
+            "streams": len(result.streams),
+            "goodput": result.goodput,
+            "fairness": result.fairness,
+            "retransmits": result.retransmits,
+            "loss": result.loss,
+            "jitter": result.jitter,
+            **(signal_values(signal) if signal is not None else {}),
+        },
+    )
+
+
+class BenchServer:
+    """
+    Endpoint for BenchClient runs.
+
+    Each stream is one TCP connection opened with a JSON request line. TCP
+    streams carry the data on that connection. For UDP streams it is the
+    control channel and the data goes over a UDP socket the server opens for
+    the stream. Receiver-side counts are kept per run until the client asks
+    for its report.
+
+    There is no authentication. Durations, UDP rates and datagram sizes are
+    clamped to MAX_DURATION, MAX_UDP_RATE and MAX_UDP_SIZE, and UDP downloads
+    only go to the address of the control connection, but anyone who can
+    reach the port can still use it; listen on a public address only where
+    that is acceptable.
+
+    Examples:
+        >>> server = BenchServer("0.0.0.0", port=9531)
+        >>> server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_BENCH_PORT,
+        interface: Optional[str] = None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            host: Address to listen on (loopback only by default)
+            port: TCP port to listen on (UDP data uses ephemeral ports)
+            interface: Interface to bind data sockets to (optional)
+        """
+        self.interface = interface
+        self._results: Dict[str, Tuple[float, Dict[int, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        bench = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    bench._handle(self.connection, self.rfile, _read_json(self.rfile))
+                except (OSError, ValueError, KeyError) as e:
+                    logger.debug(f"Benchmark stream from {self.client_address} failed: {e}")
+
+        class Server(socketserver.ThreadingTCPServer):
+            address_family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            allow_reuse_address = True
+            daemon_threads = True
+
+        self._server = Server((host, port), Handler)
+        self.port = self._server.server_address[1]
+
+    def serve_forever(self) -> None:
+        """Serve until stop() is called."""
+        logger.info(f"Benchmark server listening on port {self.port}")
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Serve in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, name="rm530-bench-server", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _handle(self, conn: socket.socket, rfile: BinaryIO, request: Dict[str, Any]) -> None:
+        """Serve one request line."""
+        if request.get("op") == "report":
+            with self._lock:
+                _, results = self._results.pop(request["id"], (0.0, {}))
+            _send_json(conn, {str(stream): result for stream, result in results.items()})
+            return
+
+        protocol, direction = request["protocol"], request["direction"]
+        duration = _bounded(request["duration"], 0.0, MAX_DURATION)
+        interval = _bounded(request.get("interval", DEFAULT_INTERVAL), MIN_INTERVAL, MAX_DURATION)
+        if protocol == "tcp" and direction == "upload":
+            result = self._tcp_receive(rfile, interval)
+        elif protocol == "tcp":
+            result = self._tcp_send(conn, duration)
+        else:
+            result = self._udp(conn, rfile, request, duration, interval)
+
+        now = time.monotonic()
+        with self._lock:
+            # Runs whose client never asked for the report
+            for run, (created, _) in list(self._results.items()):
+                if now - created > 600:
+                    del self._results[run]
+            self._results.setdefault(request["id"], (now, {}))[1][int(request["stream"])] = result
+
+    @staticmethod
+    def _tcp_receive(rfile: BinaryIO, interval: float) -> Dict[str, Any]:
+        """Count bytes until the client closes its side."""
+        buffer = bytearray(BLOCK_SIZE)
+        series = _Series(interval, time.monotonic())
+        total = 0
+        now = series.start
+        while True:
+            count = rfile.readinto1(buffer)  # type: ignore[attr-defined]
+            if not count:
+                break
+            now = time.monotonic()
+            total += count
+            series.add(count, now)
+        return {"bytes": total, "seconds": now - series.start, "series": series.buckets}
+
+    @staticmethod
+    def _tcp_send(conn: socket.socket, duration: float) -> Dict[str, Any]:
+        """Send for `duration` seconds, then close."""
+        block = bytes(BLOCK_SIZE)
+        deadline = time.monotonic() + duration
+        sent = 0
+        try:
+            while time.monotonic() < deadline:
+                sent += conn.send(block)
+        except OSError as e:
+            logger.debug(f"Benchmark download ended early: {e}")
+        return {"bytes_sent": sent, "retransmits": tcp_retransmits(conn)}
+
+    def _udp(
+        self,
+        conn: socket.socket,
+        rfile: BinaryIO,
+        request: Dict[str, Any],
+        duration: float,
+        interval: float,
+    ) -> Dict[str, Any]:
+        """Run one UDP stream, with `conn` as its control channel."""
+        with socket.socket(conn.family, socket.SOCK_DGRAM) as sock:
+            _bind_device(sock, self.interface)
+            sock.bind((conn.getsockname()[0], 0))
+            _send_json(conn, {"port": sock.getsockname()[1]})
+
+            if request["direction"] == "upload":
+                receiver = _UdpReceiver(interval)
+                seconds = receiver.receive(sock, _watch_eof(rfile))
+                return receiver.result(seconds)
+
+            # Download: wait for the client's hello to learn its port
+            rate = _bounded(request["rate"], 1.0, MAX_UDP_RATE)
+            size = int(_bounded(request.get("size", DEFAULT_UDP_SIZE), 0, MAX_UDP_SIZE))
+            client = conn.getpeername()[0]
+            deadline = time.monotonic() + CONNECT_TIMEOUT
+            while True:
+                sock.settimeout(max(deadline - time.monotonic(), 0.001))
+                _, peer = sock.recvfrom(64)
+                if peer[0] == client:
+                    break
+                logger.debug(f"Ignoring UDP hello from {peer[0]}, expected {client}")
+            sock.connect(peer)
+            return {"packets_sent": _udp_send(sock, duration, rate, size)}
+
+
+class BenchClient:
+    """
+    Measure throughput to a BenchServer over parallel streams.
+
+    Every stream's sockets are bound to `interface` (SO_BINDTODEVICE), so
+    the traffic takes the modem link whatever the routing table says.
+    Goodput is counted where the data arrives: by the server for uploads,
+    here for downloads. TCP retransmits come from the sender's TCP_INFO.
+    UDP streams are paced to `udp_rate` and report loss and jitter.
+
+    Examples:
+        >>> client = BenchClient("bench.example.net", interface="usb0", streams=4)
+        >>> print(client.run("tcp", "download"))
+        TCP download x4: 182.40 Mbit/s, fairness 0.98, 112 retransmits
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_BENCH_PORT,
+        interface: Optional[str] = None,
+        streams: int = DEFAULT_STREAMS,
+        duration: float = DEFAULT_DURATION,
+        interval: float = DEFAULT_INTERVAL,
+        udp_rate: float = DEFAULT_UDP_RATE,
+        udp_size: int = DEFAULT_UDP_SIZE,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            host: Server address
+            port: Server TCP port
+            interface: Interface to bind all sockets to
+            streams: Parallel streams
+            duration: Seconds each run transfers data
+            interval: Seconds per time-series point
+            udp_rate: UDP send rate in bits per second over all streams
+            udp_size: UDP datagram payload in bytes
+        """
+        if streams < 1:
+            raise ValueError("streams must be at least 1")
+        if duration <= 0 or interval <= 0:
+            raise ValueError("duration and interval must be positive")
+        self.host = host
+        self.port = port
+        self.interface = interface
+        self.streams = streams
+        self.duration = duration
+        self.interval = interval
+        self.udp_rate = udp_rate
+        self.udp_size = udp_size
+
+    def run(self, protocol: str = "tcp", direction: str = "upload") -> BenchResult:
+        """
+        Run one benchmark.
+
+        Args:
+            protocol: "tcp" or "udp"
+            direction: "upload" (to the server) or "download"
+
+        Returns:
+            BenchResult
+
+        Raises:
+            ValueError: Unknown protocol or direction
+            OSError: The server could not be reached
+        """
+        if protocol not in PROTOCOLS or direction not in DIRECTIONS:
+            raise ValueError(f"Invalid benchmark: {protocol} {direction}")
+        run_id = os.urandom(8).hex()
+        result = BenchResult(
+            protocol=protocol,
+            direction=direction,
+            host=self.host,
+            interface=self.interface,
+            duration=self.duration,
+            interval=self.interval,
+            timestamp=time.time(),
+            streams=[StreamResult(stream=i) for i in range(self.streams)],
+        )
+        barrier = threading.Barrier(self.streams)
+        errors: List[BaseException] = []
+        runner: Callable[..., None] = getattr(self, f"_{protocol}_{direction}")
+
+        def stream(index: int) -> None:
+            request = {
+                "id": run_id,
+                "stream": index,
+                "protocol": protocol,
+                "direction": direction,
+                "duration": self.duration,
+                "interval": self.interval,
+                "rate": self.udp_rate / self.streams,
+                "size": self.udp_size,
+            }
+            try:
+                with self._connect() as sock:
+                    _send_json(sock, request)
+                    runner(sock, barrier, result.streams[index])
+            except threading.BrokenBarrierError:
+                pass  # Another stream failed
+            except OSError as e:
+                errors.append(e)
+                barrier.abort()
+
+        threads = [
+            threading.Thread(target=stream, args=(i,), name=f"rm530-bench-{i}", daemon=True)
+            for i in range(self.streams)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+        with self._connect() as sock:
+            _send_json(sock, {"op": "report", "id": run_id})
+            report = _read_json(sock.makefile("rb"))
+        names = {f.name for f in fields(StreamResult)}
+        for stream_result in result.streams:
+            for key, value in report.get(str(stream_result.stream), {}).items():
+                if key in names:
+                    setattr(stream_result, key, value)
+        return result
+
+    def _connect(self) -> socket.socket:
+        """Open a TCP connection to the server over the interface."""
+        family, kind, proto, _, address = socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        )[0]
+        sock = socket.socket(family, kind, proto)
+        try:
+            _bind_device(sock, self.interface)
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(address)
+            sock.settimeout(self.duration + CONNECT_TIMEOUT)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _udp_socket(self, control: socket.socket, port: int) -> socket.socket:
+        """Open the UDP data socket of a stream."""
+        sock = socket.socket(control.family, socket.SOCK_DGRAM)
+        try:
+            _bind_device(sock, self.interface)
+            sock.connect((control.getpeername()[0], port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _tcp_upload(
+        self, sock: socket.socket, barrier: threading.Barrier, result: StreamResult
+    ) -> None:
+        block = bytes(BLOCK_SIZE)
+        barrier.wait()
+        deadline = time.monotonic() + self.duration
+        while time.monotonic() < deadline:
+            sock.send(block)
+        sock.shutdown(socket.SHUT_WR)
+        while sock.recv(4096):  # The server closes once it has read everything
+            pass
+        result.retransmits = tcp_retransmits(sock)
+
+    def _tcp_download(
+        self, sock: socket.socket, barrier: threading.Barrier, result: StreamResult
+    ) -> None:
+        buffer = bytearray(BLOCK_SIZE)
+        barrier.wait()
+        series = _Series(self.interval, time.monotonic())
+        now = series.start
+        while True:
+            count = sock.recv_into(buffer)
+            if not count:
+                break
+            now = time.monotonic()
+            result.bytes += count
+            series.add(count, now)
+        result.seconds = now - series.start
+        result.series = series.buckets
+
+    def _udp_upload(
+        self, sock: socket.socket, barrier: threading.Barrier, result: StreamResult
+    ) -> None:
+        control = sock.makefile("rb")
+        port = _read_json(control)["port"]
+        with self._udp_socket(sock, port) as data:
+            barrier.wait()
+            result.packets_sent = _udp_send(
+                data, self.duration, self.udp_rate / self.streams, self.udp_size
+            )
+        sock.sendall(b"done\n")
+        control.readline()  # The server closes once the grace period is over
+
+    def _udp_download(
+        self, sock: socket.socket, barrier: threading.Barrier, result: StreamResult
+    ) -> None:
+        control = sock.makefile("rb")
+        port = _read_json(control)["port"]
+        with self._udp_socket(sock, port) as data:
+            barrier.wait()
+            receiver = _UdpReceiver(self.interval)
+            # Say hello until data flows, in case the first one is lost
+            data.settimeout(0.2)
+            while True:
+                data.send(b"hello")
+                try:
+                    first = data.recv(65535)
+                except socket.timeout:
+                    if time.monotonic() - receiver.series.start > CONNECT_TIMEOUT:
+                        raise
+                    continue
+                receiver.series.start = time.monotonic()
+                receiver.add(first, receiver.series.start)
+                break
+            seconds = receiver.receive(data, _watch_eof(control))
+        stats = receiver.result(seconds)
+        result.bytes = stats["bytes"]
+        result.seconds = stats["seconds"]
+        result.series = stats["series"]
+        result.packets_received = stats["packets_received"]
+        result.jitter = stats["jitter"]
@@ -0,0 +1,342 @@
+"""Prometheus metrics endpoint for modem, link and health metrics."""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from rm530_5g_integration.core.health import HealthMonitor, HealthStatus
+from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.stats import ConnectionStats
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORTER_PORT = 9530
+DEFAULT_REFRESH_INTERVAL = 15.0
+DEFAULT_HEALTH_INTERVAL = 60.0
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Mapping[str, object]
+
+
+def _escape(value: object) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsBuilder:
+    """Collect metric families and render them in the Prometheus text format."""
+
+    def __init__(self):
+        """Initialize builder."""
+        self._families: Dict[str, Tuple[str, str, List[Tuple[Labels, float]]]] = {}
+
+    def add(
+        self,
+        name: str,
+        value: Optional[float],
+        help_text: str,
+        kind: str = "gauge",
+        labels: Optional[Labels] = None,
+    ) -> None:
+        """
+        Add a sample (skipped when value is None).
+
+        Args:
+            name: Metric name
+            value: Sample value
+            help_text: HELP line of the family
+            kind: "gauge" or "counter"
+            labels: Label names and values (None values are left out)
+        """
+        if value is None:
+            return
+        family = self._families.setdefault(name, (help_text, kind, []))
+        family[2].append((labels or {}, float(value)))
+
+    def render(self) -> bytes:
+        """Render all families."""
+        lines = []
+        for name, (help_text, kind, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(
+                    f'{key}="{_escape(val)}"' for key, val in labels.items() if val is not None
+                )
+                series = f"{name}{{{label_text}}}" if label_text else name
+                lines.append(f"{series} {_format_value(value)}")
+        return ("\n".join(lines) + "\n").encode()
+
+
+def add_connection_metrics(builder: MetricsBuilder, stats: ConnectionStats) -> None:
+    """Add interface metrics from ConnectionStats."""
+    labels = {"interface": stats.interface}
+    builder.add(
+        "rm530_interface_connected",
+        1.0 if stats.is_connected else 0.0,
+        "Whether the interface has an IPv4 address",
+        labels=labels,
+    )
+    counters = (
+        ("rm530_interface_receive_bytes_total", stats.bytes_received, "Bytes received"),
+        ("rm530_interface_transmit_bytes_total", stats.bytes_sent, "Bytes sent"),
+        ("rm530_interface_receive_packets_total", stats.packets_received, "Packets received"),
+        ("rm530_interface_transmit_packets_total", stats.packets_sent, "Packets sent"),
+    )
+    for name, value, help_text in counters:
+        builder.add(name, value, help_text, kind="counter", labels=labels)
+    if stats.rates is not None:
+        builder.add(
+            "rm530_interface_receive_rate_bytes",
+            stats.rates.rx_bytes,
+            "Receive rate in bytes per second over the last refresh",
+            labels=labels,
+        )
+        builder.add(
+            "rm530_interface_transmit_rate_bytes",
+            stats.rates.tx_bytes,
+            "Transmit rate in bytes per second over the last refresh",
+            labels=labels,
+        )
+    if stats.uptime is not None:
+        builder.add(
+            "rm530_interface_uptime_seconds",
+            stats.uptime.total_seconds(),
+            "Seconds since the link was seen coming up",
+            labels=labels,
+        )
+
+
+def add_signal_metrics(builder: MetricsBuilder, quality: SignalQuality) -> None:
+    """Add signal metrics from SignalQuality."""
+    builder.add("rm530_signal_rssi_dbm", quality.rssi, "Received signal strength (AT+CSQ)")
+    if quality.network_type:
+        builder.add(
+            "rm530_network_info",
+            1.0,
+            "Access technology reported by the modem",
+            labels={"type": quality.network_type},
+        )
+    for cell in quality.cells:
+        labels = {"rat": cell.rat, "band": cell.band, "pci": cell.pci}
+        builder.add("rm530_cell_rsrp_dbm", cell.rsrp, "Serving cell RSRP", labels=labels)
+        builder.add("rm530_cell_rsrq_db", cell.rsrq, "Serving cell RSRQ", labels=labels)
+        builder.add("rm530_cell_sinr_db", cell.sinr, "Serving cell SINR", labels=labels)
+
+
+def add_health_metrics(builder: MetricsBuilder, status: HealthStatus) -> None:
+    """Add health check metrics from HealthStatus."""
+    builder.add(
+        "rm530_health_healthy", 1.0 if status.is_healthy else 0.0, "Result of the last check"
+    )
+    builder.add(
+        "rm530_health_consecutive_failures",
+        status.consecutive_failures,
+        "Consecutive failed health checks",
+    )
+    builder.add("rm530_health_issues", len(status.issues), "Issues found by the last check")
+    builder.add(
+        "rm530_health_last_check_timestamp_seconds",
+        status.last_check.timestamp(),
+        "Time of the last health check",
+    )
+    latency = status.latency
+    if latency:
+        labels = {"target": latency["target"]}
+        for quantile, key in (("0.5", "rtt_p50"), ("0.95", "rtt_p95"), ("0.99", "rtt_p99")):
+            if latency[key] is not None:
+                builder.add(
+                    "rm530_probe_rtt_seconds",
+                    latency[key] / 1000,
+                    "Probe round-trip time over the health check window",
+                    labels={**labels, "quantile": quantile},
+                )
+        if latency["jitter"] is not None:
+            builder.add(
+                "rm530_probe_jitter_seconds",
+                latency["jitter"] / 1000,
+                "RFC 3550 interarrival jitter of probe replies",
+                labels=labels,
+            )
+        builder.add("rm530_probe_loss_ratio", latency["loss"], "Probes lost", labels=labels)
+        builder.add(
+            "rm530_probe_reordered", latency["reordered"], "Replies out of order", labels=labels
+        )
+
+
+class MetricsExporter:
+    """
+    Serve modem, link and health metrics for Prometheus.
+
+    One background thread refreshes connection statistics and signal
+    quality every `interval` seconds (and runs a health check every
+    `health_interval`), then renders the page once. Scrapes return the
+    cached page, so they never wait on the modem, and the modem only sees
+    one client.
+
+    Examples:
+        >>> exporter = MetricsExporter(RM530Manager(), port=9530)
+        >>> exporter.start()
+        >>> # curl http://localhost:9530/metrics
+    """
+
+    def __init__(
+        self,
+        manager: RM530Manager,
+        interface: str = "usb0",
+        host: str = "0.0.0.0",
+        port: int = DEFAULT_EXPORTER_PORT,
+        interval: float = DEFAULT_REFRESH_INTERVAL,
+        monitor: Optional[HealthMonitor] = None,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            manager: RM530Manager instance
+            interface: Network interface to report
+            host: Address to listen on
+            port: TCP port to listen on
+            interval: Seconds between refreshes
+            monitor: HealthMonitor to run checks with (None to skip health metrics)
+            health_interval: Seconds between health checks
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.manager = manager
+        self.interface = interface
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.monitor = monitor
+        self.health_interval = health_interval
+        self.refresh_errors = 0
+        self._page = MetricsBuilder().render()
+        self._health: Optional[HealthStatus] = None
+        self._next_health = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def page(self) -> bytes:
+        """Current metrics page."""
+        return self._page
+
+    def refresh(self) -> None:
+        """Collect fresh metrics and re-render the page."""
+        started = time.monotonic()
+        builder = MetricsBuilder()
+        up = True
+
+        try:
+            add_connection_metrics(builder, self.manager.status(self.interface))
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning(f"Failed to read connection stats: {e}")
+
+        try:
+            add_signal_metrics(builder, self.manager.signal_quality())
+        except Exception as e:
+            up = False
+            self.refresh_errors += 1
+            logger.warning(f"Failed to read signal quality: {e}")
+
+        if self.monitor is not None and started >= self._next_health:
+            self._next_health = started + self.health_interval
+            try:
+                self._health = self.monitor.check_health()
+            except Exception as e:
+                self.refresh_errors += 1
+                logger.warning(f"Health check failed: {e}")
+        if self._health is not None:
+            add_health_metrics(builder, self._health)
+
+        builder.add("rm530_up", 1.0 if up else 0.0, "Whether the modem answered the last refresh")
+        builder.add(
+            "rm530_refresh_duration_seconds",
+            time.monotonic() - started,
+            "Time taken by the last refresh",
+        )
+        builder.add("rm530_refresh_timestamp_seconds", time.time(), "Time of the last refresh")
+        builder.add(
+            "rm530_refresh_errors_total",
+            self.refresh_errors,
+            "Failed reads since start",
+            kind="counter",
+        )
+        self._page = builder.render()
+
+    def start(self) -> None:
+        """Start refreshing and serving in background threads."""
+        if self._thread is not None:
+            return
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.page
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                logger.debug(f"{self.address_string()} {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(
+            target=self._server.serve_forever, name="rm530-exporter-http", daemon=True
+        ).start()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rm530-exporter", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics exporter listening on {self.host}:{self.port}")
+
+    def stop(self) -> None:
+        """Stop serving and refreshing."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Refresh loop."""
+        next_time = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Metrics refresh error: {e}")
+            next_time += self.interval
+            now = time.monotonic()
+            if next_time < now:
+                # Refresh took longer than the interval; skip the missed slots
+                next_time += math.ceil((now - next_time) / self.interval) * self.interval
+            self._stop.wait(next_time - now)
@@ -0,0 +1,252 @@
+"""Continuous latency, jitter, loss and reordering measurement."""
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from rm530_5g_integration.core.probe import DEFAULT_PROBE_TIMEOUT, Prober, ProbeTarget
+from rm530_5g_integration.monitoring.sampler import SampleRing
+from rm530_5g_integration.monitoring.statistics import _percentile
+from rm530_5g_integration.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columns stored per probe outcome: wire sequence, RTT in ms (NaN if lost),
+# 1.0 if the reply arrived after a reply to a later probe
+LATENCY_METRICS = ("seq", "rtt", "reordered")
+
+# Default ring size: one hour at 5 Hz
+DEFAULT_LATENCY_CAPACITY = 18000
+DEFAULT_LATENCY_WINDOW = 60.0
+
+# RFC 3550 section 6.4.1 jitter gain
+JITTER_GAIN = 1 / 16
+
+
+@dataclass
+class LatencyStats:
+    """Latency statistics over a window of probes."""
+
+    sent: int = 0
+    received: int = 0
+    loss: Optional[float] = None  # Fraction of probes lost
+    rtt_min: Optional[float] = None  # All RTTs in ms
+    rtt_mean: Optional[float] = None
+    rtt_p50: Optional[float] = None
+    rtt_p95: Optional[float] = None
+    rtt_p99: Optional[float] = None
+    rtt_max: Optional[float] = None
+    jitter: Optional[float] = None  # RFC 3550 interarrival jitter in ms
+    reordered: int = 0
+    reorder_rate: Optional[float] = None  # Fraction of replies that arrived out of order
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Fields as a dictionary."""
+        return asdict(self)
+
+    def __str__(self) -> str:
+        """String representation."""
+        if not self.received:
+            return f"{self.sent} probes, none answered"
+        loss = self.loss or 0.0
+        return (
+            f"rtt p50/p95/p99 {self.rtt_p50:.1f}/{self.rtt_p95:.1f}/{self.rtt_p99:.1f} ms, "
+            f"jitter {self.jitter:.1f} ms, loss {loss * 100:.1f}%, "
+            f"reordered {self.reordered}"
+        )
+
+
+def rfc3550_jitter(rtts: Sequence[float]) -> Optional[float]:
+    """
+    Interarrival jitter of RTTs in arrival order (RFC 3550, section 6.4.1).
+
+    Each RTT difference D between consecutive replies moves the estimate
+    by (|D| - J) / 16, starting from 0.
+
+    Args:
+        rtts: RTTs of answered probes, in the order the replies arrived
+
+    Returns:
+        Jitter in the RTTs' unit, or None with fewer than two RTTs
+    """
+    if len(rtts) < 2:
+        return None
+    jitter = 0.0
+    for previous, current in zip(rtts, rtts[1:]):
+        jitter += (abs(current - previous) - jitter) * JITTER_GAIN
+    return jitter
+
+
+def summarize_latency(rtts: Sequence[float], reordered: Sequence[float]) -> LatencyStats:
+    """
+    Compute latency statistics from probe outcomes.
+
+    Args:
+        rtts: RTT per probe in ms (NaN for lost probes), in the order outcomes were known
+        reordered: 1.0 per answered probe whose reply arrived out of order, else 0.0
+
+    Returns:
+        LatencyStats
+    """
+    answered = [rtt for rtt in rtts if not math.isnan(rtt)]
+    stats = LatencyStats(sent=len(rtts), received=len(answered))
+    if not rtts:
+        return stats
+    stats.loss = 1.0 - len(answered) / len(rtts)
+    if not answered:
+        return stats
+
+    ordered = sorted(answered)
+    stats.rtt_min = ordered[0]
+    stats.rtt_max = ordered[-1]
+    stats.rtt_mean = sum(answered) / len(answered)
+    stats.rtt_p50 = _percentile(ordered, 50)
+    stats.rtt_p95 = _percentile(ordered, 95)
+    stats.rtt_p99 = _percentile(ordered, 99)
+    stats.jitter = rfc3550_jitter(answered)
+    stats.reordered = int(sum(flag for flag in reordered if not math.isnan(flag)))
+    stats.reorder_rate = stats.reordered / len(answered)
+    return stats
+
+
+class LatencyProber:
+    """
+    Probe one target continuously and keep every outcome in a ring buffer.
+
+    Timestamped probes go out at `rate_hz` on a background thread, over
+    sockets bound to the modem interface (see core.probe.Prober). Each
+    reply or timeout is written to a SampleRing as it happens, so RTT
+    percentiles, RFC 3550 jitter, loss and reordering can be computed
+    over any recent window (summary()) in constant memory.
+
+    Examples:
+        >>> prober = LatencyProber("8.8.8.8", interface="usb0", rate_hz=5)
+        >>> prober.start()
+        >>> time.sleep(60)
+        >>> print(prober.summary(window=60))
+        rtt p50/p95/p99 34.1/52.7/88.0 ms, jitter 3.2 ms, loss 0.3%, reordered 0
+    """
+
+    def __init__(
+        self,
+        target: Union[str, ProbeTarget] = "8.8.8.8",
+        interface: Optional[str] = None,
+        rate_hz: float = 5.0,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        capacity: int = DEFAULT_LATENCY_CAPACITY,
+        ring: Optional[SampleRing] = None,
+    ):
+        """
+        Initialize latency prober.
+
+        Args:
+            target: Target spec (see ProbeTarget.parse)
+            interface: Interface to send probes on
+            rate_hz: Probes per second
+            timeout: Seconds after which a probe counts as lost
+            capacity: Ring size when no ring is given
+            ring: SampleRing with LATENCY_METRICS columns to write to (optional)
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.target = ProbeTarget.parse(target)
+        self.interface = interface
+        self.rate_hz = rate_hz
+        self.timeout = timeout
+        self.ring = ring or SampleRing(capacity, metrics=LATENCY_METRICS)
+        self.error: Optional[str] = None
+        self._highest: Optional[int] = None  # Highest sequence answered so far
+        self._listeners: List[Callable[[float, Dict[str, Optional[float]]], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the probing thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_listener(self, callback: Callable[[float, Dict[str, Optional[float]]], None]) -> None:
+        """
+        Add a callback called with (timestamp, values) after each probe outcome.
+
+        Callbacks run on the probing thread and must not block.
+        """
+        self._listeners.append(callback)
+
+    def record(self, seq: int, rtt: Optional[float], timestamp: Optional[float] = None) -> None:
+        """
+        Record the outcome of a probe.
+
+        Args:
+            seq: 16-bit probe sequence number
+            rtt: Round-trip time in ms (None if lost)
+            timestamp: Time the outcome was known (default: now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        reordered = None
+        if rtt is not None:
+            # Serial number arithmetic, so the 16-bit sequence may wrap
+            behind = (self._highest - seq) & 0xFFFF if self._highest is not None else 0
+            reordered = 1.0 if 0 < behind < 0x8000 else 0.0
+            if not reordered:
+                self._highest = seq
+        values = {"seq": float(seq), "rtt": rtt, "reordered": reordered}
+        self.ring.append(timestamp, values)
+        for callback in self._listeners:
+            try:
+                callback(timestamp, values)
+            except Exception as e:
+                logger.error(f"Latency listener error: {e}")
+
+    def summary(self, window: float = DEFAULT_LATENCY_WINDOW) -> LatencyStats:
+        """
+        Latency statistics over recent probes.
+
+        Probes still awaiting a reply are not counted yet.
+
+        Args:
+            window: Seconds of history to include
+
+        Returns:
+            LatencyStats
+        """
+        since = time.time() - window
+        rtts: List[float] = []
+        reordered: List[float] = []
+        for segment in self.ring.window_since("rtt", since):
+            rtts.extend(segment)
+        for segment in self.ring.window_since("reordered", since):
+            reordered.extend(segment)
+        return summarize_latency(rtts, reordered)
+
+    def start(self) -> None:
+        """Start probing in a background thread."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rm530-latency", daemon=True)
+        self._thread.start()
+        logger.info(f"Latency probing of {self.target} started at {self.rate_hz} Hz")
+
+    def stop(self) -> None:
+        """Stop probing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        logger.info("Latency probing stopped")
+
+    def _run(self) -> None:
+        """Probing loop; reopens the socket if it cannot be created (e.g. link gone)."""
+        prober = Prober(interface=self.interface, timeout=self.timeout, interval=1 / self.rate_hz)
+        while not self._stop.is_set():
+            try:
+                prober.stream(self.target, self.record, self._stop)
+                self.error = None
+            except OSError as e:
+                if self.error != str(e):
+                    logger.warning(f"Latency probing of {self.target} failed: {e}")
+                self.error = str(e)
+                self._stop.wait(max(1.0, self.timeout))
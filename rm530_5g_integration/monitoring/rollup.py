@@ -0,0 +1,226 @@
+"""Incremental downsampling of metric series into coarser rollup tiers."""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Rollup bucket sizes in seconds, finest first
+ROLLUP_TIERS = (60, 900, 3600)
+
+# Aggregates kept per metric in every rollup record
+ROLLUP_STATS = ("min", "max", "mean", "count", "last")
+
+# Seconds of history kept per tier (0 = raw samples)
+TIER_RETENTION = {0: 86400.0, 60: 7 * 86400.0, 900: 30 * 86400.0, 3600: 365 * 86400.0}
+
+
+def tier_series(series: str, tier: int) -> str:
+    """Name of the series holding a rollup tier (e.g. "signal@60s")."""
+    return f"{series}@{tier}s"
+
+
+def rollup_fields(fields: Sequence[str]) -> Tuple[str, ...]:
+    """Field names of a rollup record: <metric>_<stat> for every metric and stat."""
+    return tuple(f"{name}_{stat}" for name in fields for stat in ROLLUP_STATS)
+
+
+def select_tier(resolution: Optional[float], tiers: Sequence[int] = ROLLUP_TIERS) -> int:
+    """
+    Pick the coarsest tier that is at least as fine as a resolution.
+
+    Args:
+        resolution: Largest acceptable spacing between points in seconds (None for raw)
+        tiers: Available tiers
+
+    Returns:
+        Tier in seconds, 0 for raw samples
+    """
+    if resolution is None:
+        return 0
+    usable = [tier for tier in tiers if tier <= resolution]
+    return max(usable) if usable else 0
+
+
+@dataclass
+class RollupPoint:
+    """Aggregates of one metric over a bucket (or any merged span)."""
+
+    timestamp: float  # Bucket start
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    count: int = 0
+    last: Optional[float] = None
+
+    def merge(self, other: "RollupPoint") -> None:
+        """Fold a later point into this one."""
+        if not other.count:
+            return
+        if not self.count:
+            self.min, self.max, self.mean, self.count, self.last = (
+                other.min,
+                other.max,
+                other.mean,
+                other.count,
+                other.last,
+            )
+            return
+        # Both points hold samples, so their aggregates are set
+        assert self.mean is not None and self.min is not None and self.max is not None
+        assert other.mean is not None and other.min is not None and other.max is not None
+        count = self.count + other.count
+        self.mean = (self.mean * self.count + other.mean * other.count) / count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count = count
+        self.last = other.last
+
+    @classmethod
+    def from_value(cls, timestamp: float, value: Optional[float]) -> "RollupPoint":
+        """Point for a single raw sample (empty for None/NaN)."""
+        if value is None or math.isnan(value):
+            return cls(timestamp)
+        return cls(timestamp, value, value, value, 1, value)
+
+    @classmethod
+    def from_row(cls, timestamp: float, row: Sequence[Optional[float]]) -> "RollupPoint":
+        """Point from the (min, max, mean, count, last) fields of a rollup record."""
+        minimum, maximum, mean, count, last = row
+        if count is None or not count or math.isnan(count):
+            return cls(timestamp)
+        return cls(timestamp, minimum, maximum, mean, int(count), last)
+
+    def to_row(self) -> Tuple[Optional[float], ...]:
+        """Values for the (min, max, mean, count, last) fields of a rollup record."""
+        return (self.min, self.max, self.mean, self.count, self.last)
+
+
+def bucket_points(points: Iterable[RollupPoint], tier: int) -> List[RollupPoint]:
+    """
+    Merge time-ordered points into buckets of a tier.
+
+    Args:
+        points: Points, oldest first
+        tier: Bucket size in seconds
+
+    Returns:
+        One point per bucket that has any, oldest first
+    """
+    buckets: List[RollupPoint] = []
+    for point in points:
+        start = math.floor(point.timestamp / tier) * tier
+        if not buckets or buckets[-1].timestamp != start:
+            buckets.append(RollupPoint(start))
+        buckets[-1].merge(point)
+    return buckets
+
+
+class RollupAccumulator:
+    """
+    Open rollup buckets of one series, updated as samples arrive.
+
+    Raw samples fold into the finest tier's open bucket; when a sample lands
+    in a new bucket the previous one is emitted as a record and folded into
+    the next tier up, so every tier is maintained in O(tiers) per sample
+    without reading stored data back.
+
+    Examples:
+        >>> rollups = RollupAccumulator(("rsrp",))
+        >>> for tier, start, values in rollups.add(time.time(), {"rsrp": -95.0}):
+        ...     store.append(tier_series("signal", tier), start, values)
+    """
+
+    def __init__(self, fields: Sequence[str], tiers: Sequence[int] = ROLLUP_TIERS):
+        """
+        Initialize accumulator.
+
+        Args:
+            fields: Metric names
+            tiers: Bucket sizes in seconds, finest first; each a multiple of the previous
+        """
+        self.fields = tuple(fields)
+        self.tiers = tuple(tiers)
+        self._open: List[Optional[Dict[str, RollupPoint]]] = [None] * len(self.tiers)
+        self._starts: List[float] = [0.0] * len(self.tiers)
+
+    def add(
+        self, timestamp: float, values: Dict[str, Optional[float]]
+    ) -> List[Tuple[int, float, Dict[str, Optional[float]]]]:
+        """
+        Add a raw sample.
+
+        Args:
+            timestamp: Sample time
+            values: Metric values
+
+        Returns:
+            Closed buckets as (tier, bucket start, record values), finest tier first
+        """
+        points = {name: RollupPoint.from_value(timestamp, values.get(name)) for name in self.fields}
+        closed: List[Tuple[int, float, Dict[str, Optional[float]]]] = []
+        self._fold(0, timestamp, points, closed)
+        return closed
+
+    def add_bucket(
+        self, level: int, timestamp: float, row: Dict[str, Optional[float]]
+    ) -> List[Tuple[int, float, Dict[str, Optional[float]]]]:
+        """
+        Fold a stored record of tier `level - 1` into tier `level`.
+
+        Used to rebuild open buckets from finer records after a restart.
+
+        Args:
+            level: Index of the tier to fold into
+            timestamp: Record bucket start
+            row: Record values (<metric>_<stat> fields)
+
+        Returns:
+            Closed buckets, as for add()
+        """
+        points = {
+            name: RollupPoint.from_row(timestamp, [row[f"{name}_{stat}"] for stat in ROLLUP_STATS])
+            for name in self.fields
+        }
+        closed: List[Tuple[int, float, Dict[str, Optional[float]]]] = []
+        self._fold(level, timestamp, points, closed)
+        return closed
+
+    def _fold(
+        self,
+        level: int,
+        timestamp: float,
+        points: Dict[str, RollupPoint],
+        closed: List[Tuple[int, float, Dict[str, Optional[float]]]],
+    ) -> None:
+        """Fold points into tier `level`, closing and cascading finished buckets."""
+        if level >= len(self.tiers):
+            return
+        tier = self.tiers[level]
+        start = math.floor(timestamp / tier) * tier
+        current = self._open[level]
+
+        if current is not None:
+            current_start = self._starts[level]
+            if start < current_start:
+                return  # Out of order; that bucket has been written already
+            if start != current_start:
+                closed.append((tier, current_start, self._record(current)))
+                self._open[level] = None
+                self._fold(level + 1, current_start, current, closed)
+                current = None
+
+        if current is None:
+            current = {name: RollupPoint(start) for name in self.fields}
+            self._open[level] = current
+            self._starts[level] = start
+        for name, point in points.items():
+            current[name].merge(point)
+
+    @staticmethod
+    def _record(bucket: Dict[str, RollupPoint]) -> Dict[str, Optional[float]]:
+        """Record values of a closed bucket."""
+        record: Dict[str, Optional[float]] = {}
+        for name, point in bucket.items():
+            for stat, value in zip(ROLLUP_STATS, point.to_row()):
+                record[f"{name}_{stat}"] = value
+        return record
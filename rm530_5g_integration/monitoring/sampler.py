@@ -0,0 +1,308 @@
+"""High-frequency signal sampling into a fixed-size ring buffer."""
+
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from rm530_5g_integration.core.modem import Modem
+from rm530_5g_integration.core.parsers import parse_csq, parse_servingcell
+from rm530_5g_integration.monitoring.signal import SIGNAL_COMMANDS
+from rm530_5g_integration.utils.logging import get_logger
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Metric columns stored per sample (NaN when not reported)
+SAMPLE_METRICS = ("rssi", "rsrp", "rsrq", "sinr", "nr_rsrp", "nr_rsrq", "nr_sinr")
+
+# Default ring size: one day at 1 Hz
+DEFAULT_CAPACITY = 86400
+
+NAN = float("nan")
+
+
+class SampleRing:
+    """
+    Fixed-size ring of timestamped samples stored column-wise.
+
+    Every column is an array('d') allocated up front, so appends are O(1)
+    and memory stays constant however long sampling runs. Windows are
+    returned as memoryviews (or NumPy views) onto the columns, without
+    copying.
+
+    Examples:
+        >>> ring = SampleRing(capacity=3600)
+        >>> ring.append(time.time(), {"rssi": -71.0, "rsrp": -95.0})
+        >>> segments = ring.window("rsrp", last=60)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, metrics: Sequence[str] = SAMPLE_METRICS):
+        """
+        Initialize ring.
+
+        Args:
+            capacity: Maximum number of samples kept
+            metrics: Metric column names
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self._columns: Dict[str, array] = {
+            name: array("d", [NAN]) * capacity for name in ("timestamp",) + self.metrics
+        }
+        self._next = 0  # Slot the next sample is written to
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of samples held."""
+        return self._count
+
+    def append(self, timestamp: float, values: Dict[str, Optional[float]]) -> None:
+        """
+        Add a sample, overwriting the oldest one when full.
+
+        Args:
+            timestamp: Sample time (time.time())
+            values: Metric values; missing or None metrics are stored as NaN
+        """
+        with self._lock:
+            i = self._next
+            self._columns["timestamp"][i] = timestamp
+            for name in self.metrics:
+                value = values.get(name)
+                self._columns[name][i] = NAN if value is None else value
+            self._next = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def clear(self) -> None:
+        """Drop all samples (memory stays allocated)."""
+        with self._lock:
+            self._next = 0
+            self._count = 0
+
+    def _ranges(self, last: Optional[int]) -> List[Tuple[int, int]]:
+        """Index ranges holding the newest `last` samples, oldest first."""
+        count = self._count if last is None else max(0, min(last, self._count))
+        if count == 0:
+            return []
+        start = (self._next - count) % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            return [(start, end)]
+        return [(start, self.capacity), (0, end - self.capacity)]
+
+    def window(self, column: str, last: Optional[int] = None) -> List[memoryview]:
+        """
+        Get the newest samples of a column without copying.
+
+        The ring may wrap, so the window is one or two segments; read them
+        in order for chronological data. Views share the ring's memory, so
+        copy them (values()) if they must outlive later appends.
+
+        Args:
+            column: "timestamp" or a metric name
+            last: Number of newest samples (None for all)
+
+        Returns:
+            memoryview segments, oldest first
+        """
+        view = memoryview(self._columns[column])
+        with self._lock:
+            return [view[start:end] for start, end in self._ranges(last)]
+
+    def window_since(self, column: str, since: float) -> List[memoryview]:
+        """
+        Get the samples of a column taken at or after a time.
+
+        Args:
+            column: "timestamp" or a metric name
+            since: Earliest timestamp to include
+
+        Returns:
+            memoryview segments, oldest first
+        """
+        timestamps = memoryview(self._columns["timestamp"])
+        view = memoryview(self._columns[column])
+        with self._lock:
+            segments = []
+            for start, end in self._ranges(None):
+                # Timestamps increase within each segment
+                first = bisect_left(timestamps, since, start, end)
+                if first < end:
+                    segments.append(view[first:end])
+            return segments
+
+    def as_numpy(self, column: str, last: Optional[int] = None) -> List["np.ndarray"]:
+        """
+        Get window() segments as NumPy arrays sharing the ring's memory.
+
+        Args:
+            column: "timestamp" or a metric name
+            last: Number of newest samples (None for all)
+
+        Returns:
+            float64 ndarray views, oldest first
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed (pip install rm530-5g-integration[numpy])")
+        return [np.frombuffer(segment, dtype=np.float64) for segment in self.window(column, last)]
+
+    def values(self, column: str, last: Optional[int] = None) -> List[float]:
+        """
+        Copy the newest samples of a column into a list (oldest first).
+
+        Args:
+            column: "timestamp" or a metric name
+            last: Number of newest samples (None for all)
+
+        Returns:
+            List of values (NaN where not reported)
+        """
+        values: List[float] = []
+        for segment in self.window(column, last):
+            values.extend(segment)
+        return values
+
+
+def _metric_values(responses: Sequence) -> Dict[str, Optional[float]]:
+    """Extract sample metrics from responses to SIGNAL_COMMANDS."""
+    csq, _nwinfo, servingcell = responses
+    report = parse_servingcell(servingcell)
+    csq_info = parse_csq(csq)
+    values: Dict[str, Optional[float]] = {"rssi": csq_info.rssi_dbm if csq_info else None}
+    primary = report.primary
+    if primary is not None:
+        values["rsrp"] = primary.rsrp
+        values["rsrq"] = primary.rsrq
+        values["sinr"] = primary.sinr
+    nr = report.nr
+    if nr is not None:
+        values["nr_rsrp"] = nr.rsrp
+        values["nr_rsrq"] = nr.rsrq
+        values["nr_sinr"] = nr.sinr
+    return values
+
+
+class SignalSampler:
+    """
+    Sample signal quality continuously on one open modem.
+
+    Each sample is one chained AT round trip whose parsed metrics go straight
+    into a SampleRing. Samples are scheduled on a fixed grid (rate_hz), so a
+    slow response delays one sample instead of shifting all later ones.
+
+    Examples:
+        >>> with Modem() as modem:
+        ...     sampler = SignalSampler(modem, rate_hz=5)
+        ...     sampler.start()
+        ...     time.sleep(60)
+        ...     sampler.stop()
+        ...     rsrp = sampler.ring.values("rsrp")
+    """
+
+    def __init__(
+        self,
+        modem: Modem,
+        rate_hz: float = 1.0,
+        capacity: int = DEFAULT_CAPACITY,
+        ring: Optional[SampleRing] = None,
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            modem: Connected Modem instance (kept open while sampling)
+            rate_hz: Samples per second
+            capacity: Ring size when no ring is given
+            ring: SampleRing to write to (optional)
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.modem = modem
+        self.rate_hz = rate_hz
+        self.ring = ring or SampleRing(capacity)
+        self.errors = 0
+        self._listeners: List[Callable[[float, Dict[str, Optional[float]]], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sampling thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_listener(self, callback: Callable[[float, Dict[str, Optional[float]]], None]) -> None:
+        """
+        Add a callback called with (timestamp, values) after each sample.
+
+        Callbacks run on the sampling thread and must not block.
+        """
+        self._listeners.append(callback)
+
+    def sample_once(self) -> bool:
+        """
+        Take one sample.
+
+        Returns:
+            True if the modem answered and the sample was recorded
+        """
+        # Modem timeout bounded by the sample period, at most 3 s
+        timeout = min(3.0, max(0.5, 1.0 / self.rate_hz))
+        try:
+            responses = self.modem.execute_batch(SIGNAL_COMMANDS, timeout=timeout)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Signal sample failed: {e}")
+            return False
+
+        timestamp = time.time()
+        values = _metric_values(responses)
+        self.ring.append(timestamp, values)
+        for callback in self._listeners:
+            try:
+                callback(timestamp, values)
+            except Exception as e:
+                logger.error(f"Sample listener error: {e}")
+        return True
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rm530-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"Signal sampling started at {self.rate_hz} Hz")
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        logger.info("Signal sampling stopped")
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        period = 1.0 / self.rate_hz
+        next_time = time.monotonic()
+        while not self._stop.is_set():
+            self.sample_once()
+            next_time += period
+            now = time.monotonic()
+            if next_time < now:
+                # Fell behind (slow modem); skip the missed slots
+                next_time += math.ceil((now - next_time) / period) * period
+            self._stop.wait(next_time - now)
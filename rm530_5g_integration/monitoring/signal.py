@@ -1,25 +1,70 @@
 """Signal quality monitoring."""
 
-import re
-from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from rm530_5g_integration.core.modem import Modem
+from rm530_5g_integration.core.parsers import (
+    ServingCell,
+    SlottedRecord,
+    parse_csq,
+    parse_qnwinfo,
+    parse_servingcell,
+)
 from rm530_5g_integration.utils.exceptions import SignalQualityError
 from rm530_5g_integration.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Commands read for one signal snapshot
+SIGNAL_COMMANDS = ("AT+CSQ", "AT+QNWINFO", 'AT+QENG="servingcell"')
 
-@dataclass
-class SignalQuality:
-    """Signal quality metrics."""
 
-    rssi: Optional[int] = None  # Received Signal Strength Indicator (dBm)
-    rsrp: Optional[int] = None  # Reference Signal Received Power (dBm)
-    rsrq: Optional[float] = None  # Reference Signal Received Quality (dB)
-    sinr: Optional[float] = None  # Signal to Interference plus Noise Ratio (dB)
-    network_type: Optional[str] = None  # 4G, 5G, etc.
+class SignalQuality(SlottedRecord):
+    """
+    Signal quality metrics.
+
+    rsrp/rsrq/sinr describe the cell carrying control (NR in SA mode, the
+    LTE anchor otherwise); lte and nr hold the full per-RAT serving cells,
+    both set in EN-DC. Instances use __slots__ to stay small when many
+    samples are kept in memory.
+    """
+
+    __slots__ = ("rssi", "rsrp", "rsrq", "sinr", "network_type", "lte", "nr")
+
+    def __init__(
+        self,
+        rssi: Optional[int] = None,
+        rsrp: Optional[int] = None,
+        rsrq: Optional[float] = None,
+        sinr: Optional[float] = None,
+        network_type: Optional[str] = None,
+        lte: Optional[ServingCell] = None,
+        nr: Optional[ServingCell] = None,
+    ):
+        """
+        Initialize signal quality.
+
+        Args:
+            rssi: Received Signal Strength Indicator (dBm)
+            rsrp: Reference Signal Received Power (dBm)
+            rsrq: Reference Signal Received Quality (dB)
+            sinr: Signal to Interference plus Noise Ratio (dB)
+            network_type: 4G, 5G, etc.
+            lte: LTE serving cell
+            nr: NR serving cell (SA or EN-DC leg)
+        """
+        self.rssi = rssi
+        self.rsrp = rsrp
+        self.rsrq = rsrq
+        self.sinr = sinr
+        self.network_type = network_type
+        self.lte = lte
+        self.nr = nr
+
+    @property
+    def cells(self) -> List[ServingCell]:
+        """Serving cells present (LTE first)."""
+        return [cell for cell in (self.lte, self.nr) if cell is not None]
 
     def __str__(self) -> str:
         """String representation."""
@@ -50,45 +95,33 @@ def get_signal_quality(modem: Modem) -> SignalQuality:
     quality = SignalQuality()
 
     try:
-        # Get network registration status and signal strength
-        # AT+CSQ - Signal Quality
-        response = modem.get_response("AT+CSQ", timeout=3)
-        if response:
-            match = re.search(r"\+CSQ:\s*(\d+),\s*(\d+)", response)
-            if match:
-                rssi = int(match.group(1))
-                # Convert to dBm (0-31 scale, where 31 = -51 dBm or better)
-                if rssi == 99:
-                    quality.rssi = None  # Unknown
-                else:
-                    quality.rssi = -113 + (rssi * 2)
-                logger.debug(f"RSSI: {quality.rssi} dBm")
-
-        # AT+QNWINFO - Network Information
-        response = modem.get_response("AT+QNWINFO", timeout=3)
-        if response:
-            match = re.search(r'\+QNWINFO:\s*"([^"]+)"', response)
-            if match:
-                quality.network_type = match.group(1)
-                logger.debug(f"Network type: {quality.network_type}")
-
-        # AT+QENG="servingcell" - Serving cell information (5G/4G)
-        response = modem.get_response('AT+QENG="servingcell"', timeout=3)
-        if response:
-            # Parse RSRP, RSRQ, SINR
-            rsrp_match = re.search(r"rsrp[:\s]+(-?\d+)", response, re.IGNORECASE)
-            rsrq_match = re.search(r"rsrq[:\s]+(-?\d+(?:\.\d+)?)", response, re.IGNORECASE)
-            sinr_match = re.search(r"sinr[:\s]+(-?\d+(?:\.\d+)?)", response, re.IGNORECASE)
-
-            if rsrp_match:
-                quality.rsrp = int(rsrp_match.group(1))
-                logger.debug(f"RSRP: {quality.rsrp} dBm")
-            if rsrq_match:
-                quality.rsrq = float(rsrq_match.group(1))
-                logger.debug(f"RSRQ: {quality.rsrq} dB")
-            if sinr_match:
-                quality.sinr = float(sinr_match.group(1))
-                logger.debug(f"SINR: {quality.sinr} dB")
+        # One round trip: AT+CSQ (signal strength), AT+QNWINFO (network information)
+        # and AT+QENG="servingcell" (serving cell 5G/4G) chained on one command line
+        csq, nwinfo, servingcell = modem.execute_batch(SIGNAL_COMMANDS, timeout=3)
+
+        csq_info = parse_csq(csq)
+        if csq_info is not None:
+            quality.rssi = csq_info.rssi_dbm
+            logger.debug(f"RSSI: {quality.rssi} dBm")
+
+        network = parse_qnwinfo(nwinfo)
+        if network is not None and network.access_technology:
+            quality.network_type = network.access_technology
+            logger.debug(f"Network type: {quality.network_type}")
+
+        report = parse_servingcell(servingcell)
+        quality.lte = report.lte
+        quality.nr = report.nr
+
+        # RSRP, RSRQ, SINR of the cell carrying control (LTE anchor in EN-DC)
+        cell = report.primary
+        if cell is not None:
+            quality.rsrp = cell.rsrp
+            quality.rsrq = float(cell.rsrq) if cell.rsrq is not None else None
+            quality.sinr = cell.sinr
+            logger.debug(
+                f"{cell.rat} RSRP: {cell.rsrp} dBm, RSRQ: {cell.rsrq} dB, SINR: {cell.sinr} dB"
+            )
 
     except Exception as e:
         logger.warning(f"Error reading signal quality: {e}")
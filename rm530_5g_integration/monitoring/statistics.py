@@ -0,0 +1,357 @@
+"""Rolling statistics over signal samples."""
+
+import math
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rm530_5g_integration.monitoring.sampler import SAMPLE_METRICS
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Default number of samples in a window and EWMA smoothing factor
+DEFAULT_WINDOW = 60
+DEFAULT_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class MetricSummary:
+    """Aggregates of one metric over a window."""
+
+    count: int = 0
+    mean: Optional[float] = None
+    ewma: Optional[float] = None
+    p5: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    variance: Optional[float] = None
+    slope: Optional[float] = None  # Linear trend in units per second
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Standard deviation."""
+        return math.sqrt(self.variance) if self.variance is not None else None
+
+
+def _percentile(ordered: Sequence[float], q: float) -> Optional[float]:
+    """Percentile of sorted values with linear interpolation between ranks."""
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class RollingStats:
+    """
+    Statistics over the last `window` values of a metric, updated per value.
+
+    Mean, variance and trend slope use add/remove Welford updates, min and
+    max use monotonic deques, and the EWMA is a running value: each is O(1)
+    per sample. Percentiles come from a sorted copy of the window kept with
+    bisect (O(log n) search plus a memmove). NaN values are ignored.
+    Thread safe: a sampler thread may add values while others read.
+
+    Examples:
+        >>> stats = RollingStats(window=60)
+        >>> for t, rsrp in samples:
+        ...     stats.add(rsrp, t)
+        >>> stats.summary().p50
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, alpha: float = DEFAULT_EWMA_ALPHA):
+        """
+        Initialize rolling statistics.
+
+        Args:
+            window: Number of values in the window
+            alpha: EWMA smoothing factor (0-1, higher follows new values faster)
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.window = window
+        self.alpha = alpha
+        self._values: Deque[Tuple[int, float, float]] = deque()  # (seq, t, value)
+        self._sorted: List[float] = []
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._seq = 0
+        self._t0: Optional[float] = None
+        self._mean_t = 0.0
+        self._mean = 0.0
+        self._m2_t = 0.0
+        self._m2 = 0.0
+        self._c = 0.0  # Co-moment of time and value
+        self.ewma: Optional[float] = None
+        # Reentrant: summary() reads the properties with the lock held
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Number of values in the window."""
+        return len(self._values)
+
+    def add(self, value: Optional[float], timestamp: Optional[float] = None) -> None:
+        """
+        Add a value, evicting the oldest one once the window is full.
+
+        Args:
+            value: Metric value (None or NaN is ignored)
+            timestamp: Sample time in seconds (default: sequence number)
+        """
+        if value is None or math.isnan(value):
+            return
+        with self._lock:
+            self._add(value, timestamp)
+
+    def _add(self, value: float, timestamp: Optional[float]) -> None:
+        """Add a non-NaN value (lock held)."""
+        seq = self._seq
+        self._seq += 1
+        if timestamp is None:
+            timestamp = float(seq)
+        if self._t0 is None:
+            self._t0 = timestamp
+        t = timestamp - self._t0
+
+        if len(self._values) == self.window:
+            self._evict()
+
+        self._values.append((seq, t, value))
+        n = len(self._values)
+        dt = t - self._mean_t
+        dv = value - self._mean
+        self._mean_t += dt / n
+        self._mean += dv / n
+        self._m2_t += dt * (t - self._mean_t)
+        self._m2 += dv * (value - self._mean)
+        self._c += dt * (value - self._mean)
+
+        insort(self._sorted, value)
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+        self.ewma = value if self.ewma is None else self.ewma + self.alpha * (value - self.ewma)
+
+    def _evict(self) -> None:
+        """Remove the oldest value from the window (lock held)."""
+        seq, t, value = self._values.popleft()
+        n = len(self._values)
+        if n == 0:
+            self._mean_t = self._mean = self._m2_t = self._m2 = self._c = 0.0
+        else:
+            mean_t = self._mean_t - (t - self._mean_t) / n
+            mean = self._mean - (value - self._mean) / n
+            self._m2_t -= (t - mean_t) * (t - self._mean_t)
+            self._m2 -= (value - mean) * (value - self._mean)
+            self._c -= (t - mean_t) * (value - self._mean)
+            self._mean_t = mean_t
+            self._mean = mean
+
+        del self._sorted[bisect_left(self._sorted, value)]
+        if self._min and self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] == seq:
+            self._max.popleft()
+
+    def extend(self, values: Iterable[float], timestamps: Optional[Iterable[float]] = None) -> None:
+        """Add several values (with matching timestamps, optional)."""
+        if timestamps is None:
+            for value in values:
+                self.add(value)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                self.add(value, timestamp)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the window."""
+        with self._lock:
+            return self._mean if self._values else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance of the window."""
+        with self._lock:
+            n = len(self._values)
+            return max(self._m2, 0.0) / (n - 1) if n > 1 else None
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Least-squares trend of the window in units per second."""
+        with self._lock:
+            if len(self._values) < 2 or self._m2_t <= 0:
+                return None
+            return self._c / self._m2_t
+
+    @property
+    def min(self) -> Optional[float]:
+        """Minimum of the window."""
+        with self._lock:
+            return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Maximum of the window."""
+        with self._lock:
+            return self._max[0][1] if self._max else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Percentile of the window.
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            Value, or None if the window is empty
+        """
+        with self._lock:
+            return _percentile(self._sorted, q)
+
+    def summary(self) -> MetricSummary:
+        """Get all aggregates of the window."""
+        with self._lock:
+            return MetricSummary(
+                count=len(self._values),
+                mean=self.mean,
+                ewma=self.ewma,
+                p5=self.percentile(5),
+                p50=self.percentile(50),
+                p95=self.percentile(95),
+                min=self.min,
+                max=self.max,
+                variance=self.variance,
+                slope=self.slope,
+            )
+
+
+class SignalStatistics:
+    """
+    Rolling statistics for every sampled signal metric.
+
+    add() has the SignalSampler listener signature, so statistics can be
+    kept up to date as samples arrive.
+
+    Examples:
+        >>> stats = SignalStatistics(window=300)
+        >>> sampler.add_listener(stats.add)
+        >>> stats.summary("rsrp").p5
+
+    A sample is added to every metric under one lock, so summaries()
+    never mixes metrics from different samples.
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        alpha: float = DEFAULT_EWMA_ALPHA,
+        metrics: Sequence[str] = SAMPLE_METRICS,
+    ):
+        """
+        Initialize signal statistics.
+
+        Args:
+            window: Number of samples in each window
+            alpha: EWMA smoothing factor
+            metrics: Metrics to track
+        """
+        self.window = window
+        self._stats: Dict[str, RollingStats] = {
+            name: RollingStats(window, alpha) for name in metrics
+        }
+        self._lock = threading.Lock()
+
+    def add(self, timestamp: float, values: Dict[str, Optional[float]]) -> None:
+        """
+        Add a sample.
+
+        Args:
+            timestamp: Sample time
+            values: Metric values (missing metrics are skipped)
+        """
+        with self._lock:
+            for name, stats in self._stats.items():
+                stats.add(values.get(name), timestamp)
+
+    def stats(self, metric: str) -> RollingStats:
+        """Get the rolling statistics of a metric."""
+        return self._stats[metric]
+
+    def summary(self, metric: str) -> MetricSummary:
+        """Get the aggregates of a metric."""
+        with self._lock:
+            return self._stats[metric].summary()
+
+    def summaries(self) -> Dict[str, MetricSummary]:
+        """Get the aggregates of every metric that has samples."""
+        with self._lock:
+            return {name: stats.summary() for name, stats in self._stats.items() if len(stats)}
+
+
+def summarize(
+    values: Sequence[float],
+    timestamps: Optional[Sequence[float]] = None,
+    alpha: float = DEFAULT_EWMA_ALPHA,
+) -> MetricSummary:
+    """
+    Compute aggregates over recorded values in one pass.
+
+    Uses NumPy when installed (e.g. on SampleRing.as_numpy() windows) and
+    RollingStats otherwise. NaN values are ignored.
+
+    Args:
+        values: Metric values, oldest first
+        timestamps: Matching sample times (default: index)
+        alpha: EWMA smoothing factor
+
+    Returns:
+        MetricSummary over all values
+    """
+    if not NUMPY_AVAILABLE:
+        stats = RollingStats(window=max(len(values), 1), alpha=alpha)
+        stats.extend(values, timestamps)
+        return stats.summary()
+
+    x = np.asarray(values, dtype=np.float64)
+    t = np.asarray(timestamps, dtype=np.float64) if timestamps is not None else np.arange(len(x))
+    valid = ~np.isnan(x)
+    x, t = x[valid], t[valid]
+    if x.size == 0:
+        return MetricSummary()
+
+    ewma = float(x[0])
+    for value in x[1:]:
+        ewma += alpha * (float(value) - ewma)
+    p5, p50, p95 = (float(p) for p in np.percentile(x, [5, 50, 95]))
+    slope = None
+    if x.size > 1 and np.ptp(t) > 0:
+        t = t - t.mean()
+        slope = float(np.dot(t, x - x.mean()) / np.dot(t, t))
+    return MetricSummary(
+        count=int(x.size),
+        mean=float(x.mean()),
+        ewma=ewma,
+        p5=p5,
+        p50=p50,
+        p95=p95,
+        min=float(x.min()),
+        max=float(x.max()),
+        variance=float(x.var(ddof=1)) if x.size > 1 else None,
+        slope=slope,
+    )
@@ -1,15 +1,55 @@
 """Connection statistics monitoring."""
 
+import os
 import re
+import socket
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+from rm530_5g_integration.core.netlink import SCOPE_UNIVERSE, InterfaceTable, dump_interfaces
 from rm530_5g_integration.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+SYSFS_NET = "/sys/class/net"
+PROC_NET_DEV = "/proc/net/dev"
+
+# Counter widths seen in practice: 32-bit driver counters (e.g. usbnet on
+# 32-bit kernels) wrap at 2**32, rtnl_link_stats64 counters at 2**64
+COUNTER_WRAPS = (1 << 32, 1 << 64)
+
+# Default EWMA smoothing factor for RateTracker.smoothed
+DEFAULT_RATE_ALPHA = 0.3
+
+
+@dataclass
+class ThroughputRates:
+    """Per-second rates over an interval."""
+
+    rx_bytes: float = 0.0
+    tx_bytes: float = 0.0
+    rx_packets: float = 0.0
+    tx_packets: float = 0.0
+    interval: float = 0.0  # Seconds covered
+
+    @property
+    def rx_mbps(self) -> float:
+        """Download rate in Mbit/s."""
+        return self.rx_bytes * 8 / 1e6
+
+    @property
+    def tx_mbps(self) -> float:
+        """Upload rate in Mbit/s."""
+        return self.tx_bytes * 8 / 1e6
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"RX: {self.rx_mbps:.2f} Mbit/s, TX: {self.tx_mbps:.2f} Mbit/s"
+
 
 @dataclass
 class ConnectionStats:
@@ -17,12 +57,16 @@ class ConnectionStats:
 
     interface: str
     ip_address: Optional[str] = None
+    ipv6_address: Optional[str] = None  # Global scope
     bytes_sent: Optional[int] = None
     bytes_received: Optional[int] = None
     packets_sent: Optional[int] = None
     packets_received: Optional[int] = None
     uptime: Optional[timedelta] = None
     is_connected: bool = False
+    operstate: Optional[str] = None  # up, down, unknown, ... (sysfs backend only)
+    ifindex: Optional[int] = None  # Changes when the interface is re-created
+    rates: Optional[ThroughputRates] = None  # Set by RateTracker.update()
 
     def __str__(self) -> str:
         """String representation."""
@@ -35,6 +79,8 @@ class ConnectionStats:
                 parts.append(f"Sent: {self._format_bytes(self.bytes_sent)}")
             if self.bytes_received is not None:
                 parts.append(f"Received: {self._format_bytes(self.bytes_received)}")
+            if self.rates is not None:
+                parts.append(str(self.rates))
         else:
             parts.append("Status: Disconnected")
         return ", ".join(parts)
@@ -50,16 +96,89 @@ class ConnectionStats:
         return f"{bytes_value:.2f} PB"
 
 
-def get_connection_stats(interface: str = "usb0") -> ConnectionStats:
+def get_connection_stats(
+    interface: str = "usb0", table: Optional[InterfaceTable] = None
+) -> ConnectionStats:
     """
     Get connection statistics for an interface.
 
+    Counters and link state are read from sysfs and the addresses from an
+    rtnetlink dump, without starting any process; `ip` is used only where
+    sysfs is not available.
+
     Args:
         interface: Network interface name
+        table: Netlink dump to take addresses from (reuse one dump when
+            querying several interfaces; default: dump now)
 
     Returns:
         ConnectionStats object
     """
+    stats = _stats_from_sysfs(interface, table=table)
+    if stats is None:
+        stats = _stats_from_ip(interface)
+    return stats
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    """Read a sysfs attribute, None if missing."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_counter(path: str) -> Optional[int]:
+    """Read an integer sysfs attribute."""
+    value = _read_sysfs(path)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _stats_from_sysfs(
+    interface: str, sysfs_net: Optional[str] = None, table: Optional[InterfaceTable] = None
+) -> Optional[ConnectionStats]:
+    """
+    Read interface statistics from sysfs.
+
+    Returns:
+        ConnectionStats, or None if sysfs is not available
+    """
+    sysfs_net = sysfs_net or SYSFS_NET
+    if not os.path.isdir(sysfs_net):
+        return None
+
+    stats = ConnectionStats(interface=interface)
+    interface_dir = os.path.join(sysfs_net, interface)
+    if not os.path.isdir(interface_dir):
+        logger.debug(f"Interface {interface} not found")
+        return stats
+
+    statistics_dir = os.path.join(interface_dir, "statistics")
+    stats.ifindex = _read_counter(os.path.join(interface_dir, "ifindex"))
+    stats.operstate = _read_sysfs(os.path.join(interface_dir, "operstate"))
+    stats.bytes_received = _read_counter(os.path.join(statistics_dir, "rx_bytes"))
+    stats.bytes_sent = _read_counter(os.path.join(statistics_dir, "tx_bytes"))
+    stats.packets_received = _read_counter(os.path.join(statistics_dir, "rx_packets"))
+    stats.packets_sent = _read_counter(os.path.join(statistics_dir, "tx_packets"))
+
+    if stats.operstate != "down":
+        try:
+            table = table or dump_interfaces()
+        except OSError as e:
+            logger.debug(f"Netlink address dump failed: {e}")
+            return stats
+        stats.ip_address = table.ipv4(interface)
+        stats.ipv6_address = table.ipv6(interface)
+        stats.is_connected = stats.ip_address is not None
+    return stats
+
+
+def _stats_from_ip(interface: str) -> ConnectionStats:
+    """Read interface statistics by running `ip` (fallback without sysfs)."""
     stats = ConnectionStats(interface=interface)
 
     try:
@@ -118,3 +237,290 @@ def get_connection_stats(interface: str = "usb0") -> ConnectionStats:
         logger.warning(f"Error getting connection stats: {e}")
 
     return stats
+
+
+def _counter_delta(old: int, new: int, reset: bool) -> int:
+    """Increase of a counter between two reads, allowing for wrap and reset."""
+    if reset:
+        return new
+    if new >= old:
+        return new - old
+    for wrap in COUNTER_WRAPS:
+        if old < wrap:
+            delta = new + wrap - old
+            # A plausible wrap moves less than half the range; a bigger jump
+            # backwards means the counters started over
+            return delta if delta < wrap // 2 else new
+    return new
+
+
+def _link_up(stats: ConnectionStats) -> bool:
+    """Check if the link is up (ECM interfaces often report "unknown")."""
+    if stats.operstate is not None:
+        return stats.operstate in ("up", "unknown")
+    return stats.is_connected
+
+
+class RateTracker:
+    """
+    Throughput rates and uptime from successive counter snapshots.
+
+    Keeps the previous snapshot with a monotonic timestamp; each update()
+    sets the instantaneous rates since that snapshot and an EWMA-smoothed
+    copy. Counter wrap (32 or 64 bit) is unwrapped, and a re-created
+    interface (new ifindex, e.g. after a modem reset) is treated as a
+    counter reset. Uptime counts from the last down-to-up transition seen.
+
+    Examples:
+        >>> tracker = RateTracker()
+        >>> while True:
+        ...     stats = tracker.update(get_connection_stats("usb0"))
+        ...     print(stats.rates, stats.uptime)
+        ...     time.sleep(1)
+    """
+
+    def __init__(
+        self, alpha: float = DEFAULT_RATE_ALPHA, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            alpha: EWMA smoothing factor (0-1, higher follows changes faster)
+            clock: Monotonic time source in seconds
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self._clock = clock
+        # (time, counters, ifindex) of the previous snapshot; copied so callers
+        # may reuse ConnectionStats objects between updates
+        self._previous: Optional[Tuple[float, Tuple[Optional[int], ...], Optional[int]]] = None
+        self._up_since: Optional[float] = None
+        self.current: Optional[ThroughputRates] = None
+        self.smoothed: Optional[ThroughputRates] = None
+        self.resets = 0
+
+    def reset(self) -> None:
+        """Forget the previous snapshot, rates and uptime."""
+        self._previous = None
+        self._up_since = None
+        self.current = None
+        self.smoothed = None
+
+    def update(self, stats: ConnectionStats, now: Optional[float] = None) -> ConnectionStats:
+        """
+        Add a snapshot and fill in its rates and uptime.
+
+        The first snapshot (and any without counters) gets no rates. Uptime
+        of a link already up at the first snapshot counts from that snapshot.
+
+        Args:
+            stats: Fresh counters from get_connection_stats()
+            now: Snapshot time from the tracker's clock (default: now)
+
+        Returns:
+            stats, with rates and uptime set
+        """
+        now = self._clock() if now is None else now
+
+        if _link_up(stats):
+            if self._up_since is None:
+                self._up_since = now
+            stats.uptime = timedelta(seconds=now - self._up_since)
+        else:
+            self._up_since = None
+
+        current = (
+            stats.bytes_received,
+            stats.bytes_sent,
+            stats.packets_received,
+            stats.packets_sent,
+        )
+        previous, self._previous = self._previous, (now, current, stats.ifindex)
+        if previous is None:
+            return stats
+        then, old_counters, old_ifindex = previous
+        interval = now - then
+        counters: List[Tuple[int, int]] = []
+        for old, new in zip(old_counters, current):
+            if old is None or new is None:
+                return stats
+            counters.append((old, new))
+        if interval <= 0:
+            return stats
+
+        reset = old_ifindex is not None and old_ifindex != stats.ifindex
+        if reset:
+            self.resets += 1
+            logger.debug(f"{stats.interface} was re-created; counters restarted")
+
+        rx_bytes, tx_bytes, rx_packets, tx_packets = (
+            _counter_delta(a, b, reset) / interval for a, b in counters
+        )
+        rates = ThroughputRates(rx_bytes, tx_bytes, rx_packets, tx_packets, interval)
+        self.current = rates
+        if self.smoothed is None:
+            self.smoothed = rates
+        else:
+            prev = self.smoothed
+            self.smoothed = ThroughputRates(
+                prev.rx_bytes + self.alpha * (rates.rx_bytes - prev.rx_bytes),
+                prev.tx_bytes + self.alpha * (rates.tx_bytes - prev.tx_bytes),
+                prev.rx_packets + self.alpha * (rates.rx_packets - prev.rx_packets),
+                prev.tx_packets + self.alpha * (rates.tx_packets - prev.tx_packets),
+                interval,
+            )
+        stats.rates = rates
+        return stats
+
+
+def read_proc_net_dev(path: str = PROC_NET_DEV) -> Dict[str, Tuple[int, int, int, int]]:
+    """
+    Read the counters of every interface from /proc/net/dev in one read.
+
+    Args:
+        path: File to read
+
+    Returns:
+        {interface: (rx_bytes, rx_packets, tx_bytes, tx_packets)}
+    """
+    with open(path) as f:
+        lines = f.read().splitlines()[2:]  # Two header lines
+    counters = {}
+    for line in lines:
+        name, sep, data = line.partition(":")
+        fields = data.split()
+        if sep and len(fields) >= 10:
+            counters[name.strip()] = (
+                int(fields[0]),
+                int(fields[1]),
+                int(fields[8]),
+                int(fields[9]),
+            )
+    return counters
+
+
+class BulkStatsCollector:
+    """
+    Statistics for many interfaces from one kernel query.
+
+    Each collect() does a single rtnetlink dump, which carries counters,
+    link state and addresses of every interface (falling back to one read
+    of /proc/net/dev, counters only, where netlink is unavailable). The
+    ConnectionStats objects are kept and updated in place between calls,
+    so polling allocates nothing per interface.
+
+    Examples:
+        >>> collector = BulkStatsCollector(["usb*", "wwan*", "eth0"])
+        >>> for name, stats in collector.collect().items():
+        ...     print(name, stats.rates)
+    """
+
+    def __init__(
+        self,
+        interfaces: Optional[Sequence[str]] = None,
+        track_rates: bool = True,
+        proc_net_dev: str = PROC_NET_DEV,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            interfaces: Interface names or fnmatch patterns (default: all but loopback)
+            track_rates: Fill in rates and uptime with a RateTracker per interface
+            proc_net_dev: /proc/net/dev path for the fallback
+        """
+        self.patterns = tuple(interfaces) if interfaces else None
+        self.track_rates = track_rates
+        self.proc_net_dev = proc_net_dev
+        self._stats: Dict[str, ConnectionStats] = {}
+        self._trackers: Dict[str, RateTracker] = {}
+        self._current: Dict[str, ConnectionStats] = {}
+
+    def wants(self, name: str, loopback: bool = False) -> bool:
+        """Check if an interface passes the filter."""
+        if self.patterns is None:
+            return not loopback and name != "lo"
+        return any(fnmatchcase(name, pattern) for pattern in self.patterns)
+
+    def _slot(self, name: str) -> ConnectionStats:
+        """Get the reusable stats object of an interface, cleared."""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = ConnectionStats(interface=name)
+        else:
+            stats.ip_address = stats.ipv6_address = None
+            stats.rates = stats.uptime = None
+            stats.is_connected = False
+        return stats
+
+    def collect(self) -> Dict[str, ConnectionStats]:
+        """
+        Read statistics of all matching interfaces.
+
+        Returns:
+            {interface: ConnectionStats}; the dict and its objects are reused
+            by the next call, so copy anything that must be kept
+        """
+        self._current.clear()
+        try:
+            table = dump_interfaces()
+        except OSError as e:
+            logger.debug(f"Netlink dump failed, reading {self.proc_net_dev}: {e}")
+            self._collect_proc()
+        else:
+            self._collect_netlink(table)
+
+        if self.track_rates:
+            now = time.monotonic()
+            for name, stats in self._current.items():
+                self._trackers.setdefault(name, RateTracker()).update(stats, now)
+        # Forget interfaces that went away (trackers stay, to spot re-creation)
+        for name in set(self._stats) - set(self._current):
+            del self._stats[name]
+        return self._current
+
+    def _collect_netlink(self, table: InterfaceTable) -> None:
+        """Fill stats from a netlink dump."""
+        ipv4: Dict[int, str] = {}
+        ipv6: Dict[int, str] = {}
+        for address in table.addresses:
+            if address.family == socket.AF_INET:
+                if not address.address.startswith("127."):
+                    ipv4.setdefault(address.index, address.address)
+            elif address.scope == SCOPE_UNIVERSE:
+                ipv6.setdefault(address.index, address.address)
+
+        for link in table.links.values():
+            if not self.wants(link.name, link.is_loopback):
+                continue
+            stats = self._slot(link.name)
+            stats.ifindex = link.index
+            stats.operstate = link.operstate
+            stats.bytes_received = link.rx_bytes or 0
+            stats.bytes_sent = link.tx_bytes or 0
+            stats.packets_received = link.rx_packets or 0
+            stats.packets_sent = link.tx_packets or 0
+            stats.ip_address = ipv4.get(link.index)
+            stats.ipv6_address = ipv6.get(link.index)
+            stats.is_connected = stats.ip_address is not None and link.operstate != "down"
+            self._current[link.name] = stats
+
+    def _collect_proc(self) -> None:
+        """Fill counters from /proc/net/dev."""
+        try:
+            counters = read_proc_net_dev(self.proc_net_dev)
+        except OSError as e:
+            logger.warning(f"Error reading interface counters: {e}")
+            return
+        for name, (rx_bytes, rx_packets, tx_bytes, tx_packets) in counters.items():
+            if not self.wants(name):
+                continue
+            stats = self._slot(name)
+            stats.ifindex = stats.operstate = None
+            stats.bytes_received = rx_bytes
+            stats.packets_received = rx_packets
+            stats.bytes_sent = tx_bytes
+            stats.packets_sent = tx_packets
+            self._current[name] = stats
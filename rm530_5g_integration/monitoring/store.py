@@ -0,0 +1,717 @@
+"""Embedded time-series store in memory-mapped segment files."""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from rm530_5g_integration.monitoring.rollup import (
+    ROLLUP_TIERS,
+    TIER_RETENTION,
+    RollupAccumulator,
+    RollupPoint,
+    bucket_points,
+    rollup_fields,
+    select_tier,
+    tier_series,
+)
+from rm530_5g_integration.monitoring.sampler import SAMPLE_METRICS
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.stats import ConnectionStats
+from rm530_5g_integration.utils.logging import get_logger
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Segment header: magic, format version, field count, capacity, record count
+_HEADER = struct.Struct("=8sIIQQ")
+_COUNT_OFFSET = 24
+HEADER_SIZE = 64  # Keeps records 8-byte aligned
+MAGIC = b"RM530TS\0"
+VERSION = 1
+
+# One day of 1 Hz records per segment, a week of history
+DEFAULT_SEGMENT_RECORDS = 86400
+DEFAULT_RETENTION = 7 * 86400.0
+
+# A segment also ends once it spans this fraction of the series' retention, so
+# sparse series (e.g. one record per minute) still expire close to on time
+SEGMENT_SPAN_FRACTION = 0.25
+
+# Built-in series
+SIGNAL_SERIES = "signal"
+SIGNAL_FIELDS = SAMPLE_METRICS
+INTERFACE_SERIES = "interface"
+INTERFACE_FIELDS = ("rx_bytes", "tx_bytes", "rx_packets", "tx_packets", "rx_rate", "tx_rate")
+HEALTH_SERIES = "health"
+HEALTH_FIELDS = ("healthy", "consecutive_failures", "issues", "rssi", "rsrp")
+
+NAN = float("nan")
+
+
+def signal_values(quality: SignalQuality) -> Dict[str, Optional[float]]:
+    """Values of the SIGNAL_FIELDS of a signal quality reading."""
+    nr = quality.nr
+    return {
+        "rssi": quality.rssi,
+        "rsrp": quality.rsrp,
+        "rsrq": quality.rsrq,
+        "sinr": quality.sinr,
+        "nr_rsrp": nr.rsrp if nr else None,
+        "nr_rsrq": nr.rsrq if nr else None,
+        "nr_sinr": nr.sinr if nr else None,
+    }
+
+
+def _default_root() -> Path:
+    """Default store directory."""
+    return Path.home() / ".rm530" / "metrics"
+
+
+class Segment:
+    """
+    One fixed-capacity segment file of fixed-width float64 records.
+
+    A record is the timestamp followed by one value per field. The file is
+    sized once at creation and written through a shared mmap, so an append
+    only dirties the page it lands on and never grows the file.
+    """
+
+    def __init__(
+        self, path: Path, nfields: int, capacity: Optional[int] = None, readonly: bool = False
+    ):
+        """
+        Open a segment, creating it when a capacity is given.
+
+        Args:
+            path: Segment file
+            nfields: Number of value fields per record
+            capacity: Number of records (create a new file)
+            readonly: Map the file read-only
+
+        Raises:
+            ValueError: If an existing file is not a segment of this layout
+        """
+        self.path = path
+        self.stride = nfields + 1
+        record_size = 8 * self.stride
+
+        mode = "w+b" if capacity is not None else "rb" if readonly else "r+b"
+        with open(path, mode) as f:
+            if capacity is not None:
+                f.truncate(HEADER_SIZE + capacity * record_size)
+            access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+            self._mmap = mmap.mmap(f.fileno(), 0, access=access)
+
+        if capacity is not None:
+            _HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, nfields, capacity, 0)
+        magic, version, stored_fields, capacity, count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or stored_fields != nfields:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a {nfields}-field segment")
+        self.capacity: int = min(capacity, (len(self._mmap) - HEADER_SIZE) // record_size)
+        self.count: int = min(count, self.capacity)
+        self._values = memoryview(self._mmap)[HEADER_SIZE:].cast("d")
+
+    @property
+    def is_full(self) -> bool:
+        """Check if no more records fit."""
+        return self.count >= self.capacity
+
+    @property
+    def first(self) -> Optional[float]:
+        """Timestamp of the first record."""
+        return self._values[0] if self.count else None
+
+    @property
+    def last(self) -> Optional[float]:
+        """Timestamp of the last record."""
+        return self._values[(self.count - 1) * self.stride] if self.count else None
+
+    def append(self, row: Sequence[float]) -> None:
+        """Write a record (timestamp first) and commit it in the header."""
+        start = self.count * self.stride
+        self._values[start : start + self.stride] = memoryview(
+            struct.pack(f"={self.stride}d", *row)
+        ).cast("d")
+        self.count += 1
+        struct.pack_into("=Q", self._mmap, _COUNT_OFFSET, self.count)
+
+    def column(self, index: int, lo: int = 0, hi: Optional[int] = None) -> "memoryview[float]":
+        """View of one column (0 = timestamp) over records [lo, hi)."""
+        hi = self.count if hi is None else hi
+        return self._values[lo * self.stride + index : hi * self.stride : self.stride]
+
+    def bounds(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """Record index range with start <= timestamp <= end."""
+        timestamps = self.column(0)
+        lo = 0 if start is None else bisect_left(timestamps, start)
+        hi = self.count if end is None else bisect_right(timestamps, end)
+        return lo, hi
+
+    def as_numpy(self) -> "np.ndarray":
+        """(count, stride) array sharing the file's memory."""
+        return np.frombuffer(
+            self._mmap, dtype=np.float64, count=self.count * self.stride, offset=HEADER_SIZE
+        ).reshape(self.count, self.stride)
+
+    def flush(self) -> None:
+        """Write dirty pages back to the file."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Flush and unmap (deferred to garbage collection while views exist)."""
+        try:
+            if not self._values.readonly:
+                self._mmap.flush()
+            self._values.release()
+            self._mmap.close()
+        except (BufferError, ValueError):
+            pass
+
+
+class MetricStore:
+    """
+    Append-only time-series store for monitoring data.
+
+    Each series is a directory of segment files named by their first
+    timestamp; records are fixed-width and time-ordered, so a time range is
+    found by binary search without a separate index. Range queries return
+    views onto the mapped files (memoryview, or NumPy with query_numpy())
+    without copying. Writes go through shared mmaps and reach the card with
+    normal page writeback (call flush() for a durability point); whole
+    segments older than the retention period are deleted.
+
+    Series created with rollup=True also keep 1 min, 15 min and 1 h rollup
+    tiers (min/max/mean/count/last per field), updated as records arrive;
+    trend() reads the coarsest tier that meets the requested resolution.
+    The built-in series keep raw records for a day and rollups for up to a
+    year (TIER_RETENTION).
+
+    Examples:
+        >>> store = MetricStore()
+        >>> sampler.add_listener(store.listener(SIGNAL_SERIES))
+        >>> rsrp = store.query(SIGNAL_SERIES, "rsrp", start=time.time() - 3600)
+        >>> week_ago = time.time() - 7 * 86400
+        >>> hourly = store.trend(SIGNAL_SERIES, "rsrp", start=week_ago, resolution=3600)
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        retention: float = DEFAULT_RETENTION,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        readonly: bool = False,
+    ):
+        """
+        Open (or create) a store.
+
+        Args:
+            root: Store directory (default: ~/.rm530/metrics)
+            retention: Seconds of history kept (series without their own retention)
+            segment_records: Records per segment file (raw series)
+            readonly: Open for reading only, e.g. while another process records
+        """
+        if segment_records < 1:
+            raise ValueError("segment_records must be at least 1")
+        self.root = Path(root) if root else _default_root()
+        self.retention = retention
+        self.segment_records = segment_records
+        self.readonly = readonly
+        self._fields: Dict[str, Tuple[str, ...]] = {}
+        self._segments: Dict[str, List[Segment]] = {}
+        self._retention: Dict[str, float] = {}
+        self._segment_records: Dict[str, int] = {}
+        self._rollups: Dict[str, RollupAccumulator] = {}
+        self._lock = threading.Lock()
+        if not readonly:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "MetricStore":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def create_series(
+        self,
+        name: str,
+        fields: Sequence[str],
+        retention: Optional[float] = None,
+        segment_records: Optional[int] = None,
+        rollup: bool = False,
+    ) -> None:
+        """
+        Define a series, or open it if it exists on disk.
+
+        Args:
+            name: Series name
+            fields: Value field names
+            retention: Seconds of raw history kept (default: the store's retention)
+            segment_records: Records per segment file (default: the store's)
+            rollup: Also maintain the ROLLUP_TIERS tiers
+
+        Raises:
+            ValueError: If the series exists with different fields
+        """
+        fields = tuple(fields)
+        with self._lock:
+            if name in self._fields:
+                if self._fields[name] != fields:
+                    raise ValueError(f"Series {name!r} has fields {self._fields[name]}")
+                return
+            self._open_series(name, fields, retention, segment_records)
+            if rollup:
+                for tier in ROLLUP_TIERS:
+                    self._open_series(
+                        tier_series(name, tier),
+                        rollup_fields(fields),
+                        TIER_RETENTION[tier],
+                        max(1, 86400 // tier),  # One day per segment
+                    )
+                if not self.readonly:
+                    self._rollups[name] = self._resume_rollups(name, fields)
+
+    def open_series(self, name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Open a series recorded earlier, with its rollup tiers.
+
+        Args:
+            name: Series name
+
+        Returns:
+            Field names, or None if the series does not exist
+        """
+        schema_path = self.root / name / "schema.json"
+        if not schema_path.exists():
+            return None
+        fields = tuple(json.loads(schema_path.read_text())["fields"])
+        rollup = (self.root / tier_series(name, ROLLUP_TIERS[0]) / "schema.json").exists()
+        self.create_series(name, fields, rollup=rollup)
+        return fields
+
+    def _open_series(
+        self,
+        name: str,
+        fields: Tuple[str, ...],
+        retention: Optional[float],
+        segment_records: Optional[int],
+    ) -> None:
+        """Load (or create) one series directory (lock held)."""
+        directory = self.root / name
+        schema_path = directory / "schema.json"
+        if schema_path.exists():
+            stored = tuple(json.loads(schema_path.read_text())["fields"])
+            if stored != fields:
+                raise ValueError(f"Series {name!r} has fields {stored}")
+        elif not self.readonly:
+            directory.mkdir(parents=True, exist_ok=True)
+            schema_path.write_text(json.dumps({"fields": list(fields)}))
+
+        segments = []
+        for path in sorted(directory.glob("*.seg")):
+            try:
+                segments.append(Segment(path, len(fields), readonly=self.readonly))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable segment {path}: {e}")
+        self._fields[name] = fields
+        self._segments[name] = segments
+        self._retention[name] = self.retention if retention is None else retention
+        self._segment_records[name] = segment_records or self.segment_records
+
+    def _resume_rollups(self, name: str, fields: Tuple[str, ...]) -> RollupAccumulator:
+        """
+        Rebuild the open rollup buckets from records written before a restart (lock held).
+
+        Each tier is refilled from the next finer tier's records after its
+        last written bucket, coarsest first, so no record is counted twice.
+        """
+        rollups = RollupAccumulator(fields)
+        for level in reversed(range(len(ROLLUP_TIERS))):
+            tier = ROLLUP_TIERS[level]
+            last = self._last(tier_series(name, tier))
+            after = None if last is None else last + tier
+            source = name if level == 0 else tier_series(name, ROLLUP_TIERS[level - 1])
+            for timestamp, values in self._records(source, after):
+                if level == 0:
+                    closed = rollups.add(timestamp, values)
+                else:
+                    closed = rollups.add_bucket(level, timestamp, values)
+                self._append_rollups(name, closed)
+        return rollups
+
+    def fields(self, name: str) -> Tuple[str, ...]:
+        """Get the field names of a series."""
+        return self._fields[name]
+
+    def append(self, name: str, timestamp: float, values: Dict[str, Optional[float]]) -> None:
+        """
+        Append a record (and update the series' rollups).
+
+        Args:
+            name: Series name (see create_series())
+            timestamp: Record time (time.time()); must not go backwards
+            values: Field values; missing or None fields are stored as NaN
+
+        Raises:
+            ValueError: If timestamp is older than the last record
+        """
+        if self.readonly:
+            raise ValueError("Store is open read-only")
+        with self._lock:
+            self._append(name, timestamp, values)
+            rollups = self._rollups.get(name)
+            if rollups is not None:
+                self._append_rollups(name, rollups.add(timestamp, values))
+
+    def _append(self, name: str, timestamp: float, values: Dict[str, Optional[float]]) -> None:
+        """Append a record to one series (lock held)."""
+        fields = self._fields[name]
+        row = [timestamp]
+        for field_name in fields:
+            value = values.get(field_name)
+            row.append(NAN if value is None else float(value))
+
+        segments = self._segments[name]
+        active = segments[-1] if segments else None
+        if active is not None and active.last is not None and timestamp < active.last:
+            raise ValueError(f"{name}: timestamp {timestamp} is older than the last record")
+        if active is None or active.is_full or self._span_exceeded(name, active, timestamp):
+            if active is not None:
+                active.flush()
+            path = self.root / name / f"{int(timestamp * 1000):015d}.seg"
+            active = Segment(path, len(fields), capacity=self._segment_records[name])
+            segments.append(active)
+            self._expire(name, timestamp)
+        active.append(row)
+
+    def _span_exceeded(self, name: str, segment: Segment, timestamp: float) -> bool:
+        """Check if a record at timestamp would stretch the segment past its time span."""
+        first = segment.first
+        span = self._retention[name] * SEGMENT_SPAN_FRACTION
+        return first is not None and timestamp - first >= span
+
+    def _append_rollups(
+        self, name: str, closed: List[Tuple[int, float, Dict[str, Optional[float]]]]
+    ) -> None:
+        """Write closed rollup buckets, skipping any already on disk (lock held)."""
+        for tier, start, values in closed:
+            series = tier_series(name, tier)
+            last = self._last(series)
+            if last is None or start > last:
+                self._append(series, start, values)
+
+    def _last(self, name: str) -> Optional[float]:
+        """Timestamp of the last record of a series (lock held)."""
+        segments = self._segments[name]
+        return segments[-1].last if segments else None
+
+    def _records(
+        self, name: str, start: Optional[float]
+    ) -> Iterator[Tuple[float, Dict[str, Optional[float]]]]:
+        """Iterate (timestamp, values) of the records from start on (lock held)."""
+        fields = self._fields[name]
+        for segment, lo, hi in self._ranges(name, start, None):
+            columns = [segment.column(i, lo, hi) for i in range(len(fields) + 1)]
+            for row in zip(*columns):
+                yield row[0], dict(zip(fields, row[1:]))
+
+    def listener(self, name: str) -> Callable[[float, Dict[str, Optional[float]]], None]:
+        """
+        Get a callback that appends (timestamp, values) to a series.
+
+        The signal series is created if needed; the callback fits
+        SignalSampler.add_listener().
+        """
+        if name == SIGNAL_SERIES:
+            self._create_builtin(SIGNAL_SERIES, SIGNAL_FIELDS)
+
+        def append(timestamp: float, values: Dict[str, Optional[float]]) -> None:
+            self.append(name, timestamp, values)
+
+        return append
+
+    def _create_builtin(self, name: str, fields: Sequence[str]) -> None:
+        """Create a built-in series: a day of raw records plus rollups."""
+        self.create_series(name, fields, retention=TIER_RETENTION[0], rollup=True)
+
+    def record_stats(self, stats: ConnectionStats, timestamp: Optional[float] = None) -> None:
+        """Append interface counters (and rates, if tracked) to the interface series."""
+        self._create_builtin(INTERFACE_SERIES, INTERFACE_FIELDS)
+        rates = stats.rates
+        self.append(
+            INTERFACE_SERIES,
+            time.time() if timestamp is None else timestamp,
+            {
+                "rx_bytes": stats.bytes_received,
+                "tx_bytes": stats.bytes_sent,
+                "rx_packets": stats.packets_received,
+                "tx_packets": stats.packets_sent,
+                "rx_rate": rates.rx_bytes if rates else None,
+                "tx_rate": rates.tx_bytes if rates else None,
+            },
+        )
+
+    def record_health(
+        self,
+        healthy: bool,
+        consecutive_failures: int,
+        issues: int,
+        signal: Optional[Dict[str, Optional[float]]] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Append a health check result to the health series."""
+        self._create_builtin(HEALTH_SERIES, HEALTH_FIELDS)
+        signal = signal or {}
+        self.append(
+            HEALTH_SERIES,
+            time.time() if timestamp is None else timestamp,
+            {
+                "healthy": 1.0 if healthy else 0.0,
+                "consecutive_failures": consecutive_failures,
+                "issues": issues,
+                "rssi": signal.get("rssi"),
+                "rsrp": signal.get("rsrp"),
+            },
+        )
+
+    def record_signal(self, quality: SignalQuality, timestamp: Optional[float] = None) -> None:
+        """Append a signal quality snapshot to the signal series."""
+        self._create_builtin(SIGNAL_SERIES, SIGNAL_FIELDS)
+        self.append(
+            SIGNAL_SERIES, time.time() if timestamp is None else timestamp, signal_values(quality)
+        )
+
+    def _ranges(
+        self, name: str, start: Optional[float], end: Optional[float]
+    ) -> List[Tuple[Segment, int, int]]:
+        """Segments overlapping [start, end] with their record ranges."""
+        ranges = []
+        for segment in self._segments[name]:
+            first, last = segment.first, segment.last
+            if first is None or last is None:
+                continue
+            if (end is not None and first > end) or (start is not None and last < start):
+                continue
+            lo, hi = segment.bounds(start, end)
+            if lo < hi:
+                ranges.append((segment, lo, hi))
+        return ranges
+
+    def query(
+        self,
+        name: str,
+        field: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List["memoryview[float]"]:
+        """
+        Get the values of a field recorded in a time range, without copying.
+
+        Views share the mapped files: release them (or let them go) before
+        close() or compact() so the segments can be unmapped.
+
+        Args:
+            name: Series name
+            field: Field name, or "timestamp"
+            start: Earliest timestamp (None for all)
+            end: Latest timestamp (None for all)
+
+        Returns:
+            memoryview segments, oldest first
+        """
+        index = 0 if field == "timestamp" else self._fields[name].index(field) + 1
+        with self._lock:
+            return [
+                segment.column(index, lo, hi) for segment, lo, hi in self._ranges(name, start, end)
+            ]
+
+    def values(
+        self,
+        name: str,
+        field: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[float]:
+        """Copy the query() result into one list (oldest first, NaN where not reported)."""
+        values: List[float] = []
+        for view in self.query(name, field, start, end):
+            values.extend(view)
+        return values
+
+    def query_numpy(
+        self,
+        name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List["np.ndarray"]:
+        """
+        Get the records in a time range as NumPy views onto the mapped files.
+
+        Args:
+            name: Series name
+            start: Earliest timestamp (None for all)
+            end: Latest timestamp (None for all)
+
+        Returns:
+            (n, 1 + fields) float64 arrays, oldest first; column 0 is the timestamp
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed (pip install rm530-5g-integration[numpy])")
+        with self._lock:
+            return [segment.as_numpy()[lo:hi] for segment, lo, hi in self._ranges(name, start, end)]
+
+    def trend(
+        self,
+        name: str,
+        field: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        resolution: Optional[float] = None,
+    ) -> List[RollupPoint]:
+        """
+        Get a field over a time range at a resolution.
+
+        Reads the coarsest rollup tier whose buckets are no longer than
+        `resolution` (raw records when none is); buckets not written yet,
+        such as the current hour, are filled in from the finer tiers.
+
+        Args:
+            name: Series name (created with rollup=True)
+            field: Field name
+            start: Earliest bucket start (None for all)
+            end: Latest bucket start (None for all)
+            resolution: Largest acceptable spacing of points in seconds (None for raw)
+
+        Returns:
+            Points with min/max/mean/count/last, oldest first
+        """
+        tier = select_tier(resolution) if self._has_rollups(name) else 0
+        with self._lock:
+            return self._points(name, field, tier, start, end)
+
+    def summary(
+        self, name: str, field: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> RollupPoint:
+        """
+        Aggregate a field over a time range from the rollups.
+
+        The range is read at 1/24 of its length (hourly buckets for a day),
+        so the edges are accurate to that resolution.
+
+        Returns:
+            One point covering the range (count 0 if there is no data)
+        """
+        end = time.time() if end is None else end
+        resolution = (end - start) / 24 if start is not None else max(ROLLUP_TIERS)
+        points = self.trend(name, field, start, end, resolution)
+        total = RollupPoint(points[0].timestamp if points else (start or end))
+        for point in points:
+            total.merge(point)
+        return total
+
+    def _has_rollups(self, name: str) -> bool:
+        """Check if a series has rollup tiers open."""
+        return tier_series(name, ROLLUP_TIERS[0]) in self._fields
+
+    def _points(
+        self, name: str, field: str, tier: int, start: Optional[float], end: Optional[float]
+    ) -> List[RollupPoint]:
+        """Points of one tier, completed from finer tiers (lock held)."""
+        if tier == 0:
+            index = self._fields[name].index(field) + 1
+            points = []
+            for segment, lo, hi in self._ranges(name, start, end):
+                for timestamp, value in zip(
+                    segment.column(0, lo, hi), segment.column(index, lo, hi)
+                ):
+                    point = RollupPoint.from_value(timestamp, value)
+                    if point.count:
+                        points.append(point)
+            return points
+
+        series = tier_series(name, tier)
+        first = rollup_fields(self._fields[name]).index(f"{field}_min") + 1
+        points = []
+        for segment, lo, hi in self._ranges(series, start, end):
+            columns = [segment.column(first + i, lo, hi) for i in range(5)]
+            for timestamp, *row in zip(segment.column(0, lo, hi), *columns):
+                point = RollupPoint.from_row(timestamp, row)
+                if point.count:
+                    points.append(point)
+
+        # Buckets still open (or lost in a restart) come from the next finer tier
+        last = self._last(series)
+        if last is None:
+            tail_start = start
+        else:
+            tail_start = last + tier if start is None else max(last + tier, start)
+        if end is None or tail_start is None or tail_start <= end:
+            finer = ROLLUP_TIERS[ROLLUP_TIERS.index(tier) - 1] if tier != ROLLUP_TIERS[0] else 0
+            points.extend(bucket_points(self._points(name, field, finer, tail_start, end), tier))
+        return points
+
+    def _expire(self, name: str, now: float) -> int:
+        """Delete segments of a series older than the retention period (lock held)."""
+        segments = self._segments[name]
+        cutoff = now - self._retention[name]
+        removed = 0
+        # Never the active (last) segment
+        while len(segments) > 1 and segments[0].last is not None and segments[0].last < cutoff:
+            segment = segments.pop(0)
+            segment.close()
+            try:
+                os.unlink(segment.path)
+            except OSError as e:
+                logger.warning(f"Could not delete {segment.path}: {e}")
+            removed += 1
+        if removed:
+            logger.debug(f"{name}: deleted {removed} expired segment(s)")
+        return removed
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """
+        Delete segments older than the retention period in every series.
+
+        Runs on its own whenever a segment is started; call it to expire
+        history of series that are no longer written.
+
+        Args:
+            now: Reference time (default: time.time())
+
+        Returns:
+            Number of segments deleted
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return sum(self._expire(name, now) for name in self._segments)
+
+    def flush(self) -> None:
+        """Write all pending records to disk."""
+        with self._lock:
+            for segments in self._segments.values():
+                if segments:
+                    segments[-1].flush()
+
+    def close(self) -> None:
+        """Flush and close all segments."""
+        with self._lock:
+            for segments in self._segments.values():
+                for segment in segments:
+                    segment.close()
+            self._segments = {}
+            self._fields = {}
+            self._rollups = {}
@@ -13,6 +13,8 @@ import time
 
 import serial
 
+from rm530_5g_integration.core.readiness import DEFAULT_READY_TIMEOUT, ReadinessWaiter
+
 # Configuration
 DEFAULT_APN = "airtelgprs.com"
 AT_BAUDRATE = 115200
@@ -168,13 +170,20 @@ def switch_to_ecm_mode(apn=None):
 
         # Apply settings (soft reset)
         print("\n6. Applying settings...")
-        send_at_command(ser, "AT+CFUN=1,1", expected="", timeout=10)
+        with ReadinessWaiter(port=port, baudrate=AT_BAUDRATE) as waiter:
+            send_at_command(ser, "AT+CFUN=1,1", expected="", timeout=10)
+
+            # Close connection
+            ser.close()
+            print("\n✓ ECM mode configuration complete!")
+            print("  Modem will reset and restart in ECM mode.")
+            print(f"  Waiting for modem to restart (up to {DEFAULT_READY_TIMEOUT:.0f} seconds)...")
+            result = waiter.wait(timeout=DEFAULT_READY_TIMEOUT)
 
-        # Close connection
-        ser.close()
-        print("\n✓ ECM mode configuration complete!")
-        print("  Modem will reset and restart in ECM mode.")
-        print("  Wait 10-15 seconds for modem to restart...")
+        if result.ready:
+            print(f"✓ Modem {result}")
+        else:
+            print(f"⚠ Modem {result}")
 
         return True
 
@@ -250,9 +259,8 @@ def main():
         print("Setup complete!")
         print("=" * 60)
         print("\nNext steps:")
-        print("1. Wait 15 seconds for modem to restart")
-        print("2. Check interface: ip link show")
-        print("3. Configure NetworkManager with:")
+        print("1. Check interface: ip link show")
+        print("2. Configure NetworkManager with:")
         print("   nmcli connection add type ethernet ifname <interface> \\")
         print("      con-name 'RM530-5G-ECM' ipv4.method auto \\")
         print("      connection.autoconnect yes")
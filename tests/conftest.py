@@ -1,10 +1,67 @@
 """Pytest configuration and fixtures."""
 
-from typing import Generator
+import os
+import threading
+from typing import Dict, Generator
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
+try:
+    import pty
+    import tty
+
+    PTY_AVAILABLE = True
+except ImportError:
+    PTY_AVAILABLE = False
+
+
+class FakeModem:
+    """AT command responder on the master side of a pseudo-terminal."""
+
+    def __init__(self) -> None:
+        """Open the pty pair and start answering commands."""
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+        self.responses: Dict[str, bytes] = {}
+        self.commands: list[str] = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def push(self, data: bytes) -> None:
+        """Send unsolicited bytes to the host side."""
+        os.write(self.master, data)
+
+    def _run(self) -> None:
+        """Echo each command line and write its canned response (default OK)."""
+        buffer = b""
+        while True:
+            try:
+                data = os.read(self.master, 1024)
+            except OSError:
+                return
+            if not data:
+                return
+            buffer += data
+            while b"\r" in buffer:
+                line, buffer = buffer.split(b"\r", 1)
+                buffer = buffer.lstrip(b"\n")
+                command = line.decode().strip()
+                if not command:
+                    continue
+                self.commands.append(command)
+                os.write(self.master, line + b"\r\r\n")
+                os.write(self.master, self.responses.get(command, b"\r\nOK\r\n"))
+
+    def close(self) -> None:
+        """Close both ends of the pty."""
+        for fd in (self.slave, self.master):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
 
 @pytest.fixture
 def mock_serial():
@@ -25,6 +82,27 @@ def mock_serial():
     return serial_mock
 
 
+@pytest.fixture
+def fake_modem():
+    """Pseudo-terminal backed modem answering AT commands."""
+    if not PTY_AVAILABLE:
+        pytest.skip("pty not available")
+    modem = FakeModem()
+    yield modem
+    modem.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_port_cache(tmp_path, monkeypatch):
+    """Keep find_modem() away from the real ~/.rm530/ports.json."""
+    from rm530_5g_integration.core import modem as modem_module
+    from rm530_5g_integration.core.discovery import PortCache
+
+    cache = PortCache(str(tmp_path / "ports.json"))
+    monkeypatch.setattr(modem_module, "_persistent_cache", cache)
+    return cache
+
+
 @pytest.fixture
 def mock_modem_port():
     """Mock modem port path."""
@@ -0,0 +1,70 @@
+"""Unit tests for async modem module."""
+
+import asyncio
+
+import pytest
+
+from rm530_5g_integration.core.async_modem import AsyncModem
+from rm530_5g_integration.utils.exceptions import SerialCommunicationError
+
+
+class TestAsyncModem:
+    """Test AsyncModem against a pty-backed fake modem."""
+
+    def test_execute(self, fake_modem):
+        """Test commands resolve on the final result code."""
+        fake_modem.responses["AT+CSQ"] = b"\r\n+CSQ: 20,99\r\n\r\nOK\r\n"
+
+        async def run():
+            async with AsyncModem(port=fake_modem.port) as modem:
+                return await modem.execute("AT+CSQ")
+
+        response = asyncio.run(run())
+
+        assert response.ok
+        assert response.lines == ["+CSQ: 20,99"]
+
+    def test_concurrent_commands_are_serialized(self, fake_modem):
+        """Test concurrent tasks each get their own response."""
+        fake_modem.responses["AT+CSQ"] = b"\r\n+CSQ: 20,99\r\n\r\nOK\r\n"
+        fake_modem.responses["AT+QNWINFO"] = b'\r\n+QNWINFO: "FDD LTE","40445"\r\n\r\nOK\r\n'
+
+        async def run():
+            async with AsyncModem(port=fake_modem.port) as modem:
+                return await asyncio.gather(modem.execute("AT+CSQ"), modem.execute("AT+QNWINFO"))
+
+        csq, nwinfo = asyncio.run(run())
+
+        assert csq.lines == ["+CSQ: 20,99"]
+        assert nwinfo.lines == ['+QNWINFO: "FDD LTE","40445"']
+
+    def test_urc_delivered_without_command(self, fake_modem):
+        """Test URCs are dispatched as soon as they arrive."""
+
+        async def run():
+            async with AsyncModem(port=fake_modem.port) as modem:
+                received = asyncio.Event()
+                modem.urcs.subscribe(lambda urc: received.set(), ["RDY"])
+                fake_modem.push(b"\r\nRDY\r\n")
+                await asyncio.wait_for(received.wait(), 2)
+                return True
+
+        assert asyncio.run(run())
+
+    def test_timeout(self, fake_modem):
+        """Test a missing final result code times out."""
+        fake_modem.responses["AT+QENG"] = b"\r\n+QENG: partial\r\n"
+
+        async def run():
+            async with AsyncModem(port=fake_modem.port) as modem:
+                return await modem.execute("AT+QENG", timeout=0.1)
+
+        response = asyncio.run(run())
+
+        assert response.timed_out
+        assert response.lines == ["+QENG: partial"]
+
+    def test_execute_not_connected(self):
+        """Test executing without a connection."""
+        with pytest.raises(SerialCommunicationError):
+            asyncio.run(AsyncModem().execute("AT"))
@@ -0,0 +1,148 @@
+"""Unit tests for the throughput benchmark."""
+
+import json
+import math
+import socket
+import time
+
+import pytest
+
+from rm530_5g_integration.monitoring import bench
+from rm530_5g_integration.monitoring.bench import (
+    BENCH_SERIES,
+    BenchClient,
+    BenchResult,
+    BenchServer,
+    StreamResult,
+    jain_fairness,
+    record_bench,
+)
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.store import SIGNAL_SERIES, MetricStore
+
+
+@pytest.fixture
+def server():
+    """Benchmark server on a loopback ephemeral port."""
+    server = BenchServer("127.0.0.1", port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+class TestBenchLoopback:
+    """Test client runs against a local server."""
+
+    @pytest.mark.parametrize("direction", ["upload", "download"])
+    def test_tcp(self, server, direction):
+        """Test every TCP stream moves data and reports a time series."""
+        client = BenchClient("127.0.0.1", port=server.port, streams=2, duration=0.3, interval=0.1)
+        result = client.run("tcp", direction)
+
+        assert len(result.streams) == 2
+        assert all(stream.bytes > 0 for stream in result.streams)
+        assert result.goodput > 0
+        assert 0.5 <= result.fairness <= 1.0
+        total = sum(stream.bytes for stream in result.streams)
+        assert sum(result.series) * 0.1 / 8 == pytest.approx(total)
+
+    @pytest.mark.parametrize("direction", ["upload", "download"])
+    def test_udp(self, server, direction):
+        """Test paced UDP streams report loss and jitter from the receiver."""
+        client = BenchClient(
+            "127.0.0.1", port=server.port, streams=2, duration=0.3, udp_rate=2e6, udp_size=500
+        )
+        result = client.run("udp", direction)
+
+        assert all(stream.packets_sent > 0 for stream in result.streams)
+        assert result.loss is not None and result.loss < 0.5
+        assert result.jitter is not None
+        # 2 Mbit/s for 0.3 s split over two streams
+        assert sum(stream.packets_sent for stream in result.streams) == pytest.approx(150, abs=10)
+
+    def test_server_clamps_duration(self, server, monkeypatch):
+        """Test a download asked to run for hours stops at the server's limit."""
+        monkeypatch.setattr(bench, "MAX_DURATION", 0.2)
+        request = {"id": "r", "stream": 0, "protocol": "tcp", "direction": "download"}
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+            sock.sendall(json.dumps({**request, "duration": 1e9}).encode() + b"\n")
+            start = time.monotonic()
+            while sock.recv(65536):
+                pass
+        assert time.monotonic() - start < 2
+
+    def test_server_rejects_non_finite_values(self, server):
+        """Test NaN durations are refused rather than clamped."""
+        request = {"id": "r", "stream": 0, "protocol": "tcp", "direction": "download"}
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+            sock.sendall(json.dumps({**request, "duration": "nan"}).encode() + b"\n")
+            assert sock.recv(65536) == b""
+
+    def test_udp_download_ignores_other_senders(self, server):
+        """Test only a hello from the control connection's address starts the stream."""
+        request = {
+            "id": "r",
+            "stream": 0,
+            "protocol": "udp",
+            "direction": "download",
+            "duration": 0.2,
+            "rate": 1e6,
+        }
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5) as control:
+            control.sendall(json.dumps(request).encode() + b"\n")
+            port = json.loads(control.makefile("rb").readline())["port"]
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as other:
+                other.bind(("127.0.0.2", 0))
+                other.settimeout(0.3)
+                other.sendto(b"hello", ("127.0.0.1", port))
+                with pytest.raises(socket.timeout):
+                    other.recv(65535)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as data:
+                data.settimeout(2)
+                data.sendto(b"hello", ("127.0.0.1", port))
+                assert data.recv(65535)
+
+    def test_rejects_bad_parameters(self):
+        """Test invalid stream counts and modes are refused."""
+        with pytest.raises(ValueError):
+            BenchClient("127.0.0.1", streams=0)
+        with pytest.raises(ValueError):
+            BenchClient("127.0.0.1").run("sctp")
+
+
+class TestBenchResults:
+    """Test aggregation and storage of results."""
+
+    def test_jain_fairness(self):
+        """Test equal shares score 1 and one stream taking everything scores 1/n."""
+        assert jain_fairness([5.0, 5.0, 5.0, 5.0]) == pytest.approx(1.0)
+        assert jain_fairness([8.0, 0.0, 0.0, 0.0]) == pytest.approx(0.25)
+        assert jain_fairness([]) is None
+
+    def test_record_with_signal(self, tmp_path):
+        """Test a result and its signal snapshot are stored in one bench record."""
+        result = BenchResult(
+            protocol="tcp",
+            direction="download",
+            host="example.net",
+            interface="usb0",
+            duration=1.0,
+            interval=1.0,
+            timestamp=1000.0,
+            streams=[
+                StreamResult(0, bytes=1_000_000, seconds=1.0, retransmits=3),
+                StreamResult(1, bytes=1_000_000, seconds=1.0, retransmits=1),
+            ],
+        )
+        with MetricStore(str(tmp_path)) as store:
+            record_bench(store, result, SignalQuality(rssi=-70, rsrp=-95))
+            record_bench(store, result, timestamp=1001.0)
+
+            assert store.values(BENCH_SERIES, "timestamp") == [1000.0, 1001.0]
+            assert store.values(BENCH_SERIES, "goodput") == [16e6, 16e6]
+            assert store.values(BENCH_SERIES, "retransmits") == [4.0, 4.0]
+            assert store.values(BENCH_SERIES, "upload") == [0.0, 0.0]
+            assert store.values(BENCH_SERIES, "rsrp")[0] == -95.0
+            # Without a snapshot the signal fields are unset
+            assert math.isnan(store.values(BENCH_SERIES, "rsrp")[1])
+            assert store.open_series(SIGNAL_SERIES) is None
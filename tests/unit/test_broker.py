@@ -0,0 +1,148 @@
+"""Unit tests for AT broker module."""
+
+import json
+import os
+import socket
+import tempfile
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.core.broker import ATBroker, BrokerClient, broker_available
+from rm530_5g_integration.core.modem import Modem
+from rm530_5g_integration.core.urc import URCDispatcher
+from rm530_5g_integration.utils.exceptions import SerialCommunicationError
+
+
+@pytest.fixture
+def socket_path():
+    """Temporary broker socket path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "at.sock")
+
+
+@pytest.fixture
+def serial_modem():
+    """Mock serial-mode modem owned by the broker."""
+    modem = Mock()
+    modem.is_connected = True
+    modem.execute.side_effect = lambda command, timeout=5: ATResponse(
+        command=command, lines=["+CSQ: 20,99"], final="OK", raw="+CSQ: 20,99\r\nOK\r\n"
+    )
+    return modem
+
+
+def wait_until(condition, timeout=2.0):
+    """Poll until condition() holds (fail after timeout)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestATBroker:
+    """Test ATBroker and Modem client mode."""
+
+    def test_client_round_trip(self, socket_path, serial_modem):
+        """Test commands from several clients are executed on the shared modem."""
+        broker = ATBroker(serial_modem, socket_path=socket_path)
+        broker.start()
+        try:
+            assert broker_available(socket_path)
+
+            with Modem(broker=socket_path) as first, Modem(broker=socket_path) as second:
+                response = first.execute("AT+CSQ")
+                assert response.ok
+                assert response.lines == ["+CSQ: 20,99"]
+                assert second.send_command("AT+CSQ", expected="+CSQ")
+
+            assert serial_modem.execute.call_count == 2
+        finally:
+            broker.shutdown()
+
+        assert not os.path.exists(socket_path)
+        serial_modem.disconnect.assert_called()
+
+    def test_modem_error_is_reported(self, socket_path, serial_modem):
+        """Test serial failures are returned to the client and the port is reopened."""
+        serial_modem.execute.side_effect = SerialCommunicationError("port gone")
+        broker = ATBroker(serial_modem, socket_path=socket_path)
+        broker.start()
+        try:
+            with Modem(broker=socket_path) as modem:
+                with pytest.raises(SerialCommunicationError):
+                    modem.execute("AT+CSQ")
+            serial_modem.disconnect.assert_called()
+        finally:
+            broker.shutdown()
+
+    def test_invalid_requests_keep_connection(self, socket_path, serial_modem):
+        """Test malformed requests get an error reply and the connection stays usable."""
+        broker = ATBroker(serial_modem, socket_path=socket_path)
+        broker.start()
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(socket_path)
+            rfile = sock.makefile("rb")
+            requests = [
+                {"command": "AT", "timeout": None},
+                {"command": "AT", "timeout": "soon"},
+                [1, 2],
+                {"command": "AT+CSQ"},
+            ]
+            replies = []
+            for request in requests:
+                sock.sendall(json.dumps(request).encode() + b"\n")
+                replies.append(json.loads(rfile.readline()))
+            sock.close()
+
+            assert [reply.get("error", "")[:15] for reply in replies[:3]] == [
+                "Invalid timeout",
+                "Invalid timeout",
+                "Invalid request",
+            ]
+            assert replies[3]["lines"] == ["+CSQ: 20,99"]
+        finally:
+            broker.shutdown()
+
+    def test_stalled_subscriber_is_dropped(self, socket_path, serial_modem):
+        """Test a subscriber that never reads neither blocks URC routing nor commands."""
+        serial_modem.urcs = URCDispatcher()
+        broker = ATBroker(serial_modem, socket_path=socket_path)
+        broker.start()
+        try:
+            stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            stalled.connect(socket_path)
+            stalled.sendall(json.dumps({"subscribe": True}).encode() + b"\n")
+            wait_until(lambda: len(broker._subscribers) == 1)
+
+            start = time.monotonic()
+            for _ in range(5000):
+                serial_modem.urcs.dispatch_line("+QIND: " + "x" * 1000)
+            assert time.monotonic() - start < 2.0
+
+            wait_until(lambda: not broker._subscribers)
+            with Modem(broker=socket_path) as modem:
+                assert modem.execute("AT+CSQ").ok
+
+            # Subscribers that keep reading still get URCs
+            client = BrokerClient(socket_path)
+            received = []
+            client.subscribe(received.append)
+            wait_until(lambda: len(broker._subscribers) == 1)
+            serial_modem.urcs.dispatch_line("+CEREG: 2")
+            wait_until(lambda: received == ["+CEREG: 2"])
+            client.close()
+            stalled.close()
+        finally:
+            broker.shutdown()
+
+    def test_client_without_broker(self, socket_path):
+        """Test connecting to a missing broker fails cleanly."""
+        modem = Modem(broker=socket_path)
+        with pytest.raises(SerialCommunicationError):
+            modem.connect()
+        assert not modem.is_connected
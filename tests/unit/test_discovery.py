@@ -0,0 +1,175 @@
+"""Unit tests for port discovery."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from rm530_5g_integration.core import modem as modem_module
+from rm530_5g_integration.core.discovery import (
+    PortCache,
+    UsbSerialPort,
+    at_port_candidates,
+    list_usb_serial_ports,
+    parse_uevent,
+)
+from rm530_5g_integration.core.modem import clear_port_cache, find_modem
+
+
+def make_sysfs(root, usb_path, vendor, product, interfaces, serial_number=None):
+    """Create a fake sysfs USB device with ttyUSB interfaces {interface: tty}."""
+    usb_dir = os.path.join(root, "devices", "usb1", usb_path)
+    os.makedirs(usb_dir, exist_ok=True)
+    for name, value in (("idVendor", vendor), ("idProduct", product), ("serial", serial_number)):
+        if value is not None:
+            with open(os.path.join(usb_dir, name), "w") as f:
+                f.write(f"{value}\n")
+
+    bus_dir = os.path.join(root, "bus", "usb-serial", "devices")
+    os.makedirs(bus_dir, exist_ok=True)
+    for interface, tty in interfaces.items():
+        interface_dir = os.path.join(usb_dir, f"{usb_path}:1.{interface}")
+        os.makedirs(os.path.join(interface_dir, tty))
+        with open(os.path.join(interface_dir, "bInterfaceNumber"), "w") as f:
+            f.write(f"{interface:02x}\n")
+        os.symlink(os.path.join(interface_dir, tty), os.path.join(bus_dir, tty))
+
+
+@pytest.fixture(autouse=True)
+def reset_port_cache():
+    """Start every test with an empty discovery cache."""
+    clear_port_cache()
+    yield
+    clear_port_cache()
+
+
+QUECTEL_PORTS = [
+    UsbSerialPort("/dev/ttyUSB0", "2c7c", "0800", 0, "1-1.3"),
+    UsbSerialPort("/dev/ttyUSB1", "2c7c", "0800", 1, "1-1.3"),
+    UsbSerialPort("/dev/ttyUSB2", "2c7c", "0800", 2, "1-1.3"),
+    UsbSerialPort("/dev/ttyUSB3", "2c7c", "0800", 3, "1-1.3"),
+    UsbSerialPort("/dev/ttyUSB4", "0403", "6001", 0, "1-1.2"),
+]
+
+
+class TestSysfsDiscovery:
+    """Test sysfs port enumeration."""
+
+    def test_list_usb_serial_ports(self, tmp_path):
+        """Test ports are read with vendor, product and interface."""
+        make_sysfs(str(tmp_path), "1-1.3", "2c7c", "0800", {2: "ttyUSB2", 3: "ttyUSB3"}, "abc")
+        make_sysfs(str(tmp_path), "1-1.2", "0403", "6001", {0: "ttyUSB0"})
+
+        ports = list_usb_serial_ports(str(tmp_path))
+
+        assert [p.device for p in ports] == ["/dev/ttyUSB0", "/dev/ttyUSB2", "/dev/ttyUSB3"]
+        assert ports[1] == UsbSerialPort("/dev/ttyUSB2", "2c7c", "0800", 2, "1-1.3", "abc")
+        assert not ports[0].is_quectel
+
+    def test_list_without_sysfs(self, tmp_path):
+        """Test missing sysfs yields no ports."""
+        assert list_usb_serial_ports(str(tmp_path)) == []
+
+    def test_at_port_candidates(self):
+        """Test only Quectel AT interfaces are candidates, interface 2 first."""
+        assert at_port_candidates(QUECTEL_PORTS) == ["/dev/ttyUSB2", "/dev/ttyUSB3"]
+
+
+class TestFindModemSysfs:
+    """Test sysfs-guided find_modem."""
+
+    @patch("glob.glob")
+    def test_sysfs_candidates_probed_first(self, mock_glob):
+        """Test only the sysfs AT interface is probed when it answers."""
+        mock_glob.return_value = [p.device for p in QUECTEL_PORTS]
+        with patch.object(modem_module, "list_usb_serial_ports", return_value=QUECTEL_PORTS):
+            with patch.object(modem_module, "probe_port", return_value=True) as probe:
+                assert find_modem() == "/dev/ttyUSB2"
+
+        probed = {call.args[0] for call in probe.call_args_list}
+        assert "/dev/ttyUSB2" in probed
+        assert "/dev/ttyUSB0" not in probed
+        assert "/dev/ttyUSB4" not in probed
+
+    @patch("glob.glob")
+    def test_fallback_skips_foreign_devices(self, mock_glob):
+        """Test the fallback probe never touches non-Quectel adapters."""
+        mock_glob.return_value = [p.device for p in QUECTEL_PORTS]
+        with patch.object(modem_module, "list_usb_serial_ports", return_value=QUECTEL_PORTS):
+            with patch.object(
+                modem_module, "probe_port", side_effect=lambda p: p == "/dev/ttyUSB1"
+            ) as probe:
+                assert find_modem() == "/dev/ttyUSB1"
+
+        assert "/dev/ttyUSB4" not in {call.args[0] for call in probe.call_args_list}
+
+    @patch("glob.glob")
+    def test_result_cached_per_topology(self, mock_glob):
+        """Test an unchanged topology is answered from the cache."""
+        mock_glob.return_value = [p.device for p in QUECTEL_PORTS]
+        with patch.object(modem_module, "list_usb_serial_ports", return_value=QUECTEL_PORTS):
+            with patch.object(modem_module, "probe_port", return_value=True) as probe:
+                assert find_modem() == "/dev/ttyUSB2"
+                probe.reset_mock()
+                assert find_modem() == "/dev/ttyUSB2"
+                probe.assert_not_called()
+
+        with patch.object(modem_module, "list_usb_serial_ports", return_value=QUECTEL_PORTS[:3]):
+            with patch.object(modem_module, "probe_port", return_value=True) as probe:
+                find_modem()
+                probe.assert_called()
+
+
+class TestPortCache:
+    """Test the persistent port cache."""
+
+    def test_lookup_validates_against_sysfs(self, tmp_path):
+        """Test a stored port is returned while sysfs still matches it."""
+        sysfs = str(tmp_path / "sys")
+        make_sysfs(sysfs, "1-1.3", "2c7c", "0800", {2: "ttyUSB2"}, "abc")
+        cache = PortCache(str(tmp_path / "ports.json"), sysfs_root=sysfs)
+        cache.store(list_usb_serial_ports(sysfs)[0])
+
+        reloaded = PortCache(str(tmp_path / "ports.json"), sysfs_root=sysfs)
+        assert reloaded.lookup() == "/dev/ttyUSB2"
+
+    def test_renumbered_device_is_stale(self, tmp_path):
+        """Test an entry is dropped when the tty now belongs to another device."""
+        sysfs = str(tmp_path / "sys")
+        make_sysfs(sysfs, "1-1.3", "2c7c", "0800", {2: "ttyUSB2"}, "abc")
+        cache = PortCache(str(tmp_path / "ports.json"), sysfs_root=sysfs)
+        cache.store(UsbSerialPort("/dev/ttyUSB2", "2c7c", "0800", 2, "1-1.3", "other"))
+
+        assert cache.lookup() is None
+        assert PortCache(str(tmp_path / "ports.json"), sysfs_root=sysfs).lookup() is None
+
+    def test_remove_event_invalidates_entry(self, tmp_path):
+        """Test a USB remove event under the cached device drops its entry."""
+        sysfs = str(tmp_path / "sys")
+        make_sysfs(sysfs, "1-1.3", "2c7c", "0800", {2: "ttyUSB2"}, "abc")
+        cache = PortCache(str(tmp_path / "ports.json"), sysfs_root=sysfs)
+        cache.store(list_usb_serial_ports(sysfs)[0])
+
+        event = parse_uevent(
+            b"remove@/devices/usb1/1-1/1-1.3\0ACTION=remove\0"
+            b"DEVPATH=/devices/usb1/1-1/1-1.3\0SUBSYSTEM=usb\0SEQNUM=42\0"
+        )
+        assert event is not None and event.action == "remove" and event.subsystem == "usb"
+        cache.handle_uevent(event)
+
+        assert cache.lookup() is None
+
+    def test_parse_uevent_ignores_udev_messages(self):
+        """Test libudev-formatted messages are not parsed as kernel uevents."""
+        assert parse_uevent(b"libudev\0\xfe\xed\xca\xfe") is None
+
+    @patch("glob.glob")
+    def test_find_modem_uses_cached_port(self, mock_glob, isolated_port_cache):
+        """Test a cached port that answers skips the sysfs scan and other probes."""
+        with patch.object(isolated_port_cache, "lookup", return_value="/dev/ttyUSB3"):
+            with patch.object(modem_module, "list_usb_serial_ports") as scan:
+                with patch.object(modem_module, "probe_port", return_value=True) as probe:
+                    assert find_modem() == "/dev/ttyUSB3"
+
+        scan.assert_not_called()
+        probe.assert_called_once_with("/dev/ttyUSB3")
@@ -0,0 +1,96 @@
+"""Unit tests for the Prometheus exporter."""
+
+import urllib.request
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from rm530_5g_integration.core.health import HealthStatus
+from rm530_5g_integration.core.parsers import ServingCell
+from rm530_5g_integration.monitoring.exporter import MetricsBuilder, MetricsExporter
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.stats import ConnectionStats, ThroughputRates
+
+
+def make_manager():
+    """Mock manager with a connected interface and an LTE cell."""
+    manager = Mock()
+    manager.status.return_value = ConnectionStats(
+        interface="usb0",
+        is_connected=True,
+        bytes_received=1024,
+        bytes_sent=512,
+        rates=ThroughputRates(rx_bytes=2000.0, tx_bytes=100.0),
+        uptime=timedelta(seconds=90),
+    )
+    manager.signal_quality.return_value = SignalQuality(
+        rssi=-71,
+        network_type="FDD LTE",
+        lte=ServingCell(rat="LTE", band=3, pci=101, rsrp=-95, rsrq=-10, sinr=12.5),
+    )
+    return manager
+
+
+class TestMetricsBuilder:
+    """Test the text exposition format."""
+
+    def test_render(self):
+        """Test HELP/TYPE lines, labels with escaping and value formatting."""
+        builder = MetricsBuilder()
+        builder.add("rm530_x", 1.5, "Help", labels={"name": 'a"b', "skip": None})
+        builder.add("rm530_x", 2.0, "Help", labels={"name": "c"})
+        builder.add("rm530_missing", None, "Left out")
+
+        assert builder.render().decode() == (
+            "# HELP rm530_x Help\n"
+            "# TYPE rm530_x gauge\n"
+            'rm530_x{name="a\\"b"} 1.5\n'
+            'rm530_x{name="c"} 2\n'
+        )
+
+
+class TestMetricsExporter:
+    """Test refreshing and serving metrics."""
+
+    def test_refresh(self):
+        """Test one refresh renders link, signal and health metrics."""
+        monitor = Mock()
+        monitor.check_health.return_value = HealthStatus(is_healthy=True, last_check=datetime.now())
+        exporter = MetricsExporter(make_manager(), monitor=monitor)
+
+        exporter.refresh()
+        page = exporter.page.decode()
+
+        assert 'rm530_interface_receive_bytes_total{interface="usb0"} 1024' in page
+        assert 'rm530_interface_receive_rate_bytes{interface="usb0"} 2000' in page
+        assert 'rm530_cell_rsrp_dbm{rat="LTE",band="3",pci="101"} -95' in page
+        assert "rm530_signal_rssi_dbm -71" in page
+        assert "rm530_health_healthy 1" in page
+        assert "rm530_up 1" in page
+
+    def test_modem_failure(self):
+        """Test a failing modem reports rm530_up 0 and keeps link metrics."""
+        manager = make_manager()
+        manager.signal_quality.side_effect = OSError("port busy")
+        exporter = MetricsExporter(manager)
+
+        exporter.refresh()
+        page = exporter.page.decode()
+
+        assert "rm530_up 0" in page
+        assert "rm530_refresh_errors_total 1" in page
+        assert "rm530_interface_connected" in page
+
+    def test_http_endpoint(self):
+        """Test /metrics serves the cached page over HTTP."""
+        exporter = MetricsExporter(make_manager(), host="127.0.0.1", port=0, interval=60)
+        exporter.refresh()
+        exporter.start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics") as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        finally:
+            exporter.stop()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert "rm530_signal_rssi_dbm" in body
@@ -0,0 +1,239 @@
+"""Unit tests for health monitoring."""
+
+import asyncio
+import time
+from collections import Counter
+from unittest.mock import Mock
+
+from rm530_5g_integration.core.health import HEALTH_CHECKS, HealthMonitor
+from rm530_5g_integration.core.parsers import Registration
+from rm530_5g_integration.core.probe import ProbeResult, ProbeTarget
+from rm530_5g_integration.monitoring.latency import LatencyProber
+from rm530_5g_integration.monitoring.signal import SignalQuality
+from rm530_5g_integration.monitoring.stats import ConnectionStats
+from rm530_5g_integration.monitoring.store import (
+    HEALTH_SERIES,
+    INTERFACE_SERIES,
+    SIGNAL_SERIES,
+    MetricStore,
+)
+
+
+def make_manager(rssi_values):
+    """Mock manager that is connected and reports the given RSSI readings in turn."""
+    manager = Mock()
+    manager.status.return_value = ConnectionStats(
+        interface="usb0", is_connected=True, ip_address="10.0.0.2"
+    )
+    manager.network.get_interface_ip.return_value = "10.0.0.2"
+    manager.probe.return_value = [
+        ProbeResult(ProbeTarget.parse("8.8.8.8"), "icmp", sent=1, received=1, rtts=[30.0])
+    ]
+    manager.registration.return_value = Registration("+CEREG", mode=0, state=1)
+    manager.signal_quality.side_effect = [SignalQuality(rssi=rssi) for rssi in rssi_values]
+    return manager
+
+
+class TestSignalDecision:
+    """Test health decisions based on windowed signal statistics."""
+
+    def test_single_dip_is_not_unhealthy(self):
+        """Test one bad reading does not flip health while the median is fine."""
+        monitor = HealthMonitor(make_manager([-80, -81, -115]), signal_window=5)
+
+        statuses = [monitor.check_health() for _ in range(3)]
+
+        assert all(status.is_healthy for status in statuses)
+        assert statuses[-1].signal_quality["rssi"] == -81
+        assert statuses[-1].signal_quality["samples"] == 3
+
+    def test_sustained_poor_signal(self):
+        """Test a poor median marks the connection unhealthy."""
+        monitor = HealthMonitor(make_manager([-112, -115, -80]), signal_window=3)
+
+        statuses = [monitor.check_health() for _ in range(3)]
+
+        assert not statuses[-1].is_healthy
+        assert "Poor signal strength" in statuses[-1].issues[0]
+
+
+def slow(value, seconds):
+    """Side effect returning value after a delay."""
+
+    def call(*args):
+        time.sleep(seconds)
+        return value
+
+    return call
+
+
+class TestConcurrentChecks:
+    """Test checks run concurrently with per-check timeouts."""
+
+    def test_takes_slowest_check(self):
+        """Test a health check takes as long as the slowest check, not the sum."""
+        manager = make_manager([-80])
+        manager.signal_quality.side_effect = slow(SignalQuality(rssi=-80), 0.3)
+        manager.registration.side_effect = slow(Registration("+CEREG", state=1), 0.3)
+        manager.probe.side_effect = slow(manager.probe.return_value, 0.3)
+        monitor = HealthMonitor(manager)
+
+        start = time.monotonic()
+        status = monitor.check_health()
+
+        assert time.monotonic() - start < 0.6
+        assert status.is_healthy
+        assert set(status.checks) == {"link", "ip", "connectivity", "signal", "registration"}
+
+    def test_timeout_keeps_partial_results(self):
+        """Test a hung signal read times out while the other checks still count."""
+        manager = make_manager([-80])
+        manager.signal_quality.side_effect = slow(SignalQuality(rssi=-80), 1.0)
+        monitor = HealthMonitor(manager, check_timeouts={"signal": 0.1})
+
+        start = time.monotonic()
+        status = monitor.check_health()
+
+        assert time.monotonic() - start < 0.5
+        assert status.checks["signal"].timed_out
+        assert status.signal_quality is None
+        assert status.connection_stats["ip_address"] == "10.0.0.2"
+        assert status.is_healthy
+
+    def test_deadline_bounds_check(self):
+        """Test check_deadline caps every check's timeout."""
+        manager = make_manager([-80])
+        manager.probe.side_effect = slow([], 1.0)
+        monitor = HealthMonitor(manager, check_deadline=0.1)
+
+        start = time.monotonic()
+        status = monitor.check_health()
+
+        assert time.monotonic() - start < 0.5
+        assert not status.is_healthy
+        assert status.issues == ["Connectivity check failed: timed out after 0.1s"]
+
+    def test_ip_check_error(self):
+        """Test a failed IP read is reported as such, not as a missing address."""
+        manager = make_manager([-80])
+        manager.network.get_interface_ip.side_effect = OSError("netlink busy")
+
+        status = HealthMonitor(manager).check_health()
+
+        assert status.issues == ["IP address check failed: netlink busy"]
+
+    def test_not_registered(self):
+        """Test losing network registration is an issue."""
+        manager = make_manager([-80])
+        manager.registration.return_value = Registration("+CEREG", state=2)
+
+        status = HealthMonitor(manager).check_health()
+
+        assert status.issues == ["Not registered on the network (state 2)"]
+
+    def test_sync_check_inside_event_loop(self):
+        """Test check_health() still works when called from a running event loop."""
+        monitor = HealthMonitor(make_manager([-80]))
+
+        async def caller():
+            return monitor.check_health()
+
+        status = asyncio.run(caller())
+
+        assert status.is_healthy
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestScheduledMonitoring:
+    """Test the monitoring loop runs checks on their own intervals."""
+
+    def test_cheap_checks_run_more_often(self):
+        """Test link state is checked every second while the signal is read every 30 s."""
+        clock = FakeClock()
+        monitor = HealthMonitor(
+            make_manager([]), check_intervals={"link": 1, "signal": 30}, check_jitter=0, clock=clock
+        )
+        scheduler = monitor._make_scheduler()
+
+        runs = Counter()
+        for second in range(61):
+            clock.now = float(second)
+            runs.update(scheduler.pop_due())
+
+        assert runs["link"] == 61
+        assert runs["signal"] == 3
+
+    def test_failures_count_rounds(self):
+        """Test failures count once per check_interval, not once per link check."""
+        clock = FakeClock()
+        manager = make_manager([-80] * 5)
+        manager.status.return_value = ConnectionStats(interface="usb0", is_connected=False)
+        monitor = HealthMonitor(manager, check_interval=60, failure_threshold=3, clock=clock)
+        statuses = []
+        monitor.add_callback(statuses.append)
+
+        for name in HEALTH_CHECKS:
+            asyncio.run(monitor._run_scheduled(name))
+        for second in range(1, 200):
+            clock.now = float(second)
+            asyncio.run(monitor._run_scheduled("link"))
+
+        # Change to unhealthy, then alerts from the third round on, every check_interval
+        assert [status.consecutive_failures for status in statuses] == [0, 3, 4]
+        assert monitor.get_last_status().consecutive_failures == 4
+        assert all(status.issues == ["Connection not active"] for status in statuses)
+
+    def test_start_stop(self):
+        """Test the background loop runs checks until stopped."""
+        manager = make_manager([-80] * 5)
+        monitor = HealthMonitor(manager)
+
+        monitor.start()
+        assert monitor.is_running
+        monitor.stop()
+
+        assert not monitor.is_running
+
+
+class TestLatency:
+    """Test health decisions based on continuous latency probes."""
+
+    def test_loss_is_unhealthy(self):
+        """Test loss above max_loss is an issue and latency is reported."""
+        prober = LatencyProber("192.0.2.1")
+        for seq in range(10):
+            prober.record(seq, 40.0 if seq % 4 else None)
+        monitor = HealthMonitor(make_manager([-80]), max_loss=0.1)
+        monitor.attach_latency(prober)
+
+        status = monitor.check_health()
+
+        assert not status.is_healthy
+        assert status.issues == ["Packet loss: 30.0%"]
+        assert status.latency["target"] == "icmp:192.0.2.1"
+        assert status.latency["rtt_p50"] == 40.0
+
+
+class TestHistory:
+    """Test recording health checks in a MetricStore."""
+
+    def test_checks_are_recorded(self, tmp_path):
+        """Test every check appends a health record and the interface counters."""
+        with MetricStore(str(tmp_path)) as store:
+            monitor = HealthMonitor(make_manager([-80, -82]), store=store)
+            monitor.check_health()
+            monitor.check_health()
+
+            assert store.values(HEALTH_SERIES, "healthy") == [1.0, 1.0]
+            assert store.values(HEALTH_SERIES, "rssi") == [-80.0, -81.0]
+            assert len(store.values(INTERFACE_SERIES, "rx_bytes")) == 2
+            assert store.values(SIGNAL_SERIES, "rssi") == [-80.0, -82.0]
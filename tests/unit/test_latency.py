@@ -0,0 +1,69 @@
+"""Unit tests for continuous latency measurement."""
+
+import math
+import time
+
+import pytest
+
+from rm530_5g_integration.monitoring.latency import LatencyProber, rfc3550_jitter, summarize_latency
+
+NAN = float("nan")
+
+
+class TestSummarizeLatency:
+    """Test latency statistics over probe outcomes."""
+
+    def test_statistics(self):
+        """Test percentiles, loss and reordering over a window."""
+        rtts = [10.0, 20.0, NAN, 30.0, 40.0]
+        reordered = [0.0, 0.0, NAN, 1.0, 0.0]
+        stats = summarize_latency(rtts, reordered)
+
+        assert (stats.sent, stats.received) == (5, 4)
+        assert stats.loss == pytest.approx(0.2)
+        assert stats.rtt_min == 10.0 and stats.rtt_max == 40.0
+        assert stats.rtt_p50 == 25.0
+        assert stats.reordered == 1
+        assert stats.reorder_rate == 0.25
+
+    def test_rfc3550_jitter(self):
+        """Test the jitter estimator moves 1/16 of the way to each |D|."""
+        assert rfc3550_jitter([10.0]) is None
+        assert rfc3550_jitter([10.0, 26.0]) == 1.0
+        assert rfc3550_jitter([10.0, 26.0, 26.0]) == pytest.approx(15 / 16)
+
+    def test_all_lost(self):
+        """Test a window without replies has full loss and no RTTs."""
+        stats = summarize_latency([NAN, NAN], [NAN, NAN])
+
+        assert stats.loss == 1.0
+        assert stats.rtt_p50 is None
+
+
+class TestLatencyProber:
+    """Test recording probe outcomes."""
+
+    def test_reordering_across_wrap(self):
+        """Test late replies are flagged, also when the 16-bit sequence wraps."""
+        prober = LatencyProber()
+        now = time.time()
+        for i, seq in enumerate([65534, 65535, 1, 0, 2]):
+            prober.record(seq, 10.0, timestamp=now + i)
+        prober.record(3, None, timestamp=now + 5)
+
+        flags = prober.ring.values("reordered")
+        assert flags[:5] == [0.0, 0.0, 0.0, 1.0, 0.0]
+        assert math.isnan(flags[5])  # Lost probes are neither
+        stats = prober.summary(window=60)
+        assert (stats.sent, stats.received, stats.reordered) == (6, 5, 1)
+
+    def test_loopback(self):
+        """Test continuous probing of localhost fills the ring."""
+        prober = LatencyProber("tcp:127.0.0.1:9", rate_hz=50, timeout=0.5)
+        prober.start()
+        time.sleep(0.3)
+        prober.stop()
+
+        stats = prober.summary()
+        assert stats.sent >= 5
+        assert stats.loss == 0.0
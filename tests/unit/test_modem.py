@@ -1,11 +1,22 @@
 """Unit tests for modem module."""
 
+import time
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
 import serial
 
-from rm530_5g_integration.core.modem import Modem, find_modem
+from rm530_5g_integration.core import modem as modem_module
+from rm530_5g_integration.core.at import ATResponse, chain_commands
+from rm530_5g_integration.core.modem import (
+    ECM_STATE_COMMANDS,
+    READ_POLL_TIMEOUT,
+    Modem,
+    ecm_config_commands,
+    find_modem,
+    read_response,
+    watch_hotplug,
+)
 from rm530_5g_integration.utils.exceptions import ModemNotFoundError, SerialCommunicationError
 
 
@@ -254,7 +265,7 @@ class TestFindModem:
         """Test finding modem successfully."""
         mock_glob.return_value = ["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyUSB2"]
 
-        mock_ser = Mock()
+        mock_ser = Mock(timeout=0.5)
         mock_ser.in_waiting = 0
         mock_ser.read.return_value = b"OK\r\n"
         mock_serial_class.return_value = mock_ser
@@ -276,10 +287,188 @@ class TestFindModem:
         """Test when ports exist but don't respond."""
         mock_glob.return_value = ["/dev/ttyUSB0"]
 
-        mock_ser = Mock()
+        mock_ser = Mock(timeout=0.5)
         mock_ser.in_waiting = 0
         mock_ser.read.return_value = b"ERROR\r\n"
         mock_serial_class.return_value = mock_ser
 
         port = find_modem()
         assert port is None
+
+    @patch("glob.glob")
+    @patch("rm530_5g_integration.core.modem.HotplugWatcher")
+    def test_hotplug_watcher_is_opt_in(self, mock_watcher_class, mock_glob, monkeypatch):
+        """Test find_modem() starts no watcher thread; watch_hotplug() starts one."""
+        monkeypatch.setattr(modem_module, "_hotplug_watcher", None)
+        mock_glob.return_value = []
+
+        find_modem()
+        mock_watcher_class.assert_not_called()
+
+        watch_hotplug()
+        watch_hotplug()
+        mock_watcher_class.return_value.start.assert_called_once()
+
+
+class TestReadResponse:
+    """Test terminator-driven response reading."""
+
+    @staticmethod
+    def make_port(*chunks):
+        """Create a mock port that returns the given chunks in order."""
+        pending = list(chunks)
+        port = Mock(timeout=1.0)
+        type(port).in_waiting = PropertyMock(side_effect=lambda: len(pending[0]) if pending else 0)
+        port.read = MagicMock(side_effect=lambda size=1: pending.pop(0) if pending else b"")
+        return port
+
+    def test_returns_on_final_ok(self):
+        """Test response is returned as soon as OK arrives."""
+        port = self.make_port(b"AT+CSQ\r\r\n+CSQ: 2", b"0,99\r\n\r\nOK\r\n", b"+CREG: 1\r\n")
+        response = read_response(port, "AT+CSQ", time.monotonic() + 5)
+
+        assert response.ok
+        assert response.lines == ["+CSQ: 20,99"]
+        # Bytes after the final result code are left in the port
+        assert port.read.call_count == 2
+
+    def test_cme_error_is_final(self):
+        """Test +CME ERROR terminates the response as an error."""
+        port = self.make_port(b"\r\n+CME ERROR: 10\r\n")
+        response = read_response(port, "AT+CPIN?", time.monotonic() + 5)
+
+        assert not response.ok
+        assert response.error == "+CME ERROR: 10"
+
+    def test_timeout_without_final(self):
+        """Test timeout leaves final result unset."""
+        port = self.make_port(b"+CSQ: 20,99\r\n")
+        response = read_response(port, "AT+CSQ", time.monotonic() + 0.05)
+
+        assert response.timed_out
+        assert response.lines == ["+CSQ: 20,99"]
+
+    def test_port_configured_once(self):
+        """Test the port timeout is shortened once per command and restored afterwards."""
+        port = TimeoutPort(timeout=1.0)
+
+        start = time.monotonic()
+        read_response(port, "AT", start + 0.2)
+
+        assert time.monotonic() - start < 0.2 + 2 * READ_POLL_TIMEOUT
+        assert port.reads > 1
+        assert port.settings == [READ_POLL_TIMEOUT, 1.0]
+
+
+class TimeoutPort:
+    """Silent port recording every timeout change (each one is an ioctl on a real port)."""
+
+    in_waiting = 0
+
+    def __init__(self, timeout):
+        self._timeout = timeout
+        self.settings = []
+        self.reads = 0
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self.settings.append(value)
+        self._timeout = value
+
+    def read(self, size=1):
+        self.reads += 1
+        time.sleep(self._timeout)
+        return b""
+
+
+class TestExecuteBatch:
+    """Test batched command execution."""
+
+    def test_compatible_commands_are_chained(self):
+        """Test compatible commands share one round trip and are split again."""
+        modem = Modem(port="/dev/ttyUSB0")
+        modem.execute = Mock(
+            return_value=ATResponse(
+                command='AT+CSQ;+QENG="servingcell"',
+                lines=["+CSQ: 20,99", '+QENG: "servingcell","NOCONN"', '+QENG: "LTE","FDD"'],
+                final="OK",
+            )
+        )
+
+        csq, qeng = modem.execute_batch(["AT+CSQ", 'AT+QENG="servingcell"'])
+
+        modem.execute.assert_called_once_with('AT+CSQ;+QENG="servingcell"', timeout=5)
+        assert csq.ok and csq.lines == ["+CSQ: 20,99"]
+        assert len(qeng.lines) == 2
+        assert qeng.raw.endswith("OK\r\n")
+
+    def test_chain_error_falls_back_to_separate_commands(self):
+        """Test an ERROR on the chained line re-runs each command separately."""
+        modem = Modem(port="/dev/ttyUSB0")
+        modem.execute = Mock(
+            side_effect=[
+                ATResponse(command="AT+CSQ;+QNWINFO", final="ERROR"),
+                ATResponse(command="AT+CSQ", lines=["+CSQ: 20,99"], final="OK"),
+                ATResponse(command="AT+QNWINFO", final="+CME ERROR: 30"),
+            ]
+        )
+
+        csq, nwinfo = modem.execute_batch(["AT+CSQ", "AT+QNWINFO"])
+
+        assert csq.ok
+        assert nwinfo.error == "+CME ERROR: 30"
+
+    def test_reset_is_not_chained(self):
+        """Test reset commands are never chained."""
+        assert chain_commands(['AT+QCFG="usbnet",1', "AT+CFUN=1,1"]) is None
+        assert chain_commands(["AT+CSQ", "AT+CSQ"]) is None
+        assert chain_commands(["AT", "AT+CSQ"]) is None
+
+
+PROVISIONED_STATE = {
+    'AT+QCFG="usbnet"': b'\r\n+QCFG: "usbnet",1\r\n\r\nOK\r\n',
+    'AT+QCFG="data_interface"': b'\r\n+QCFG: "data_interface",0,0\r\n\r\nOK\r\n',
+    "AT+CGDCONT?": b'\r\n+CGDCONT: 1,"IP","airtelgprs.com","0.0.0.0",0,0,0,0\r\n\r\nOK\r\n',
+}
+
+
+class TestSwitchToEcmMode:
+    """Test the idempotent ECM switch."""
+
+    def test_provisioned_modem_is_not_reset(self, fake_modem):
+        """Test nothing is written and no reset is issued when settings match."""
+        fake_modem.responses.update(PROVISIONED_STATE)
+        with Modem(port=fake_modem.port, timeout=1) as modem:
+            assert modem.switch_to_ecm_mode(apn="AirtelGPRS.com")
+            assert not modem.reset_issued
+
+        assert fake_modem.commands[1:] == list(ECM_STATE_COMMANDS)
+
+    def test_only_differing_settings_are_written(self, fake_modem):
+        """Test a changed APN is written, followed by a reset."""
+        fake_modem.responses.update(PROVISIONED_STATE)
+        with Modem(port=fake_modem.port, timeout=1) as modem:
+            assert modem.switch_to_ecm_mode(apn="jionet")
+            assert modem.reset_issued
+
+        assert 'AT+CGDCONT=1,"IP","jionet"' in fake_modem.commands
+        assert 'AT+QCFG="usbnet",1' not in fake_modem.commands
+        assert fake_modem.commands[-1] == "AT+CFUN=1,1"
+
+    def test_unreadable_state_is_rewritten(self):
+        """Test settings that could not be read are treated as different."""
+        state = [
+            ATResponse(command='AT+QCFG="usbnet"', lines=['+QCFG: "usbnet",0'], final="OK"),
+            ATResponse(command='AT+QCFG="data_interface"', final="ERROR"),
+            ATResponse(command="AT+CGDCONT?", final="OK"),
+        ]
+
+        assert ecm_config_commands(state, apn="www") == [
+            'AT+QCFG="usbnet",1',
+            'AT+QCFG="data_interface",0,0',
+            'AT+CGDCONT=1,"IP","www"',
+        ]
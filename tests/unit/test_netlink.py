@@ -0,0 +1,111 @@
+"""Unit tests for the rtnetlink client."""
+
+import socket
+import struct
+
+import pytest
+
+from rm530_5g_integration.core.netlink import (
+    IFA_ADDRESS,
+    IFA_LABEL,
+    IFA_LOCAL,
+    IFLA_IFNAME,
+    IFLA_MTU,
+    IFLA_OPERSTATE,
+    IFLA_STATS64,
+    InterfaceTable,
+    dump_interfaces,
+    parse_address,
+    parse_link,
+)
+
+
+def rtattr(kind, payload):
+    """Encode one padded rtattr."""
+    data = struct.pack("=HH", 4 + len(payload), kind) + payload
+    return data + b"\0" * (-len(data) % 4)
+
+
+def link_payload(index, name, operstate=6, flags=0x1):
+    """Encode an RTM_NEWLINK payload."""
+    stats = struct.pack("=8Q", 10, 20, 1000, 2000, 1, 2, 3, 4) + b"\0" * 32
+    return (
+        struct.pack("=BxHiII", socket.AF_UNSPEC, 1, index, flags, 0)
+        + rtattr(IFLA_IFNAME, name.encode() + b"\0")
+        + rtattr(IFLA_MTU, struct.pack("=I", 1500))
+        + rtattr(IFLA_OPERSTATE, bytes([operstate]))
+        + rtattr(IFLA_STATS64, stats)
+    )
+
+
+def address_payload(index, family, address, prefixlen, scope=0, local=None):
+    """Encode an RTM_NEWADDR payload."""
+    payload = struct.pack("=BBBBI", family, prefixlen, 0, scope, index)
+    payload += rtattr(IFA_ADDRESS, socket.inet_pton(family, address))
+    if local is not None:
+        payload += rtattr(IFA_LOCAL, socket.inet_pton(family, local))
+    if family == socket.AF_INET:
+        payload += rtattr(IFA_LABEL, b"usb0\0")
+    return payload
+
+
+class TestParsing:
+    """Test decoding rtnetlink messages."""
+
+    def test_parse_link(self):
+        """Test name, MTU, operstate and 64-bit counters are decoded."""
+        link = parse_link(link_payload(5, "usb0"))
+
+        assert link.index == 5
+        assert link.name == "usb0"
+        assert link.mtu == 1500
+        assert link.operstate == "up"
+        assert link.is_up
+        assert (link.rx_packets, link.tx_packets, link.rx_bytes, link.tx_bytes) == (
+            10,
+            20,
+            1000,
+            2000,
+        )
+
+    def test_parse_address_prefers_local(self):
+        """Test IFA_LOCAL wins over the point-to-point peer address."""
+        address = parse_address(
+            address_payload(5, socket.AF_INET, "10.0.0.1", 32, local="10.0.0.2")
+        )
+
+        assert address.address == "10.0.0.2"
+        assert address.prefixlen == 32
+        assert address.label == "usb0"
+        assert address.version == 4
+
+    def test_table_lookups(self):
+        """Test per-interface IPv4 and global IPv6 lookups from one table."""
+        table = InterfaceTable(
+            links={1: parse_link(link_payload(1, "lo")), 5: parse_link(link_payload(5, "usb0"))},
+            addresses=[
+                parse_address(address_payload(1, socket.AF_INET, "127.0.0.1", 8)),
+                parse_address(address_payload(5, socket.AF_INET6, "fe80::1", 64, scope=253)),
+                parse_address(address_payload(5, socket.AF_INET6, "2001:db8::5", 64)),
+                parse_address(address_payload(5, socket.AF_INET, "192.168.225.20", 24)),
+            ],
+        )
+
+        assert table.ipv4("usb0") == "192.168.225.20"
+        assert table.ipv6("usb0") == "2001:db8::5"
+        assert table.ipv4("lo") is None
+        assert table.ipv4("wwan0") is None
+        assert len(table.addresses_of("usb0")) == 3
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_NETLINK"), reason="Linux only")
+class TestDump:
+    """Test dumping the host's interfaces."""
+
+    def test_dump_includes_loopback(self):
+        """Test one dump returns loopback with its addresses."""
+        table = dump_interfaces()
+
+        lo = table.link("lo")
+        assert lo is not None and lo.is_loopback
+        assert any(a.address == "127.0.0.1" for a in table.addresses_of("lo"))
@@ -0,0 +1,112 @@
+"""Unit tests for AT response parsers."""
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.core.parsers import (
+    parse_cgdcont,
+    parse_cops,
+    parse_csq,
+    parse_qcfg,
+    parse_qnwinfo,
+    parse_registration,
+    parse_servingcell,
+)
+
+
+def response(*lines: str) -> ATResponse:
+    """Build an OK response with the given information lines."""
+    return ATResponse(command="AT", lines=list(lines), final="OK")
+
+
+LTE_LINE = (
+    '+QENG: "servingcell","NOCONN","LTE","FDD",404,45,2A1B3C4,301,1275,3,5,5,'
+    "1F4,-95,-11,-65,150,12,-,-"
+)
+NR_SA_LINE = (
+    '+QENG: "servingcell","NOCONN","NR5G-SA","TDD",404,45,1A2B3C4D5,510,AB12,'
+    "636768,78,12,-88,-11,16,1,-"
+)
+ENDC_LINES = (
+    '+QENG: "servingcell","NOCONN"',
+    '+QENG: "LTE","FDD",404,45,2A1B3C4,301,1275,3,5,5,1F4,-95,-11,-65,150,12,-,-',
+    '+QENG: "NR5G-NSA",404,45,510,-80,20,-10,636768,78,12,1',
+)
+
+
+class TestSimpleParsers:
+    """Test single-line parsers."""
+
+    def test_csq(self):
+        """Test CSQ is converted to dBm and 99 means unknown."""
+        assert parse_csq(response("+CSQ: 20,99")).rssi_dbm == -73
+        assert parse_csq(response("+CSQ: 99,99")).rssi_dbm is None
+        assert parse_csq(response()) is None
+
+    def test_qnwinfo(self):
+        """Test network information fields."""
+        info = parse_qnwinfo(response('+QNWINFO: "FDD LTE","40445","LTE BAND 3",1275'))
+        assert info.access_technology == "FDD LTE"
+        assert info.band == "LTE BAND 3"
+        assert info.channel == 1275
+
+    def test_qcfg_and_cgdcont(self):
+        """Test configuration and PDP context queries."""
+        assert parse_qcfg(response('+QCFG: "usbnet",1'), "usbnet").values == ["1"]
+        assert parse_qcfg(response('+QCFG: "usbnet",1'), "data_interface") is None
+        contexts = parse_cgdcont(
+            response('+CGDCONT: 1,"IP","jionet","0.0.0.0",0,0', '+CGDCONT: 2,"IPV4V6","ims"')
+        )
+        assert [(c.cid, c.pdp_type, c.apn) for c in contexts] == [
+            (1, "IP", "jionet"),
+            (2, "IPV4V6", "ims"),
+        ]
+
+    def test_cops_and_registration(self):
+        """Test operator and registration queries."""
+        operator = parse_cops(response('+COPS: 0,0,"airtel",13'))
+        assert operator.name == "airtel" and operator.access_technology == 13
+
+        registration = parse_registration(response('+CEREG: 2,5,"1F4","2A1B3C4",7'))
+        assert registration.name == "+CEREG"
+        assert registration.registered
+        assert registration.tac == 0x1F4
+        assert registration.cell_id == 0x2A1B3C4
+
+
+class TestServingCell:
+    """Test AT+QENG="servingcell" parsing."""
+
+    def test_lte(self):
+        """Test an LTE serving cell."""
+        report = parse_servingcell(response(LTE_LINE))
+
+        cell = report.lte
+        assert report.state == "NOCONN"
+        assert report.nr is None
+        assert (cell.pci, cell.arfcn, cell.band, cell.bandwidth) == (301, 1275, 3, 20.0)
+        assert (cell.rsrp, cell.rsrq, cell.rssi, cell.sinr) == (-95, -11, -65, 10.0)
+        assert cell.tac == 0x1F4
+        assert cell.tx_power is None
+
+    def test_nr_sa(self):
+        """Test an NR standalone serving cell."""
+        cell = parse_servingcell(response(NR_SA_LINE)).primary
+
+        assert cell.rat == "NR5G-SA"
+        assert (cell.pci, cell.arfcn, cell.band, cell.bandwidth) == (510, 636768, 78, 100.0)
+        assert (cell.rsrp, cell.rsrq, cell.sinr) == (-88, -11, 16.0)
+        assert cell.cell_id == 0x1A2B3C4D5
+
+    def test_endc_keeps_legs_apart(self):
+        """Test EN-DC reports LTE and NR metrics from their own lines."""
+        report = parse_servingcell(response(*ENDC_LINES))
+
+        assert report.primary is report.lte
+        assert report.lte.rsrp == -95 and report.lte.state == "NOCONN"
+        assert report.nr.rat == "NR5G-NSA"
+        assert (report.nr.rsrp, report.nr.sinr, report.nr.rsrq) == (-80, 20.0, -10)
+
+    def test_not_camped(self):
+        """Test a searching modem reports no cells."""
+        report = parse_servingcell(response('+QENG: "servingcell","SEARCH"'))
+        assert report.state == "SEARCH"
+        assert report.cells == []
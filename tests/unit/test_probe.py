@@ -0,0 +1,142 @@
+"""Unit tests for connectivity probes."""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from rm530_5g_integration.core.probe import Prober, ProbeTarget, dns_query
+
+
+class TestProbeTarget:
+    """Test parsing probe target specs."""
+
+    def test_parse(self):
+        """Test methods, default ports and bracketed IPv6 addresses."""
+        assert ProbeTarget.parse("8.8.8.8") == ProbeTarget("8.8.8.8", "icmp", None)
+        assert ProbeTarget.parse("2001:db8::1") == ProbeTarget("2001:db8::1", "icmp", None)
+        assert ProbeTarget.parse("tcp:1.1.1.1") == ProbeTarget("1.1.1.1", "tcp", 443)
+        assert ProbeTarget.parse("dns:9.9.9.9:5353") == ProbeTarget("9.9.9.9", "dns", 5353)
+        assert ProbeTarget.parse("tcp:[2001:db8::1]:80") == ProbeTarget("2001:db8::1", "tcp", 80)
+        assert str(ProbeTarget("2001:db8::1", "tcp", 80)) == "tcp:[2001:db8::1]:80"
+
+    def test_invalid(self):
+        """Test bad ports are rejected."""
+        with pytest.raises(ValueError):
+            ProbeTarget.parse("tcp:1.1.1.1:https")
+        with pytest.raises(ValueError):
+            ProbeTarget.parse("8.8.8.8:80")
+
+
+@pytest.fixture
+def dns_server():
+    """UDP server on localhost echoing the query ID of every request."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(0.1)
+    stop = threading.Event()
+
+    def serve():
+        while not stop.is_set():
+            try:
+                data, peer = sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            sock.sendto(data[:2] + b"\x81\x80" + data[4:], peer)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield sock.getsockname()[1]
+    stop.set()
+    thread.join()
+    sock.close()
+
+
+class TestProber:
+    """Test probing targets on localhost."""
+
+    def test_tcp_open_and_refused(self):
+        """Test a listening port and a refused port both count as reachable."""
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(4)
+        port = listener.getsockname()[1]
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        refused = closed.getsockname()[1]
+        try:
+            results = Prober(timeout=1.0, count=2, interval=0.01).probe(
+                [f"tcp:127.0.0.1:{port}", f"tcp:127.0.0.1:{refused}"]
+            )
+        finally:
+            listener.close()
+            closed.close()
+
+        for result in results:
+            assert result.method == "tcp"
+            assert (result.sent, result.received, result.loss) == (2, 2, 0.0)
+            assert len(result.rtts) == 2 and result.rtt_min >= 0
+
+    def test_dns(self, dns_server):
+        """Test a DNS probe is answered by a matching response."""
+        (result,) = Prober(timeout=1.0).probe([f"dns:127.0.0.1:{dns_server}"])
+
+        assert result.ok
+        assert result.rtt_avg is not None
+
+    def test_stream_unanswered_dns(self):
+        """Test streaming to a silent DNS server keeps only in-flight queries."""
+
+        class RecordingProber(Prober):
+            def _open(self, target, selector):
+                self.session = super()._open(target, selector)
+                return self.session
+
+        silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        silent.bind(("127.0.0.1", 0))
+        prober = RecordingProber(timeout=0.05, interval=0.01)
+        lost = []
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=prober.stream,
+            args=(
+                f"dns:127.0.0.1:{silent.getsockname()[1]}",
+                lambda seq, rtt: lost.append(seq),
+                stop,
+            ),
+        )
+        try:
+            thread.start()
+            time.sleep(0.5)
+        finally:
+            stop.set()
+            thread.join()
+            silent.close()
+
+        session = prober.session
+        assert len(lost) >= 10
+        assert len(session.queries) == len(session.query_ids) == len(session.pending) <= 10
+
+    def test_icmp_loopback(self):
+        """Test ICMP echo to localhost (when ICMP sockets are permitted)."""
+        (result,) = Prober(interface="lo", timeout=1.0, fallback=None).probe(["127.0.0.1"])
+        if not result.sent:
+            pytest.skip(f"ICMP sockets not available: {result.error}")
+
+        assert result.method == "icmp"
+        assert result.received == 1
+
+    def test_unknown_interface(self):
+        """Test binding to a missing interface fails the target without raising."""
+        (result,) = Prober(interface="rm530-none0", timeout=0.2).probe(["tcp:127.0.0.1:1"])
+
+        assert not result.ok
+        assert result.error
+
+    def test_dns_query(self):
+        """Test the query encodes the ID, flags and name."""
+        query = dns_query(0x1234, "example.com")
+
+        assert query[:4] == b"\x12\x34\x01\x00"
+        assert b"\x07example\x03com\x00" in query
@@ -0,0 +1,92 @@
+"""Unit tests for modem restart detection."""
+
+import os
+import shutil
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+from rm530_5g_integration.core.manager import RM530Manager
+from rm530_5g_integration.core.readiness import ReadinessResult, ReadinessWaiter
+from tests.unit.test_discovery import make_sysfs
+
+
+def make_modem_sysfs(root):
+    """Create a fake sysfs with a Quectel modem at bus path 1-1.3."""
+    make_sysfs(root, "1-1.3", "2c7c", "0800", {2: "ttyUSB2", 3: "ttyUSB3"}, "abc")
+    usb_devices = os.path.join(root, "bus", "usb", "devices")
+    os.makedirs(usb_devices)
+    os.symlink(os.path.join(root, "devices", "usb1", "1-1.3"), os.path.join(usb_devices, "1-1.3"))
+
+
+def unplug(root):
+    """Remove the fake modem from sysfs."""
+    os.unlink(os.path.join(root, "bus", "usb", "devices", "1-1.3"))
+    shutil.rmtree(os.path.join(root, "bus", "usb-serial"))
+    shutil.rmtree(os.path.join(root, "devices", "usb1", "1-1.3"))
+
+
+def replug(root):
+    """Bring the fake modem back with its network interface."""
+    os.rmdir(os.path.join(root, "bus", "usb", "devices"))
+    make_modem_sysfs(root)
+    os.makedirs(os.path.join(root, "class", "net", "usb0"))
+
+
+class TestReadinessWaiter:
+    """Test waiting for the modem to come back after a reset."""
+
+    def test_ready_after_reenumeration(self, tmp_path):
+        """Test the waiter returns once the modem is back, well before the deadline."""
+        root = str(tmp_path)
+        make_modem_sysfs(root)
+        checked = []
+        waiter = ReadinessWaiter(
+            port="/dev/ttyUSB2", sysfs_root=root, at_check=lambda p: checked.append(p) or True
+        )
+        with waiter:
+            threading.Timer(0.1, unplug, args=(root,)).start()
+            threading.Timer(1.2, replug, args=(root,)).start()
+            result = waiter.wait(timeout=10)
+
+        assert result.ready
+        assert result.reset_seen
+        assert result.port == "/dev/ttyUSB2"
+        assert result.elapsed < 5
+        assert checked and all(port == "/dev/ttyUSB2" for port in checked)
+
+    def test_deadline_reports_missing_steps(self, tmp_path):
+        """Test a modem that never brings up its interface times out."""
+        root = str(tmp_path)
+        make_modem_sysfs(root)
+        with ReadinessWaiter(
+            port="/dev/ttyUSB2", sysfs_root=root, at_check=lambda p: True
+        ) as waiter:
+            result = waiter.wait(timeout=0.6, reset_timeout=0.1)
+
+        assert not result.ready
+        assert not result.reset_seen
+        assert result.at_ready and not result.interface_up
+        assert "network interface" in str(result)
+
+    def test_result_str(self):
+        """Test a ready result describes the elapsed time."""
+        assert str(ReadinessResult(ready=True, elapsed=4.25)) == "ready after 4.2s"
+
+
+class TestSetupWaitsForRestart:
+    """Test RM530Manager.setup() acts on the restart outcome."""
+
+    @patch("rm530_5g_integration.core.manager.NMManager")
+    def test_setup_stops_when_modem_not_ready(self, mock_network_class):
+        """Test NetworkManager is left alone when the modem did not come back."""
+        manager = RM530Manager()
+        modem = Mock(reset_issued=True)
+        modem.switch_to_ecm_mode.return_value = True
+        waiter = MagicMock()
+        waiter.__enter__.return_value.wait.return_value = ReadinessResult(elapsed=60.0)
+
+        with patch.object(manager, "_open_modem", return_value=modem):
+            with patch.object(manager, "_readiness_waiter", return_value=waiter):
+                assert manager.setup(apn="internet") is False
+
+        mock_network_class.return_value.create_connection.assert_not_called()
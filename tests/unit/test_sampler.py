@@ -0,0 +1,97 @@
+"""Unit tests for the signal sampler."""
+
+import math
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.monitoring.sampler import NUMPY_AVAILABLE, SampleRing, SignalSampler
+from tests.unit.test_parsers import ENDC_LINES
+
+
+class TestSampleRing:
+    """Test the fixed-size sample ring."""
+
+    def test_wraps_and_keeps_newest(self):
+        """Test old samples are overwritten and windows stay chronological."""
+        ring = SampleRing(capacity=4, metrics=("rsrp",))
+        for i in range(6):
+            ring.append(float(i), {"rsrp": -100.0 + i})
+
+        assert len(ring) == 4
+        assert ring.values("timestamp") == [2.0, 3.0, 4.0, 5.0]
+        assert ring.values("rsrp", last=2) == [-96.0, -95.0]
+        assert [len(segment) for segment in ring.window("rsrp")] == [2, 2]
+
+    def test_missing_metrics_are_nan(self):
+        """Test unreported metrics are stored as NaN."""
+        ring = SampleRing(capacity=2, metrics=("rsrp", "sinr"))
+        ring.append(1.0, {"rsrp": -90, "sinr": None})
+
+        assert math.isnan(ring.values("sinr")[0])
+
+    def test_window_since(self):
+        """Test time-based windows across the wrap point."""
+        ring = SampleRing(capacity=5, metrics=("rsrp",))
+        for i in range(8):
+            ring.append(float(i), {"rsrp": float(i)})
+
+        segments = ring.window_since("rsrp", 5.0)
+        assert [value for segment in segments for value in segment] == [5.0, 6.0, 7.0]
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+    def test_numpy_views_share_memory(self):
+        """Test NumPy windows are views onto the ring."""
+        ring = SampleRing(capacity=3, metrics=("rsrp",))
+        ring.append(1.0, {"rsrp": -90.0})
+        (view,) = ring.as_numpy("rsrp")
+        ring._columns["rsrp"][0] = -80.0
+        assert view[0] == -80.0
+
+
+class TestSignalSampler:
+    """Test continuous sampling."""
+
+    def make_modem(self):
+        """Mock modem answering the signal batch in EN-DC."""
+        modem = Mock()
+        modem.execute_batch.return_value = [
+            ATResponse(command="AT+CSQ", lines=["+CSQ: 20,99"], final="OK"),
+            ATResponse(command="AT+QNWINFO", final="OK"),
+            ATResponse(command='AT+QENG="servingcell"', lines=list(ENDC_LINES), final="OK"),
+        ]
+        return modem
+
+    def test_sample_once(self):
+        """Test one sample records primary and NR metrics."""
+        sampler = SignalSampler(self.make_modem(), capacity=10)
+        seen = []
+        sampler.add_listener(lambda timestamp, values: seen.append(values))
+
+        assert sampler.sample_once()
+
+        assert sampler.ring.values("rsrp") == [-95.0]
+        assert sampler.ring.values("nr_rsrp") == [-80.0]
+        assert seen[0]["rssi"] == -73
+
+    def test_background_sampling(self):
+        """Test the sampling thread fills the ring at the requested rate."""
+        sampler = SignalSampler(self.make_modem(), rate_hz=50, capacity=100)
+        sampler.start()
+        time.sleep(0.3)
+        sampler.stop()
+
+        assert not sampler.is_running
+        assert 5 <= len(sampler.ring) <= 20
+
+    def test_failed_sample_is_counted(self):
+        """Test modem errors are counted and not recorded."""
+        modem = Mock()
+        modem.execute_batch.side_effect = OSError("gone")
+        sampler = SignalSampler(modem, capacity=10)
+
+        assert not sampler.sample_once()
+        assert sampler.errors == 1
+        assert len(sampler.ring) == 0
@@ -0,0 +1,89 @@
+"""Unit tests for the check scheduler."""
+
+import random
+
+import pytest
+
+from rm530_5g_integration.core.scheduler import CheckScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCheckScheduler:
+    """Test per-check intervals on a fixed grid."""
+
+    def test_independent_intervals(self):
+        """Test each check runs at its own interval, all starting at once."""
+        clock = FakeClock()
+        scheduler = CheckScheduler(clock=clock)
+        scheduler.add("link", interval=1)
+        scheduler.add("signal", interval=3)
+
+        runs = []
+        for _ in range(7):
+            runs.append(sorted(scheduler.pop_due()))
+            clock.now += 1
+
+        assert runs == [
+            ["link", "signal"],
+            ["link"],
+            ["link"],
+            ["link", "signal"],
+            ["link"],
+            ["link"],
+            ["link", "signal"],
+        ]
+
+    def test_no_drift(self):
+        """Test late polling does not move later deadlines."""
+        clock = FakeClock()
+        scheduler = CheckScheduler(clock=clock)
+        scheduler.add("link", interval=1)
+        scheduler.pop_due()
+
+        clock.now += 1.4  # The caller was busy for 0.4 s
+        assert scheduler.pop_due() == ["link"]
+        assert scheduler.next_deadline() == 102.0
+        assert scheduler.delay() == pytest.approx(0.6)
+
+    def test_missed_slots_are_skipped(self):
+        """Test a stalled caller gets one run, not a burst of missed ones."""
+        clock = FakeClock()
+        scheduler = CheckScheduler(clock=clock)
+        scheduler.add("link", interval=1)
+        scheduler.pop_due()
+
+        clock.now += 5.5
+        assert scheduler.pop_due() == ["link"]
+        assert scheduler.pop_due() == []
+        assert scheduler.next_deadline() == 106.0
+
+    def test_jitter_stays_on_grid(self):
+        """Test jitter delays runs within the fraction given without accumulating."""
+        clock = FakeClock()
+        scheduler = CheckScheduler(clock=clock, rng=random.Random(1))
+        scheduler.add("signal", interval=30, jitter=0.1)
+
+        for slot in range(1, 50):
+            clock.now = scheduler.next_deadline()
+            assert scheduler.pop_due() == ["signal"]
+            assert 100 + slot * 30 <= scheduler.next_deadline() < 100 + slot * 30 + 3
+
+    def test_rejects_bad_schedules(self):
+        """Test invalid intervals, jitter and duplicate names are refused."""
+        scheduler = CheckScheduler()
+        scheduler.add("link", interval=1)
+        with pytest.raises(ValueError):
+            scheduler.add("link", interval=1)
+        with pytest.raises(ValueError):
+            scheduler.add("ip", interval=0)
+        with pytest.raises(ValueError):
+            scheduler.add("ip", interval=1, jitter=1.5)
@@ -0,0 +1,53 @@
+"""Unit tests for signal quality monitoring."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from rm530_5g_integration.core.at import ATResponse
+from rm530_5g_integration.monitoring.signal import SignalQuality, get_signal_quality
+from tests.unit.test_parsers import ENDC_LINES
+
+
+def batch(*responses):
+    """Mock modem whose execute_batch returns the given line lists."""
+    modem = Mock()
+    modem.execute_batch.return_value = [
+        ATResponse(command="AT", lines=list(lines), final="OK") for lines in responses
+    ]
+    return modem
+
+
+class TestSignalQuality:
+    """Test the per-RAT signal quality record."""
+
+    def test_endc_keeps_both_legs(self):
+        """Test EN-DC fills lte and nr from their own QENG lines."""
+        modem = batch(
+            ["+CSQ: 20,99"], ['+QNWINFO: "FDD LTE","40445","LTE BAND 3",1275'], ENDC_LINES
+        )
+
+        quality = get_signal_quality(modem)
+
+        assert quality.rssi == -73
+        assert quality.rsrp == -95  # LTE anchor
+        assert quality.lte.pci == 301 and quality.lte.band == 3
+        assert quality.nr.pci == 510 and quality.nr.rsrp == -80
+        assert [cell.rat for cell in quality.cells] == ["LTE", "NR5G-NSA"]
+
+    def test_constructor_compatible(self):
+        """Test the original keyword fields still work and per-RAT cells default to None."""
+        quality = SignalQuality(rssi=-70, rsrp=-90, network_type="5G")
+
+        assert quality.rssi == -70
+        assert quality.lte is None and quality.nr is None
+        assert str(quality) == "Type: 5G, RSSI: -70 dBm, RSRP: -90 dBm"
+        assert quality == SignalQuality(-70, -90, None, None, "5G")
+
+    def test_slots_have_no_instance_dict(self):
+        """Test samples are slotted records."""
+        quality = SignalQuality()
+        assert not hasattr(quality, "__dict__")
+        with pytest.raises(AttributeError):
+            quality.unknown = 1  # type: ignore[attr-defined]
+        assert quality.to_dict()["nr"] is None
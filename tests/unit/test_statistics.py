@@ -0,0 +1,94 @@
+"""Unit tests for rolling signal statistics."""
+
+import math
+import random
+import statistics
+import threading
+
+import pytest
+
+from rm530_5g_integration.monitoring import statistics as stats_module
+from rm530_5g_integration.monitoring.statistics import RollingStats, SignalStatistics, summarize
+
+
+class TestRollingStats:
+    """Test incremental window statistics."""
+
+    def test_matches_batch_computation(self):
+        """Test windowed aggregates equal a recomputation over the last values."""
+        rng = random.Random(7)
+        values = [rng.gauss(-95, 4) for _ in range(500)]
+        stats = RollingStats(window=50)
+        for t, value in enumerate(values):
+            stats.add(value, float(t))
+
+        window = values[-50:]
+        assert stats.mean == pytest.approx(statistics.mean(window))
+        assert stats.variance == pytest.approx(statistics.variance(window))
+        assert stats.min == min(window)
+        assert stats.max == max(window)
+        assert stats.percentile(50) == pytest.approx(statistics.median(window))
+
+    def test_slope(self):
+        """Test the trend of a steadily degrading signal."""
+        stats = RollingStats(window=20)
+        for t in range(40):
+            stats.add(-80 - 0.5 * t, 1000.0 + t)
+
+        assert stats.slope == pytest.approx(-0.5)
+
+    def test_nan_and_ewma(self):
+        """Test missing values are skipped and the EWMA follows new values."""
+        stats = RollingStats(window=10, alpha=0.5)
+        stats.add(float("nan"))
+        stats.add(None)
+        stats.add(-100)
+        stats.add(-90)
+
+        assert len(stats) == 2
+        assert stats.ewma == -95
+        assert stats.summary().p95 == pytest.approx(-90.5)
+
+
+class TestSignalStatistics:
+    """Test per-metric statistics."""
+
+    def test_add_sample(self):
+        """Test samples are split across metrics."""
+        stats = SignalStatistics(window=3)
+        stats.add(1.0, {"rssi": -70, "rsrp": -95})
+        stats.add(2.0, {"rssi": -72})
+
+        assert stats.summary("rssi").count == 2
+        assert stats.summary("rsrp").count == 1
+        assert set(stats.summaries()) == {"rssi", "rsrp"}
+
+    def test_concurrent_reads(self):
+        """Test summaries read while a sampler thread adds stay consistent."""
+        stats = SignalStatistics(window=50)
+        done = threading.Event()
+
+        def sample():
+            for t in range(20000):
+                stats.add(float(t), {"rsrp": random.uniform(-120, -80)})
+            done.set()
+
+        thread = threading.Thread(target=sample)
+        thread.start()
+        while not done.is_set():
+            summary = stats.summary("rsrp")
+            if summary.count:
+                assert summary.min <= summary.p5 <= summary.p50 <= summary.p95 <= summary.max
+        thread.join()
+
+        assert stats.summary("rsrp").count == 50
+
+    def test_summarize_without_numpy(self, monkeypatch):
+        """Test the pure-Python path of summarize()."""
+        monkeypatch.setattr(stats_module, "NUMPY_AVAILABLE", False)
+        summary = summarize([-90.0, float("nan"), -94.0], [0.0, 1.0, 2.0])
+
+        assert summary.count == 2
+        assert summary.mean == -92
+        assert summary.slope == pytest.approx(-2.0)
+        assert math.isclose(summary.stddev, math.sqrt(8))
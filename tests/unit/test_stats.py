@@ -0,0 +1,204 @@
+"""Unit tests for connection statistics."""
+
+import os
+import socket
+from unittest.mock import patch
+
+from rm530_5g_integration.core.netlink import Address, InterfaceTable, Link
+from rm530_5g_integration.monitoring import stats as stats_module
+from rm530_5g_integration.monitoring.stats import (
+    BulkStatsCollector,
+    ConnectionStats,
+    RateTracker,
+    get_connection_stats,
+)
+
+
+def make_interface(root, name, operstate="up", counters=None):
+    """Create a fake /sys/class/net/<name> with statistics files."""
+    statistics = os.path.join(root, name, "statistics")
+    os.makedirs(statistics)
+    with open(os.path.join(root, name, "operstate"), "w") as f:
+        f.write(f"{operstate}\n")
+    for counter, value in (counters or {}).items():
+        with open(os.path.join(statistics, counter), "w") as f:
+            f.write(f"{value}\n")
+
+
+COUNTERS = {"rx_bytes": 123456, "tx_bytes": 7890, "rx_packets": 321, "tx_packets": 98}
+
+TABLE = InterfaceTable(
+    links={5: Link(index=5, name="usb0")},
+    addresses=[
+        Address(index=5, family=socket.AF_INET, address="192.168.225.20", prefixlen=24),
+        Address(index=5, family=socket.AF_INET6, address="2001:db8::20", prefixlen=64),
+    ],
+)
+
+
+class TestConnectionStats:
+    """Test reading interface statistics."""
+
+    def test_reads_sysfs_counters(self, tmp_path):
+        """Test counters and link state come from sysfs and addresses from netlink."""
+        make_interface(str(tmp_path), "usb0", counters=COUNTERS)
+        stats = stats_module._stats_from_sysfs("usb0", str(tmp_path), table=TABLE)
+
+        assert stats.bytes_received == 123456
+        assert stats.bytes_sent == 7890
+        assert stats.packets_received == 321
+        assert stats.packets_sent == 98
+        assert stats.operstate == "up"
+        assert stats.ip_address == "192.168.225.20"
+        assert stats.ipv6_address == "2001:db8::20"
+        assert stats.is_connected
+
+    def test_link_down_is_disconnected(self, tmp_path):
+        """Test a down link is reported disconnected without looking up an address."""
+        make_interface(str(tmp_path), "usb0", operstate="down", counters=COUNTERS)
+        with patch.object(stats_module, "dump_interfaces") as dump:
+            stats = stats_module._stats_from_sysfs("usb0", str(tmp_path))
+
+        assert not stats.is_connected
+        dump.assert_not_called()
+
+    def test_missing_interface(self, tmp_path):
+        """Test an interface absent from sysfs is disconnected with no counters."""
+        stats = stats_module._stats_from_sysfs("usb0", str(tmp_path))
+
+        assert not stats.is_connected
+        assert stats.bytes_received is None
+
+    def test_falls_back_to_ip_without_sysfs(self, tmp_path):
+        """Test `ip` is used only when sysfs is not mounted."""
+        missing = str(tmp_path / "missing")
+        with patch.object(stats_module, "SYSFS_NET", missing):
+            with patch.object(stats_module, "_stats_from_ip") as from_ip:
+                get_connection_stats("usb0")
+
+        from_ip.assert_called_once_with("usb0")
+
+
+def snapshot(rx_bytes, tx_bytes=0, ifindex=5, operstate="up"):
+    """Build counters as read from sysfs."""
+    return ConnectionStats(
+        interface="usb0",
+        bytes_received=rx_bytes,
+        bytes_sent=tx_bytes,
+        packets_received=rx_bytes // 1000,
+        packets_sent=tx_bytes // 1000,
+        operstate=operstate,
+        ifindex=ifindex,
+    )
+
+
+class TestRateTracker:
+    """Test throughput rates from counter snapshots."""
+
+    def test_rates_and_uptime(self):
+        """Test per-second rates over the snapshot interval and uptime since link up."""
+        tracker = RateTracker()
+        first = tracker.update(snapshot(1_000_000, 50_000), now=100.0)
+        stats = tracker.update(snapshot(3_000_000, 150_000), now=102.0)
+
+        assert first.rates is None
+        assert stats.rates.rx_bytes == 1_000_000
+        assert stats.rates.tx_bytes == 50_000
+        assert stats.rates.rx_packets == 1000
+        assert stats.rates.rx_mbps == 8.0
+        assert stats.uptime.total_seconds() == 2.0
+
+    def test_32bit_wrap(self):
+        """Test a 32-bit counter wrapping around is unwrapped."""
+        tracker = RateTracker()
+        tracker.update(snapshot(2**32 - 1000), now=0.0)
+        stats = tracker.update(snapshot(3000), now=1.0)
+
+        assert stats.rates.rx_bytes == 4000
+
+    def test_recreated_interface_is_reset(self):
+        """Test counters of a re-created interface count from zero."""
+        tracker = RateTracker()
+        tracker.update(snapshot(5_000_000, ifindex=5), now=0.0)
+        stats = tracker.update(snapshot(20_000, ifindex=9), now=1.0)
+
+        assert stats.rates.rx_bytes == 20_000
+        assert tracker.resets == 1
+
+    def test_smoothing_and_link_down(self):
+        """Test the EWMA follows the rates and uptime restarts after the link drops."""
+        tracker = RateTracker(alpha=0.5)
+        tracker.update(snapshot(0), now=0.0)
+        tracker.update(snapshot(1000), now=1.0)
+        tracker.update(snapshot(4000), now=2.0)
+
+        assert tracker.current.rx_bytes == 3000
+        assert tracker.smoothed.rx_bytes == 2000
+
+        tracker.update(snapshot(4000, operstate="down"), now=3.0)
+        stats = tracker.update(snapshot(4000), now=10.0)
+        assert stats.uptime.total_seconds() == 0.0
+
+
+PROC_NET_DEV = """\
+Inter-| Receive | Transmit
+ face |bytes packets errs drop fifo frame compressed multicast|bytes packets errs ...
+    lo: 500000 1000 0 0 0 0 0 0 500000 1000 0 0 0 0 0 0
+  usb0: 123456 321 0 0 0 0 0 0 7890 98 0 0 0 0 0 0
+ wwan0: 4000 10 0 0 0 0 0 0 2000 5 0 0 0 0 0 0
+"""
+
+BULK_TABLE = InterfaceTable(
+    links={
+        1: Link(index=1, name="lo", flags=0x8, rx_bytes=500000, tx_bytes=500000),
+        5: Link(index=5, name="usb0", operstate="up", rx_bytes=123456, tx_bytes=7890),
+        6: Link(index=6, name="eth0", operstate="up", rx_bytes=10, tx_bytes=20),
+    },
+    addresses=[
+        Address(index=1, family=socket.AF_INET, address="127.0.0.1", prefixlen=8),
+        Address(index=5, family=socket.AF_INET, address="192.168.225.20", prefixlen=24),
+        Address(index=5, family=socket.AF_INET6, address="2001:db8::20", prefixlen=64),
+    ],
+)
+
+
+class TestBulkStatsCollector:
+    """Test collecting statistics of many interfaces at once."""
+
+    def test_netlink_dump_with_filter(self):
+        """Test one dump fills matching interfaces and skips loopback by default."""
+        with patch.object(stats_module, "dump_interfaces", return_value=BULK_TABLE) as dump:
+            everything = dict(BulkStatsCollector(track_rates=False).collect())
+            usb = BulkStatsCollector(["usb*"], track_rates=False).collect()
+
+        assert dump.call_count == 2
+        assert sorted(everything) == ["eth0", "usb0"]
+        assert list(usb) == ["usb0"]
+        assert usb["usb0"].bytes_received == 123456
+        assert usb["usb0"].ip_address == "192.168.225.20"
+        assert usb["usb0"].ipv6_address == "2001:db8::20"
+        assert usb["usb0"].is_connected
+        assert not everything["eth0"].is_connected
+
+    def test_objects_are_reused(self):
+        """Test repeated collections update the same objects and compute rates."""
+        collector = BulkStatsCollector(["usb0"])
+        with patch.object(stats_module, "dump_interfaces", return_value=BULK_TABLE):
+            first = collector.collect()["usb0"]
+            second = collector.collect()["usb0"]
+
+        assert first is second
+        assert second.rates is not None
+
+    def test_proc_net_dev_fallback(self, tmp_path):
+        """Test counters come from /proc/net/dev when netlink is unavailable."""
+        path = tmp_path / "dev"
+        path.write_text(PROC_NET_DEV)
+        collector = BulkStatsCollector(proc_net_dev=str(path), track_rates=False)
+        with patch.object(stats_module, "dump_interfaces", side_effect=OSError("EPERM")):
+            result = collector.collect()
+
+        assert sorted(result) == ["usb0", "wwan0"]
+        assert result["usb0"].bytes_received == 123456
+        assert result["usb0"].packets_sent == 98
+        assert result["wwan0"].bytes_sent == 2000
@@ -0,0 +1,162 @@
+"""Unit tests for the time-series store."""
+
+import math
+import os
+
+import pytest
+
+from rm530_5g_integration.monitoring.rollup import tier_series
+from rm530_5g_integration.monitoring.stats import ConnectionStats, ThroughputRates
+from rm530_5g_integration.monitoring.store import (
+    INTERFACE_SERIES,
+    NUMPY_AVAILABLE,
+    SIGNAL_FIELDS,
+    SIGNAL_SERIES,
+    MetricStore,
+)
+
+
+class TestMetricStore:
+    """Test appending and querying series."""
+
+    def test_range_query(self, tmp_path):
+        """Test a time range spanning segments returns the matching values in order."""
+        with MetricStore(str(tmp_path), segment_records=4) as store:
+            append = store.listener(SIGNAL_SERIES)
+            for t in range(10):
+                append(1000.0 + t, {"rsrp": -90.0 - t, "rssi": None})
+
+            assert len(list((tmp_path / SIGNAL_SERIES).glob("*.seg"))) == 3
+            assert store.values(SIGNAL_SERIES, "rsrp", start=1002, end=1006) == [
+                -92.0,
+                -93.0,
+                -94.0,
+                -95.0,
+                -96.0,
+            ]
+            assert store.values(SIGNAL_SERIES, "timestamp", start=1008) == [1008.0, 1009.0]
+            assert math.isnan(store.values(SIGNAL_SERIES, "rssi", end=1000)[0])
+
+    def test_reopen_continues_series(self, tmp_path):
+        """Test records survive the process and appends continue the last segment."""
+        with MetricStore(str(tmp_path), segment_records=10) as store:
+            store.record_stats(
+                ConnectionStats("usb0", bytes_received=100, rates=ThroughputRates(rx_bytes=5.0)),
+                timestamp=1.0,
+            )
+
+        with MetricStore(str(tmp_path), segment_records=10) as store:
+            store.record_stats(ConnectionStats("usb0", bytes_received=200), timestamp=2.0)
+
+            assert store.values(INTERFACE_SERIES, "rx_bytes") == [100.0, 200.0]
+            assert store.values(INTERFACE_SERIES, "rx_rate")[0] == 5.0
+            assert len(os.listdir(tmp_path / INTERFACE_SERIES)) == 2  # schema + one segment
+
+    def test_rejects_out_of_order(self, tmp_path):
+        """Test a timestamp older than the last record is refused."""
+        with MetricStore(str(tmp_path)) as store:
+            store.create_series("test", ("value",))
+            store.append("test", 10.0, {"value": 1.0})
+
+            with pytest.raises(ValueError):
+                store.append("test", 5.0, {"value": 2.0})
+
+    def test_retention(self, tmp_path):
+        """Test whole segments older than the retention period are deleted."""
+        with MetricStore(str(tmp_path), retention=100, segment_records=5) as store:
+            store.create_series("test", ("value",))
+            for t in range(12):
+                store.append("test", float(t), {"value": float(t)})
+
+            # Filling the second segment expires nothing yet
+            assert len(store.values("test", "timestamp")) == 12
+
+            for t in range(12, 15):
+                store.append("test", float(t), {"value": float(t)})
+            store.append("test", 110.0, {"value": 0.0})
+
+            assert store.values("test", "timestamp")[0] == 10.0
+            assert store.compact(now=1000.0) == 1
+            assert store.values("test", "timestamp") == [110.0]
+
+    def test_sparse_series_rotates_by_span(self, tmp_path):
+        """Test a segment that never fills still ends after a quarter of the retention."""
+        with MetricStore(str(tmp_path), retention=100, segment_records=1000) as store:
+            store.create_series("test", ("value",))
+            for t in range(0, 200, 10):
+                store.append("test", float(t), {"value": float(t)})
+
+            # Three records per segment; starting the one at 180 expired those ending before 80
+            assert store.values("test", "timestamp")[0] == 60.0
+            assert len(list((tmp_path / "test").glob("*.seg"))) == 5
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+    def test_query_numpy(self, tmp_path):
+        """Test NumPy views cover the requested range."""
+        with MetricStore(str(tmp_path), segment_records=4) as store:
+            append = store.listener(SIGNAL_SERIES)
+            for t in range(6):
+                append(float(t), {"rsrp": float(t)})
+
+            arrays = store.query_numpy(SIGNAL_SERIES, start=2, end=5)
+            assert [a[:, 0].tolist() for a in arrays] == [[2.0, 3.0], [4.0, 5.0]]
+
+
+class TestRollups:
+    """Test rollup tiers and trend queries."""
+
+    def fill(self, store, seconds, start=0.0):
+        """Record one signal sample per second, rsrp rising by 1 each minute."""
+        append = store.listener(SIGNAL_SERIES)
+        for t in range(int(seconds)):
+            append(start + t, {"rsrp": -120.0 + t // 60})
+
+    def test_tiers_written_incrementally(self, tmp_path):
+        """Test closed buckets reach every tier with min/max/mean/count/last."""
+        with MetricStore(str(tmp_path)) as store:
+            self.fill(store, 2 * 3600 + 1)
+
+            minutes = store.values(tier_series(SIGNAL_SERIES, 60), "rsrp_count")
+            assert len(minutes) == 120 and set(minutes) == {60.0}
+            hours = store.trend(SIGNAL_SERIES, "rsrp", end=3599, resolution=3600)
+            assert len(hours) == 1
+            assert (hours[0].min, hours[0].max, hours[0].mean) == (-120.0, -61.0, -90.5)
+            assert hours[0].count == 3600 and hours[0].last == -61.0
+
+    def test_coarsest_tier_with_open_buckets(self, tmp_path):
+        """Test a query picks the coarsest fitting tier and fills in unwritten buckets."""
+        with MetricStore(str(tmp_path)) as store:
+            self.fill(store, 3600 + 1800)
+
+            hourly = store.trend(SIGNAL_SERIES, "rsrp", resolution=7200)
+            assert [p.timestamp for p in hourly] == [0, 3600]
+            assert hourly[1].count == 1800  # Current hour from 15 min and 1 min tiers + raw
+            assert len(store.trend(SIGNAL_SERIES, "rsrp", resolution=900)) == 6
+            assert len(store.trend(SIGNAL_SERIES, "rsrp", start=5000)) == 400  # Raw
+
+            summary = store.summary(SIGNAL_SERIES, "rsrp", start=0, end=5400)
+            assert summary.count == 5400
+            assert summary.min == -120.0 and summary.max == -31.0
+
+    def test_resume_after_restart(self, tmp_path):
+        """Test open buckets are rebuilt from stored records after reopening."""
+        with MetricStore(str(tmp_path)) as store:
+            self.fill(store, 1000)
+        with MetricStore(str(tmp_path)) as store:
+            self.fill(store, 3700, start=1000)
+
+            hours = store.trend(SIGNAL_SERIES, "rsrp", end=0, resolution=3600)
+            assert hours[0].count == 3600
+
+    def test_readonly_reader(self, tmp_path):
+        """Test a read-only store sees recorded series without writing."""
+        with MetricStore(str(tmp_path)) as store:
+            self.fill(store, 120)
+
+        reader = MetricStore(str(tmp_path), readonly=True)
+        assert reader.open_series("missing") is None
+        assert reader.open_series(SIGNAL_SERIES) == SIGNAL_FIELDS
+        assert reader.summary(SIGNAL_SERIES, "rsrp", start=0, end=120).count == 120
+        with pytest.raises(ValueError):
+            reader.append(SIGNAL_SERIES, 500.0, {})
+        reader.close()
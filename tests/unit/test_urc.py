@@ -0,0 +1,93 @@
+"""Unit tests for URC module."""
+
+import threading
+import time
+from unittest.mock import MagicMock, Mock, PropertyMock
+
+import pytest
+import serial
+
+from rm530_5g_integration.core.modem import Modem, read_response
+from rm530_5g_integration.core.urc import URC, URCDispatcher, command_prefixes, is_urc
+from rm530_5g_integration.utils.exceptions import SerialCommunicationError
+
+
+class TestClassification:
+    """Test URC classification."""
+
+    def test_command_prefixes_chained(self):
+        """Test prefixes are extracted from chained commands."""
+        assert command_prefixes('AT+CSQ;+QENG="servingcell"') == {"+CSQ", "+QENG"}
+
+    def test_registration_response_is_not_urc(self):
+        """Test a +CREG line answering AT+CREG? belongs to the response."""
+        assert not is_urc("+CREG: 0,1", "AT+CREG?")
+        assert is_urc("+CREG: 1", "AT+CSQ")
+
+    def test_idle_lines_are_urcs(self):
+        """Test any line received while idle is unsolicited."""
+        assert is_urc("RDY")
+        assert not is_urc("+CSQ: 20,99", "AT+CSQ")
+
+    def test_registration_state(self):
+        """Test registration state parsing."""
+        urc = URC(name="+CEREG", line='+CEREG: 2,"1A2B"', timestamp=0.0)
+        assert urc.registration_state == 2
+
+
+class TestURCDispatcher:
+    """Test URCDispatcher."""
+
+    def test_subscribe_filters_by_name(self):
+        """Test callbacks only receive subscribed names."""
+        dispatcher = URCDispatcher()
+        received = []
+        dispatcher.subscribe(received.append, ["RDY"])
+
+        dispatcher.dispatch_line("+CREG: 1")
+        dispatcher.dispatch_line("RDY")
+
+        assert [urc.line for urc in received] == ["RDY"]
+
+    def test_wait_for(self):
+        """Test wait_for returns the first matching URC."""
+        dispatcher = URCDispatcher()
+        timer = threading.Timer(0.05, dispatcher.dispatch_line, args=("RDY",))
+        timer.start()
+
+        urc = dispatcher.wait_for(["RDY"], timeout=2)
+
+        assert urc is not None and urc.name == "RDY"
+        assert dispatcher.wait_for(["RDY"], timeout=0.01) is None
+
+    def test_interleaved_urc_split_from_response(self):
+        """Test URCs arriving mid-response are routed to the callback."""
+        chunks = [b"\r\n+CEREG: 0\r\n+CSQ: 20,99\r\n", b"\r\nOK\r\n"]
+        port = Mock(timeout=1.0)
+        type(port).in_waiting = PropertyMock(side_effect=lambda: len(chunks[0]) if chunks else 0)
+        port.read = MagicMock(side_effect=lambda size=1: chunks.pop(0) if chunks else b"")
+        urcs = []
+
+        response = read_response(port, "AT+CSQ", time.monotonic() + 5, urcs.append)
+
+        assert response.lines == ["+CSQ: 20,99"]
+        assert urcs == ["+CEREG: 0"]
+
+
+class TestReader:
+    """Test the background AT reader."""
+
+    def test_port_error_stops_reader(self):
+        """Test commands fail fast instead of timing out once the reader died."""
+        modem = Modem(port="/dev/ttyUSB2")
+        modem.serial = Mock(is_open=True, in_waiting=0, timeout=1.0)
+        modem.serial.read.side_effect = serial.SerialException("device disconnected")
+        modem.start_reader()
+        modem._reader_thread.join(timeout=1)
+
+        start = time.monotonic()
+        with pytest.raises(SerialCommunicationError):
+            modem.execute("AT", timeout=5)
+
+        assert modem._reader_thread is None
+        assert time.monotonic() - start < 1